@@ -1,15 +1,17 @@
 # ruff: noqa: N812
 from pathlib import Path
-from typing import TYPE_CHECKING, get_args
+from typing import TYPE_CHECKING, Literal, get_args
 
 from boto3 import client as BotoClient
 
 from lantern.catalogues.base import CatalogueBase
-from lantern.checks import Checker
+from lantern.checks import CheckCache, Checker, CheckHistory
 from lantern.exporters.cloudfront import CloudFrontExporter
+from lantern.exporters.compression import COMPRESSION_RULES
 from lantern.exporters.rsync import RsyncExporter
 from lantern.exporters.s3 import S3Exporter
 from lantern.models.checks import Check, CheckType
+from lantern.models.manifest import SiteManifest
 from lantern.models.site import ExportMeta, SiteEnvironment
 from lantern.outputs.item_html import ItemCatalogueOutput
 from lantern.outputs.redirects import RedirectsOutput
@@ -30,6 +32,33 @@ if TYPE_CHECKING:
     from lantern.outputs.base import OutputBase
 
 
+def _manifest_path(config: Config, env: SiteEnvironment, site: Literal["trusted", "untrusted"]) -> Path:
+    """
+    Path to build manifest for a site within an environment.
+
+    Stored alongside the GitLab store cache, as a local working directory that persists between builds.
+    """
+    return config.STORE_GITLAB_CACHE_PATH / "_manifests" / f"{env}-{site}.json"
+
+
+def _checks_history_path(config: Config, env: SiteEnvironment) -> Path:
+    """
+    Path to checks history for an environment.
+
+    Stored alongside the GitLab store cache, as a local working directory that persists between runs.
+    """
+    return config.STORE_GITLAB_CACHE_PATH / "_checks" / f"{env}-history.json"
+
+
+def _checks_cache_path(config: Config, env: SiteEnvironment) -> Path:
+    """
+    Path to checks cache for an environment.
+
+    Stored alongside the GitLab store cache, as a local working directory that persists between runs.
+    """
+    return config.STORE_GITLAB_CACHE_PATH / "_checks" / f"{env}.json"
+
+
 class BasCatUntrusted(CatalogueBase):
     """
     BAS data catalogue untrusted site.
@@ -61,7 +90,15 @@ class BasCatUntrusted(CatalogueBase):
         if env == "live" and distribution is not None:
             cf_client = self._create_cf_client()
             self._invalidator = CloudFrontExporter(logger=logger, cloudfront=cf_client, distribution=distribution)
-        self._exporter = S3Exporter(logger=logger, s3=self._s3, bucket=bucket, parallel_jobs=config.PARALLEL_JOBS)
+        self._exporter = S3Exporter(
+            logger=logger,
+            s3=self._s3,
+            bucket=bucket,
+            parallel_jobs=config.PARALLEL_JOBS,
+            skip_unchanged=config.ENABLE_FEATURE_EXPORT_SKIP_UNCHANGED,
+            compression=COMPRESSION_RULES if config.ENABLE_FEATURE_EXPORT_COMPRESSION else None,
+        )
+        self._manifest_path = _manifest_path(config=config, env=env, site="untrusted")
 
     def _create_cf_client(self) -> CloudFrontClient:
         """Create CloudFront boto client."""
@@ -72,17 +109,36 @@ class BasCatUntrusted(CatalogueBase):
             region_name="us-east-1",
         )
 
+    @staticmethod
+    def _invalidation_keys(paths: list[Path]) -> list[str]:
+        """
+        CloudFront invalidation keys for exported content paths.
+
+        In CloudFront '/foo/index.html' and '/foo/' are separate keys.
+        """
+        keys = {f"/{path}" for path in paths}
+        keys.update([key.replace("index.html", "") for key in keys if key.endswith("/index.html")])
+        return sorted(keys)
+
     def export(
         self,
         identifiers: set[str] | None = None,
         branch: str | None = None,
         outputs: list[type[OutputBase]] | None = None,
+        full: bool = False,
     ) -> None:
         """
         Generate and export site content to hosting.
 
         Optionally for selected records from a branch and for selected Output types.
 
+        Content is built incrementally using a build manifest, so that only content for changed records is generated
+        and only changed content is uploaded and invalidated. Set `full` to ignore the manifest and rebuild all
+        selected content. Where enabled, content unchanged in the manifest is only uploaded in full rebuilds if it
+        differs from existing objects.
+
+        Content is streamed to the exporter as it is generated, so generating and uploading content overlap.
+
         Site requires direct access to underlying store for additional processing.
         """
         store = self._repo._make_gitlab_store(branch=branch, cached=True, frozen=True)
@@ -99,15 +155,21 @@ class BasCatUntrusted(CatalogueBase):
             site_extras["entra_secret_expiry"] = self._config.CHECKS_MAGIC_PRODUCTS_CLIENT_SECRET_EXP
             site_extras["entra_secret_id"] = self._config.CHECKS_MAGIC_PRODUCTS_CLIENT_SECRET_ID
 
+        manifest = SiteManifest(path=self._manifest_path, full=full)
         site = Site(logger=self._logger, meta=meta, store=store, extras=site_extras)
-        content = site.generate_content(**content_params)
+        paths = self._exporter.stream(
+            site.iter_content(**content_params, manifest=manifest), unchanged=manifest.unchanged_content
+        )
         if outputs is None or RedirectsOutput in outputs:
-            content.extend(RedirectsOutput(logger=self._logger, meta=meta, content=content).content)
-        self._exporter.export(content)
+            # redirects are taken from the manifest, which is complete once all other content has been exported
+            redirects = RedirectsOutput(logger=self._logger, meta=meta, content=manifest.redirects).content
+            self._exporter.export(redirects)
+            paths.extend(item.path for item in redirects)
+        manifest.dump()
 
-        if self._invalidator:
+        if self._invalidator and paths:
             # Where invalidation keys gets close to the AWS limit (150/s), invalidate the entire site instead
-            _keys = site.generate_invalidation_keys(**content_params)
+            _keys = self._invalidation_keys(paths)
             keys = _keys if 0 < len(_keys) <= 140 else ["/*"]  # noqa: PLR2004
             self._invalidator.invalidate(keys)
 
@@ -177,22 +239,33 @@ class BasCatTrusted(CatalogueBase):
         self._repo = repo
         self._env = env
 
-        self._exporter = RsyncExporter(logger=logger, host=host, path=path)
+        self._exporter = RsyncExporter(
+            logger=logger,
+            host=host,
+            path=path,
+            compression=COMPRESSION_RULES if config.ENABLE_FEATURE_EXPORT_COMPRESSION else None,
+        )
+        self._manifest_path = _manifest_path(config=config, env=env, site="trusted")
 
-    def export(self, identifiers: set[str] | None = None, branch: str | None = None) -> None:
+    def export(self, identifiers: set[str] | None = None, branch: str | None = None, full: bool = False) -> None:
         """
         Generate and export site content to hosting.
 
         Optionally for selected records from a branch. Output classes are fixed for the trusted site environment.
+
+        Content is built incrementally using a build manifest. Set `full` to ignore the manifest and rebuild all
+        selected content.
         """
         store = self._repo._make_gitlab_store(branch=branch, cached=True, frozen=True)
         meta = ExportMeta.from_config(config=self._config, env=self._env, build_ref=store.head_commit, trusted=True)
+        manifest = SiteManifest(path=self._manifest_path, full=full)
         site = Site(logger=self._logger, meta=meta, store=store)
 
-        content = site.generate_content(
-            global_outputs=[], individual_outputs=[ItemCatalogueOutput], identifiers=identifiers
+        content = site.iter_content(
+            global_outputs=[], individual_outputs=[ItemCatalogueOutput], identifiers=identifiers, manifest=manifest
         )
-        self._exporter.export(content)
+        self._exporter.stream(content)
+        manifest.dump()
 
     def checks(self, identifiers: set[str] | None = None, branch: str | None = None) -> list[Check]:
         """
@@ -269,34 +342,60 @@ class BasCatEnv(CatalogueBase):
             path=path,
             env=self._env,
         )
-        self._checker = Checker(logger=self._logger, config=self._config)
+        self._checker = Checker(
+            logger=self._logger,
+            config=self._config,
+            cache=CheckCache(path=_checks_cache_path(config=config, env=env)),
+        )
+        self._history_path = _checks_history_path(config=config, env=env)
 
     def export(
         self,
         identifiers: set[str] | None = None,
         branch: str | None = None,
         outputs: list[type[OutputBase]] | None = None,
+        full: bool = False,
     ) -> None:
-        """Generate and export site content to hosting."""
+        """Generate and export site content to hosting, optionally ignoring build manifests (full rebuild)."""
         self._logger.info("Exporting untrusted %s site", self._env)
-        self._untrusted.export(identifiers=identifiers, branch=branch, outputs=outputs)
+        self._untrusted.export(identifiers=identifiers, branch=branch, outputs=outputs, full=full)
         if outputs is None or ItemCatalogueOutput in outputs:
             self._logger.info("Exporting trusted %s site", self._env)
-            self._trusted.export(identifiers=identifiers, branch=branch)
+            self._trusted.export(identifiers=identifiers, branch=branch, full=full)
 
     def check(
         self,
         identifiers: set[str] | None = None,
         branch: str | None = None,
         outputs: list[type[OutputBase]] | None = None,
+        force: bool = False,
+        incremental: bool = False,
     ) -> None:
         """
         Check untrusted site contents (optionally for selected records).
 
         Checks need to be executed at this level to produce report content items from untrusted and trusted checks.
+
+        Recent results for external resources are reused from a cache unless `force` is set.
+
+        Where all records and outputs are checked, the checks report is recorded as history. If `incremental` is set,
+        only records changed since the last recorded report, or with checks that failed in it, (and global
+        outputs) are checked, with checks for other records reused from this report (marked as cached).
         """
         store = self._repo._make_gitlab_store(branch=branch, cached=True, frozen=True)
         meta = ExportMeta.from_config(config=self._config, env=self._env, build_ref=store.head_commit, trusted=False)
+        revisions = store.revisions(identifiers)
+        history = CheckHistory(path=self._history_path)
+        record_history = identifiers is None and outputs is None
+
+        previous: list[Check] = []
+        if incremental and record_history and history.revisions:
+            identifiers = history.changed(revisions)
+            previous = history.select(set(revisions) - identifiers)
+            self._logger.info("%s of %s records changed since last checks", len(identifiers), len(revisions))
+            if not identifiers:
+                # an empty selection would select all records, so limit to global outputs instead
+                outputs, _ = self._group_output_classes()
 
         self._logger.info("Generating checks for untrusted %s site", self._env)
         checks = self._untrusted.checks(identifiers=identifiers, branch=branch, outputs=outputs)
@@ -305,8 +404,10 @@ class BasCatEnv(CatalogueBase):
             checks.extend(self._trusted.checks(identifiers=identifiers, branch=branch))
 
         self._logger.info("Checking %s site", self._env)
-        content = self._checker.check(meta=meta, checks=checks)
+        content = self._checker.check(meta=meta, checks=checks, force=force, revisions=revisions, previous=previous)
         self._untrusted._exporter.export(content)
+        if record_history:
+            history.dump(content)
 
 
 class BasCatalogue:
@@ -353,13 +454,16 @@ class BasCatalogue:
         identifiers: set[str] | None = None,
         branch: str | None = None,
         outputs: list[type[OutputBase]] | None = None,
+        full: bool = False,
     ) -> None:
         """
         Export generated sites to relevant hosting.
 
         Output classes are fixed for the trusted site environment.
+
+        Sites are built incrementally unless `full` is set.
         """
-        self._envs[env].export(identifiers=identifiers, branch=branch, outputs=outputs)
+        self._envs[env].export(identifiers=identifiers, branch=branch, outputs=outputs, full=full)
 
     def check(
         self,
@@ -367,10 +471,18 @@ class BasCatalogue:
         identifiers: set[str] | None = None,
         branch: str | None = None,
         outputs: list[type[OutputBase]] | None = None,
+        force: bool = False,
+        incremental: bool = False,
     ) -> None:
         """
         Check catalogue site contents (optionally for selected records).
 
         Trusted site content is not validated due to Ops Data Store auth. See docs/monitoring.md for details.
+
+        Set `force` to check all external resources, rather than reusing recent results.
+
+        Set `incremental` to check only records changed since the last full or incremental check.
         """
-        self._envs[env].check(identifiers=identifiers, branch=branch, outputs=outputs)
+        self._envs[env].check(
+            identifiers=identifiers, branch=branch, outputs=outputs, force=force, incremental=incremental
+        )
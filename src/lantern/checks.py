@@ -1,9 +1,18 @@
 import base64
 import json
 import logging
+import threading
 import time
+from contextlib import contextmanager, nullcontext, suppress
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from email.utils import parsedate_to_datetime
 from http import HTTPMethod, HTTPStatus
-from typing import TYPE_CHECKING
+from http.cookiejar import DefaultCookiePolicy
+from itertools import zip_longest
+from pathlib import Path
+from typing import TYPE_CHECKING, TypedDict
+from urllib.parse import urlsplit
 
 import requests
 from joblib import Parallel, delayed
@@ -16,22 +25,463 @@ from lantern.models.checks import Check, CheckState, CheckType
 from lantern.outputs.checks import ChecksOutput
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from requests.auth import AuthBase
 
     from lantern.config import Config
     from lantern.models.site import ExportMeta, SiteContent
 
 
+CHECK_CACHE_TTLS: dict[CheckType, timedelta] = {
+    CheckType.DOI_REDIRECTS: timedelta(days=7),
+    CheckType.BAS_PUBLISHED_MAP: timedelta(days=7),
+    CheckType.DOWNLOADS_OPEN: timedelta(days=7),
+    CheckType.DOWNLOADS_NORA: timedelta(days=14),
+    CheckType.DOWNLOADS_SHAREPOINT_MAGIC_PRODUCTS: timedelta(days=7),
+    CheckType.DOWNLOADS_BAS_SAN: timedelta(days=7),
+    CheckType.DOWNLOADS_BAS_CDE: timedelta(days=7),
+    CheckType.DOWNLOADS_ARCGIS_LAYER: timedelta(days=3),
+    CheckType.DOWNLOADS_ARCGIS_SERVICE: timedelta(days=3),
+    CheckType.INFO_ARCGIS_WEBMAP: timedelta(days=3),
+}
+
+
+ARCGIS_ITEM_TYPES: tuple[CheckType, ...] = (CheckType.DOWNLOADS_ARCGIS_LAYER, CheckType.INFO_ARCGIS_WEBMAP)
+ARCGIS_SEARCH_URL = "https://www.arcgis.com/sharing/rest/search"
+ARCGIS_SEARCH_BATCH = 50
+
+GRAPH_BASE_URL = "https://graph.microsoft.com/v1.0"
+GRAPH_BATCH_SIZE = 20
+GRAPH_BATCH_JOBS = 4
+GRAPH_DRIVE_ITEM_SELECT = "id,name,size,file"
+
+RETRY_STATUSES: tuple[int, ...] = (HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.SERVICE_UNAVAILABLE)
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF = 1.0
+RETRY_MAX_DELAY = 60.0
+
+
+def retry_delay(status: int, retry_after: str | None, attempt: int) -> float | None:
+    """
+    Delay in seconds before retrying a throttled request, or None if not throttled.
+
+    Uses a `Retry-After` header value if set (as seconds or a date), otherwise an exponential backoff based on the
+    number of previous attempts. Delays are capped to `RETRY_MAX_DELAY`.
+    """
+    if status not in RETRY_STATUSES:
+        return None
+
+    delay = RETRY_BACKOFF * 2**attempt
+    if retry_after:
+        try:
+            delay = float(retry_after)
+        except ValueError:
+            with suppress(TypeError, ValueError):
+                delay = (parsedate_to_datetime(retry_after) - datetime.now(tz=UTC)).total_seconds()
+    return min(max(delay, 0.0), RETRY_MAX_DELAY)
+
+
+def graph_drive_item_path(url: str) -> str:
+    """
+    Microsoft Graph API path for the drive item of a SharePoint sharing URL.
+
+    See https://learn.microsoft.com/en-us/graph/api/shares-get#encoding-sharing-urls
+    """
+    share_url = "u!" + base64.urlsafe_b64encode(url.encode("utf-8")).decode("utf-8").rstrip("=")
+    return f"/shares/{share_url}/driveItem"
+
+
+def check_drive_item(check: Check, status: HTTPStatus, item: dict) -> None:
+    """Set check results from a Microsoft Graph drive item response."""
+    check.result_http_status = status
+
+    if check.result_http_status != check.http_status:
+        check.state = CheckState.FAILED
+        check.result_output = f"Bad status: {check.result_http_status} (expected {check.http_status})"
+        return
+
+    if "file" not in item:
+        check.state = CheckState.FAILED
+        check.result_output = "Bad drive item type: expected file"
+        return
+
+    if check.content_length is not None and item.get("size") != check.content_length:
+        check.state = CheckState.FAILED
+        check.result_output = f"Bad drive item size: {item.get('size')} (expected {check.content_length})"
+        return
+
+    check.state = CheckState.PASS
+    check.result_output = "OK"
+
+
+class CheckCacheEntry(TypedDict):
+    """Cache entry for a passed check."""
+
+    type: str
+    checked_at: str
+    result_http_status: int | None
+    result_output: str | None
+
+
+class CheckCache:
+    """
+    Check results cache.
+
+    Records passed checks for external resources (e.g. downloads) so they are not fetched again on each run, as these
+    resources rarely change and services may limit requests.
+
+    Entries are keyed on the properties that determine a check's result (see `Check.key`), so a changed expectation
+    (e.g. a new file size in a record) is always checked.
+
+    Entries are reused for a period set per check type (`ttls`). Check types without a TTL (e.g. site content, which
+    changes with each build) are never cached. Failed checks are never cached, and remove any previous entry.
+
+    Caches are loaded from and dumped to a JSON file. Removing this file will cause all checks to be run.
+    """
+
+    def __init__(self, path: Path, ttls: dict[CheckType, timedelta] | None = None) -> None:
+        self._path = path
+        self._ttls = CHECK_CACHE_TTLS if ttls is None else ttls
+        self.entries: dict[str, CheckCacheEntry] = {}
+
+        if self._path.exists():
+            with self._path.open() as f:
+                self.entries = json.load(f)
+
+    def __len__(self) -> int:
+        """Number of entries in cache."""
+        return len(self.entries)
+
+    @property
+    def path(self) -> Path:
+        """Path to cache file."""
+        return self._path
+
+    def _fresh(self, entry: CheckCacheEntry, now: datetime) -> bool:
+        """Whether a cache entry is within the TTL for its check type."""
+        ttl = self._ttls.get(CheckType(entry["type"]))
+        return ttl is not None and now - datetime.fromisoformat(entry["checked_at"]) < ttl
+
+    def apply(self, key: str, check: Check) -> bool:
+        """
+        Set results for a check from a fresh cache entry, if available.
+
+        Returns whether results were set.
+        """
+        entry = self.entries.get(key)
+        if check.state != CheckState.PENDING or entry is None or not self._fresh(entry, datetime.now(tz=UTC)):
+            return False
+
+        check.state = CheckState.PASS
+        check.duration = 0.0
+        check.result_http_status = (
+            HTTPStatus(entry["result_http_status"]) if entry["result_http_status"] is not None else None
+        )
+        check.result_output = entry["result_output"]
+        check.cached = True
+        return True
+
+    def update(self, key: str, check: Check) -> None:
+        """Add or remove cache entry for a check based on its results and type."""
+        if check.type not in self._ttls or check.state == CheckState.SKIPPED:
+            return
+        if check.state != CheckState.PASS:
+            self.entries.pop(key, None)
+            return
+        self.entries[key] = {
+            "type": check.type.value,
+            "checked_at": datetime.now(tz=UTC).isoformat(),
+            "result_http_status": check.result_http_status.value if check.result_http_status else None,
+            "result_output": check.result_output,
+        }
+
+    def dump(self) -> None:
+        """Remove expired entries and save cache to file."""
+        now = datetime.now(tz=UTC)
+        self.entries = {key: entry for key, entry in self.entries.items() if self._fresh(entry, now)}
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with self._path.open("w") as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
+
+
+class CheckHistory:
+    """
+    Checks history.
+
+    Records the last checks run for a site to allow for incremental checks, as the data file from a `ChecksOutput`:
+    - `revisions`: the file revision per record (file identifier) checked
+    - `checks`: resource checks (i.e. for records) from the last run
+
+    Where a record's revision is unchanged, and none of its checks from the last run failed, these checks can be reused
+    rather than run again. Reused checks are marked as cached.
+
+    History is loaded from and dumped to a JSON file. It should be dumped only after a full or incremental run for all
+    records. Removing this file will cause all records to be checked. An empty or invalid file is treated as no
+    history.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self.revisions: dict[str, str] = {}
+        self.checks: list[Check] = []
+
+        if self._path.exists():
+            self._load()
+
+    def _load(self) -> None:
+        """Load history from file, leaving history empty if the file cannot be read."""
+        try:
+            with self._path.open() as f:
+                data = json.load(f)
+            revisions = data.get("revisions", {})
+            checks = [Check.structure(check) for checks in data["resource_checks"].values() for check in checks]
+        except ValueError, KeyError, TypeError, AttributeError:
+            return
+        self.revisions = revisions
+        self.checks = checks
+
+    @property
+    def path(self) -> Path:
+        """Path to history file."""
+        return self._path
+
+    def changed(self, revisions: dict[str, str]) -> set[str]:
+        """
+        File identifiers of records that need checking compared to the last run.
+
+        I.e. records that are new, have a different revision, or had checks that failed (or did not complete) in the
+        last run. Skipped checks (e.g. for resources that cannot be checked) are not counted.
+        """
+        done = (CheckState.PASS, CheckState.SKIPPED)
+        unpassed = {check.file_identifier for check in self.checks if check.state not in done}
+        return {fid for fid, revision in revisions.items() if self.revisions.get(fid) != revision or fid in unpassed}
+
+    def select(self, file_identifiers: set[str]) -> list[Check]:
+        """Checks from the last run for selected records, marked as cached."""
+        return [replace(check, cached=True) for check in self.checks if check.file_identifier in file_identifiers]
+
+    def dump(self, content: list[SiteContent]) -> None:
+        """
+        Save checks data from `ChecksOutput` content to file.
+
+        The file is replaced atomically, so an interrupted dump does not leave a partial file.
+
+        Does nothing if content does not include a checks data file.
+        """
+        data = next((item for item in content if item.path == Path("-") / "checks" / "data.json"), None)
+        if data is None:
+            return
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._path.with_name(f"{self._path.name}.tmp")
+        tmp_path.write_bytes(data.content.encode("utf-8") if isinstance(data.content, str) else data.content)
+        tmp_path.replace(self._path)
+
+
+class CheckHostLimit:
+    """
+    Adaptive concurrency limit for requests to a host.
+
+    The limit starts at, and never exceeds, `max_limit` and is adjusted based on responses from the host:
+    - halved when the host throttles requests (see `backoff()`), pausing new requests until a given delay has passed
+    - reduced by one when a request is slow (takes longer than `slow` seconds, including time outs)
+    - increased by one after a number of fast requests equal to the current limit (other than during a backoff)
+
+    This allows slow or busy hosts to be given fewer concurrent requests, without limiting other hosts.
+    """
+
+    def __init__(self, max_limit: int, slow: float = 5.0) -> None:
+        self.max_limit = max_limit
+        self.limit = max_limit
+        self._slow = slow
+        self._active = 0
+        self._fast = 0
+        self._retry_at = 0.0
+        self._cond = threading.Condition()
+
+    def acquire(self) -> None:
+        """Wait for a request slot, and for any backoff to pass."""
+        with self._cond:
+            while self._active >= self.limit:
+                self._cond.wait()
+            self._active += 1
+            wait = self._retry_at - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+
+    def release(self, latency: float) -> None:
+        """Release a request slot, adjusting limit based on request latency."""
+        with self._cond:
+            self._active -= 1
+            if latency > self._slow:
+                self.limit = max(1, self.limit - 1)
+                self._fast = 0
+            elif self.limit < self.max_limit and time.monotonic() >= self._retry_at:
+                self._fast += 1
+                if self._fast >= self.limit:
+                    self.limit += 1
+                    self._fast = 0
+            self._cond.notify_all()
+
+    def backoff(self, delay: float) -> None:
+        """Halve limit and pause new requests for a delay (in seconds) after the host throttles requests."""
+        with self._cond:
+            self.limit = max(1, self.limit // 2)
+            self._fast = 0
+            self._retry_at = max(self._retry_at, time.monotonic() + delay)
+
+
+class CheckHttpPool:
+    """
+    Shared HTTP resources for running checks in threads.
+
+    Provides:
+    - a `requests.Session` per thread, to reuse connections (HTTP keep-alive) across checks for the same host
+    - an adaptive limit on concurrent requests per host (see `CheckHostLimit`), to avoid overloading services
+    - a limit on the overall request rate (requests per second), if set
+
+    Sessions are per thread as `requests.Session` instances are not guaranteed to be thread safe. Sessions do not
+    accept cookies, so that checks are independent of which thread (and so which session) previously ran other checks.
+
+    Call `close()` once checks have finished to close any open connections.
+    """
+
+    def __init__(self, per_host: int, rate: float | None = None, slow: float = 5.0) -> None:
+        self._per_host = per_host
+        self._slow = slow
+        self._interval = 1 / rate if rate else 0.0
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._sessions: list[requests.Session] = []
+        self._hosts: dict[str, CheckHostLimit] = {}
+        self._next_request = 0.0
+
+    def session(self) -> requests.Session:
+        """HTTP session for the current thread."""
+        if not hasattr(self._local, "session"):
+            self._local.session = requests.Session()
+            self._local.session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            with self._lock:
+                self._sessions.append(self._local.session)
+        return self._local.session
+
+    def host_limit(self, url: str) -> CheckHostLimit:
+        """Concurrency limit for the host of a URL."""
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            if host not in self._hosts:
+                self._hosts[host] = CheckHostLimit(max_limit=self._per_host, slow=self._slow)
+            return self._hosts[host]
+
+    def _wait_rate(self) -> None:
+        """Wait until the next request is allowed by the overall rate limit."""
+        if not self._interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            wait = max(0.0, self._next_request - now)
+            self._next_request = max(now, self._next_request) + self._interval
+        if wait:
+            time.sleep(wait)
+
+    @contextmanager
+    def limit(self, url: str) -> Iterator[CheckHostLimit]:
+        """Hold a request slot for the host of a URL, subject to the overall rate limit."""
+        host = self.host_limit(url)
+        host.acquire()
+        self._wait_rate()
+        start = time.monotonic()
+        try:
+            yield host
+        finally:
+            host.release(latency=time.monotonic() - start)
+
+    def close(self) -> None:
+        """Close sessions for all threads."""
+        with self._lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions.clear()
+
+
+def request_with_retry(
+    logger: logging.Logger,
+    session: requests.Session,
+    method: HTTPMethod,
+    url: str,
+    pool: CheckHttpPool | None = None,
+    headers: dict | None = None,
+    params: dict | None = None,
+    allow_redirects: bool = False,
+    auth: AuthBase | None = None,
+    timeout: int = 10,
+) -> Response:
+    """
+    Make a request, retrying throttled requests.
+
+    Throttled requests (see `RETRY_STATUSES`) are retried after a delay (see `retry_delay()`), up to `RETRY_ATTEMPTS`
+    times, after which the last response is returned. If using a shared HTTP pool, requests are subject to its limits
+    and further requests to the same host are paused for this delay and its concurrency limit reduced.
+    """
+    for attempt in range(RETRY_ATTEMPTS + 1):
+        with pool.limit(url) if pool else nullcontext() as host:
+            r = session.request(
+                method=method.value,
+                url=url,
+                headers=headers,
+                params=params,
+                allow_redirects=allow_redirects,
+                timeout=timeout,
+                auth=auth,
+            )
+            delay = retry_delay(status=r.status_code, retry_after=r.headers.get("retry-after"), attempt=attempt)
+            if delay is not None and host is not None:
+                host.backoff(delay)
+        if delay is None or attempt == RETRY_ATTEMPTS:
+            break
+        logger.info("Request throttled, retrying in %s seconds: %s", round(delay, 1), url)
+        if host is None:
+            time.sleep(delay)
+    return r
+
+
 class CheckRunner:
     """
     Check Runner.
 
     Logic to execute and update a check.
+
+    Optionally, a shared HTTP pool can be used to reuse connections and limit requests when running checks in threads.
+    Otherwise, a new session is used for each request.
     """
 
-    def __init__(self, logger: logging.Logger, check: Check) -> None:
+    def __init__(self, logger: logging.Logger, check: Check, pool: CheckHttpPool | None = None) -> None:
         self._logger = logger
         self._check = check
+        self._pool = pool
+
+    def _request(
+        self,
+        session: requests.Session,
+        method: HTTPMethod,
+        url: str,
+        headers: dict,
+        params: dict | None,
+        allow_redirects: bool,
+        auth: AuthBase | None,
+    ) -> Response:
+        """Make a request using the runner's HTTP pool (if any), retrying throttled requests (see `request_with_retry()`)."""
+        return request_with_retry(
+            logger=self._logger,
+            session=session,
+            method=method,
+            url=url,
+            pool=self._pool,
+            headers=headers,
+            params=params,
+            allow_redirects=allow_redirects,
+            auth=auth,
+        )
 
     def _fetch_url(
         self,
@@ -48,22 +498,22 @@ class CheckRunner:
 
         `redirects` is the maximum number of redirects allowed (where 0 is none).
 
-        Otherise, handles time out errors only.
+        Throttled requests are retried (see `_request()`). Otherwise, handles time out errors only.
         """
-        s = requests.Session()
+        s = self._pool.session() if self._pool else requests.Session()
         s.max_redirects = redirects if redirects > 0 else 1  # for requests that should redirect but not be followed
 
         if headers is None:
             headers = {}
 
         try:
-            r = s.request(
-                method=method.value,
+            r = self._request(
+                session=s,
+                method=method,
                 url=url,
                 headers=headers,
                 params=params,
                 allow_redirects=redirects > 0,
-                timeout=10,
                 auth=auth,
             )
             if raise_errors:
@@ -79,7 +529,8 @@ class CheckRunner:
             self._check.result_http_status = HTTPStatus(r.status_code)
             return r
         finally:
-            s.close()
+            if self._pool is None:
+                s.close()
 
     def _check_url(self) -> None:
         """
@@ -171,8 +622,7 @@ class CheckRunner:
 
         API lookup used over loading item page directly for speed and robustness. Limited to public items.
         """
-        item_id = self._check.url.split("id=")[-1]
-        item_url = f"https://www.arcgis.com/sharing/rest/content/items/{item_id}?f=json"
+        item_url = f"https://www.arcgis.com/sharing/rest/content/items/{arcgis_item_id(self._check.url)}?f=json"
         self._logger.info("Checking ArcGIS item page: %s", self._check.url)
         self._logger.info("Fetching from ArcGIS sharing API: %s", item_url)
         self._check_arcgis_url(item_url)
@@ -203,43 +653,20 @@ class CheckRunner:
         """
         self._logger.info("Fetching: %s", self._check.url)
 
-        share_url = "u!" + base64.urlsafe_b64encode(self._check.url.encode("utf-8")).decode("utf-8").rstrip("=")
-        graph_url = f"https://graph.microsoft.com/v1.0/shares/{share_url}/driveItem"
+        graph_url = f"{GRAPH_BASE_URL}{graph_drive_item_path(self._check.url)}"
         self._logger.info("Resolved to: %s", graph_url)
 
         r = self._fetch_url(
             method=HTTPMethod.GET,
             url=graph_url,
-            params={"$select": "id,name,size,file"},
+            params={"$select": GRAPH_DRIVE_ITEM_SELECT},
             auth=self._check.http_auth,
             redirects=0,
             raise_errors=False,
         )
         if r is None:
             return
-        result = r.json()
-
-        if self._check.result_http_status != self._check.http_status:
-            self._check.state = CheckState.FAILED
-            self._check.result_output = (
-                f"Bad status: {self._check.result_http_status} (expected {self._check.http_status})"
-            )
-            return
-
-        if "file" not in result:
-            self._check.state = CheckState.FAILED
-            self._check.result_output = "Bad drive item type: expected file"
-            return
-
-        if self._check.content_length is not None and result.get("size") != self._check.content_length:
-            self._check.state = CheckState.FAILED
-            self._check.result_output = (
-                f"Bad drive item size: {result.get('size')} (expected {self._check.content_length})"
-            )
-            return
-
-        self._check.state = CheckState.PASS
-        self._check.result_output = "OK"
+        check_drive_item(self._check, status=HTTPStatus(r.status_code), item=r.json())
 
     def run(self) -> None:
         """Run check unless skipped."""
@@ -247,7 +674,7 @@ class CheckRunner:
             return
 
         start = time.monotonic()
-        if self._check.type in (CheckType.DOWNLOADS_ARCGIS_LAYER, CheckType.INFO_ARCGIS_WEBMAP):
+        if self._check.type in ARCGIS_ITEM_TYPES:
             self._check_arcgis_item()
         elif self._check.type == CheckType.DOWNLOADS_ARCGIS_SERVICE:
             self._check_arcgis_service()
@@ -258,6 +685,143 @@ class CheckRunner:
         self._check.duration = time.monotonic() - start
 
 
+def arcgis_item_id(url: str) -> str:
+    """ArcGIS item ID from an item page URL (e.g. 'https://www.arcgis.com/home/item.html?id=x')."""
+    return url.rsplit("id=", 1)[-1]
+
+
+def run_arcgis_item_checks(
+    logger: logging.Logger,
+    checks: list[Check],
+    pool: CheckHttpPool | None = None,
+    batch_size: int = ARCGIS_SEARCH_BATCH,
+) -> None:
+    """
+    Run ArcGIS item checks in batches using the ArcGIS sharing search API.
+
+    Item IDs are searched for together (e.g. `id:a OR id:b`), with checks for items in search results passed. Limited
+    to public items as per `CheckRunner._check_arcgis_item()`.
+
+    Searches use a shared HTTP pool if given, so they are subject to the same per-host and rate limits as other checks.
+    Throttled searches are retried (see `request_with_retry()`).
+
+    Checks are updated in place. Checks for items not in search results (which may not be indexed yet), or in a batch
+    where the search fails, are left pending to be checked individually.
+    """
+    s = pool.session() if pool else requests.Session()
+    try:
+        for offset in range(0, len(checks), batch_size):
+            batch = checks[offset : offset + batch_size]
+            item_ids = sorted({arcgis_item_id(check.url).lower() for check in batch})
+            query = " OR ".join(f"id:{item_id}" for item_id in item_ids)
+            logger.info("Searching for %s ArcGIS items", len(item_ids))
+
+            start = time.monotonic()
+            try:
+                r = request_with_retry(
+                    logger=logger,
+                    session=s,
+                    method=HTTPMethod.GET,
+                    url=ARCGIS_SEARCH_URL,
+                    pool=pool,
+                    params={"q": query, "num": len(item_ids), "f": "json"},
+                    allow_redirects=True,
+                    timeout=30,
+                )
+                r.raise_for_status()
+                data = r.json()
+            except requests.RequestException:
+                logger.warning("ArcGIS item search failed, items will be checked individually.", exc_info=True)
+                continue
+            if "error" in data:
+                logger.warning("ArcGIS item search failed, items will be checked individually: %s", data["error"])
+                continue
+
+            found = {item["id"].lower() for item in data.get("results", [])}
+            duration = (time.monotonic() - start) / len(batch)
+            for check in batch:
+                if arcgis_item_id(check.url).lower() not in found:
+                    continue
+                check.http_method = HTTPMethod.GET
+                check.result_http_status = HTTPStatus(r.status_code)
+                check.state = CheckState.PASS
+                check.result_output = "OK"
+                check.duration = duration
+    finally:
+        if pool is None:
+            s.close()
+
+
+def _run_graph_batch(logger: logging.Logger, checks: list[Check]) -> None:
+    """
+    Run a batch of MAGIC Products Distribution Service checks as a Microsoft Graph JSON batch request.
+
+    Throttled checks within the batch, checks with invalid responses (e.g. missing an ID or an unknown status), and all
+    checks if the batch request fails, are left pending.
+
+    Standalone function for use in threaded parallel processing.
+    """
+    batch_requests = [
+        {
+            "id": str(i),
+            "method": "GET",
+            "url": f"{graph_drive_item_path(check.url)}?$select={GRAPH_DRIVE_ITEM_SELECT}",
+        }
+        for i, check in enumerate(checks)
+    ]
+    start = time.monotonic()
+    try:
+        with requests.Session() as s:
+            r = s.post(
+                f"{GRAPH_BASE_URL}/$batch", json={"requests": batch_requests}, auth=checks[0].http_auth, timeout=30
+            )
+        r.raise_for_status()
+        responses = r.json()["responses"]
+    except requests.RequestException, KeyError:
+        logger.warning("Graph batch request failed, items will be checked individually.", exc_info=True)
+        return
+
+    throttled = 0
+    duration = (time.monotonic() - start) / len(checks)
+    for response in responses:
+        try:
+            check = checks[int(response["id"])]
+            status = HTTPStatus(response["status"])
+        except KeyError, ValueError, IndexError, TypeError:
+            logger.warning("Invalid Graph batch response %s, item will be checked individually.", response)
+            continue
+        if status in RETRY_STATUSES:
+            throttled += 1
+            continue
+        check.http_method = HTTPMethod.GET
+        check.duration += duration
+        check_drive_item(check, status=status, item=response.get("body") or {})
+    if throttled:
+        logger.info("%s Graph requests throttled, items will be checked individually.", throttled)
+
+
+def run_magic_product_checks(
+    logger: logging.Logger,
+    checks: list[Check],
+    batch_size: int = GRAPH_BATCH_SIZE,
+    parallel_jobs: int = GRAPH_BATCH_JOBS,
+) -> None:
+    """
+    Run MAGIC Products Distribution Service checks in batches using Microsoft Graph JSON batching.
+
+    Drive items are requested as per `CheckRunner._check_magic_product()`, with up to 20 requests per batch (the Graph
+    API limit). All checks must use the same access token (as set by `Checker._prepare_auth()`).
+
+    Batches are requested concurrently in threads, up to `parallel_jobs` at a time.
+
+    Checks are updated in place. Throttled checks, or checks in a batch where the request fails, are left pending to be
+    checked individually (where throttled requests are retried with a backoff delay, see `request_with_retry()`).
+    """
+    batches = [checks[offset : offset + batch_size] for offset in range(0, len(checks), batch_size)]
+    logger.info("Fetching %s drive items from Microsoft Graph in %s batches", len(checks), len(batches))
+    Parallel(n_jobs=parallel_jobs, backend="threading")(delayed(_run_graph_batch)(logger, batch) for batch in batches)
+
+
 def run_check(logging_level: int, check: Check) -> Check:
     """
     Run a check job.
@@ -271,19 +835,52 @@ def run_check(logging_level: int, check: Check) -> Check:
     return check
 
 
+def run_check_threaded(logger: logging.Logger, pool: CheckHttpPool, check: Check) -> Check:
+    """
+    Run a check job using a shared HTTP pool.
+
+    Standalone function for use in threaded parallel processing (where logging is already initialised).
+    """
+    runner = CheckRunner(logger, check, pool=pool)
+    runner.run()
+    return check
+
+
 class Checker:
     """
     Checks runner.
 
     Executes a set of checks for site/resource content in parallel.
 
+    Checks can be run using an engine based on:
+    - `processes`: a process per parallel job, each making requests with a new HTTP session per request
+    - `threads`: a larger pool of threads (as checks are bound by network latency rather than CPU), sharing HTTP
+      connections per host, with adaptive limits on concurrent requests per host and the overall request rate
+
+    With either engine, throttled requests are retried with a backoff delay (see `request_with_retry()`).
+
+    Optionally, a cache can be used to reuse results for external resources checked recently (see `CheckCache`).
+
     Flexible class intended to be used in a higher level and opinionated Catalogue class.
     """
 
-    def __init__(self, logger: logging.Logger, config: Config) -> None:
+    def __init__(
+        self,
+        logger: logging.Logger,
+        config: Config,
+        thread_workers: int = 16,
+        thread_per_host: int = 4,
+        thread_rate: float | None = 20,
+        cache: CheckCache | None = None,
+    ) -> None:
         self._logger = logger
         self._config = config
+        self._cache = cache
         self._parallel_jobs = self._config.PARALLEL_JOBS
+        self._engine = self._config.CHECKS_ENGINE
+        self._thread_workers = thread_workers
+        self._thread_per_host = thread_per_host
+        self._thread_rate = thread_rate
 
     def _get_auth_entra(self) -> str:
         """
@@ -328,20 +925,148 @@ class Checker:
         """Post process checks prior to execution."""
         self._prepare_auth(checks)
 
-    def execute(self, checks: list[Check]) -> list[Check]:
+    @staticmethod
+    def _request_host(check: Check) -> str:
+        """Host a check will make requests to, which may differ from the check URL for some check types."""
+        if check.type in ARCGIS_ITEM_TYPES:
+            return "www.arcgis.com"
+        if check.type == CheckType.DOWNLOADS_SHAREPOINT_MAGIC_PRODUCTS:
+            return "graph.microsoft.com"
+        return urlsplit(check.url).netloc.lower()
+
+    def _interleave_hosts(self, checks: list[Check]) -> list[int]:
         """
-        Run checks in parallel.
+        Order checks to alternate between hosts.
+
+        So workers are spread across hosts, rather than waiting on the concurrency limit for a host with many checks.
 
-        Returns executed, prepared, checks.
+        Returns indexes of checks in new order.
         """
-        self._prepare_checks(checks)
+        hosts: dict[str, list[int]] = {}
+        for i, check in enumerate(checks):
+            hosts.setdefault(self._request_host(check), []).append(i)
+        return [i for batch in zip_longest(*hosts.values()) for i in batch if i is not None]
+
+    def _execute_threads(self, checks: list[Check], pool: CheckHttpPool) -> list[Check]:
+        """
+        Run checks in parallel using threads and a shared HTTP pool.
+
+        Checks are run alternating between hosts (see `_interleave_hosts()`) and returned in the same order as given.
+        """
+        order = self._interleave_hosts(checks)
+        results = Parallel(n_jobs=self._thread_workers, backend="threading")(
+            delayed(run_check_threaded)(self._logger, pool, checks[i]) for i in order
+        )
+
+        ordered = list(checks)
+        for i, result in zip(order, results, strict=True):
+            ordered[i] = result
+        return ordered
+
+    def _execute_engine(self, checks: list[Check], pool: CheckHttpPool | None = None) -> list[Check]:
+        """Run checks in parallel using the configured engine, where a shared HTTP pool is given for threads."""
+        if pool is not None:
+            return self._execute_threads(checks, pool=pool)
         return Parallel(n_jobs=self._parallel_jobs)(delayed(run_check)(self._logger.level, check) for check in checks)
 
-    def check(self, meta: ExportMeta, checks: list[Check]) -> list[SiteContent]:
+    def _execute(self, checks: list[Check]) -> list[Check]:
+        """
+        Run checks, checking ArcGIS items and MAGIC Products Distribution Service files in batches before other checks.
+
+        See `run_arcgis_item_checks()` and `run_magic_product_checks()` for details.
+
+        With the threads engine, a shared HTTP pool is used for ArcGIS item searches and other checks, so that they
+        share connections and limits.
+
+        Results are returned in the same order as checks.
+        """
+        pending = [i for i, check in enumerate(checks) if check.state == CheckState.PENDING]
+        items = [i for i in pending if checks[i].type in ARCGIS_ITEM_TYPES]
+        products = [i for i in pending if checks[i].type == CheckType.DOWNLOADS_SHAREPOINT_MAGIC_PRODUCTS]
+        pool = None
+        if self._engine == "threads":
+            pool = CheckHttpPool(per_host=self._thread_per_host, rate=self._thread_rate)
+        try:
+            if items:
+                run_arcgis_item_checks(self._logger, [checks[i] for i in items], pool=pool)
+            if products:
+                run_magic_product_checks(self._logger, [checks[i] for i in products])
+            resolved = {i for i in items + products if checks[i].state != CheckState.PENDING}
+            remaining = [i for i in range(len(checks)) if i not in resolved]
+            engine_results = self._execute_engine([checks[i] for i in remaining], pool=pool)
+        finally:
+            if pool is not None:
+                pool.close()
+
+        results = list(checks)
+        for i, result in zip(remaining, engine_results, strict=True):
+            results[i] = result
+        return results
+
+    def _group_checks(self, checks: list[Check], keys: list[str], force: bool) -> dict[str, list[int]]:
+        """
+        Group checks to run by key, skipping checks with results in cache (unless forced).
+
+        Returns indexes of checks grouped by check key.
+        """
+        groups: dict[str, list[int]] = {}
+        for i, check in enumerate(checks):
+            if self._cache is not None and not force and self._cache.apply(keys[i], check):
+                continue
+            groups.setdefault(keys[i], []).append(i)
+        return groups
+
+    def execute(self, checks: list[Check], force: bool = False) -> list[Check]:
+        """
+        Run checks in parallel using the configured engine.
+
+        Checks with the same key (see `Check.key`) are run once, with results copied to each duplicate check (with no
+        duration) to keep the file identifier each relates to. E.g. for a service or file used in many Records.
+
+        If a cache is set, recent results are reused for external resources unless `force` is set.
+
+        Returns executed, prepared, checks in the same order as given.
+        """
+        self._prepare_checks(checks)
+        keys = [check.key for check in checks]
+        groups = self._group_checks(checks, keys=keys, force=force)
+        self._logger.info(
+            "Running %s unique checks for %s checks (%s cached)",
+            len(groups),
+            len(checks),
+            len(checks) - sum(len(indexes) for indexes in groups.values()),
+        )
+
+        results = list(checks)
+        unique = [checks[indexes[0]] for indexes in groups.values()]
+        for (key, indexes), result in zip(groups.items(), self._execute(unique), strict=True):
+            results[indexes[0]] = result
+            for i in indexes[1:]:
+                results[i] = replace(result, file_identifier=checks[i].file_identifier, duration=0.0)
+            if self._cache is not None:
+                self._cache.update(key, result)
+        if self._cache is not None:
+            self._cache.dump()
+        return results
+
+    def check(
+        self,
+        meta: ExportMeta,
+        checks: list[Check],
+        force: bool = False,
+        revisions: dict[str, str] | None = None,
+        previous: list[Check] | None = None,
+    ) -> list[SiteContent]:
         """
         Run checks.
 
+        Optionally, `revisions` of records checked are included in outputs, and `previous` checks (e.g. from a
+        `CheckHistory`) are included in outputs without being run again, unless the same check has been run.
+
         Returns report outputs for export. Use `execute()` to return raw checks.
         """
-        results = self.execute(checks)
-        return ChecksOutput(logger=self._logger, meta=meta, checks=results).content
+        results = self.execute(checks, force=force)
+        if previous:
+            ran = {(check.key, check.file_identifier) for check in results}
+            results.extend(check for check in previous if (check.key, check.file_identifier) not in ran)
+        return ChecksOutput(logger=self._logger, meta=meta, checks=results, revisions=revisions).content
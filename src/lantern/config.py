@@ -73,6 +73,7 @@ class Config:  # noqa: PLW1641
         STORE_GITLAB_PROJECT_ID: str
         STORE_GITLAB_DEFAULT_BRANCH: str
         STORE_GITLAB_CACHE_PATH: str
+        ENABLE_FEATURE_GITLAB_CACHE_ARCHIVE: bool
         STORE_ALGOLIA_APP_ID: str
         STORE_ALGOLIA_INDEX_NAME: str
         STORE_ALGOLIA_WRITE_API_KEY: str
@@ -94,6 +95,8 @@ class Config:  # noqa: PLW1641
         SITE_TRUSTED_RSYNC_HOST: str
         SITE_TRUSTED_RSYNC_BASE_PATH_TESTING: str
         SITE_TRUSTED_RSYNC_BASE_PATH_LIVE: str
+        ENABLE_FEATURE_EXPORT_COMPRESSION: bool
+        ENABLE_FEATURE_EXPORT_SKIP_UNCHANGED: bool
         BASE_URL_TESTING: str
         BASE_URL_LIVE: str
         CHECKS_TRUSTED_USERNAME: str
@@ -103,6 +106,7 @@ class Config:  # noqa: PLW1641
         CHECKS_MAGIC_PRODUCTS_CLIENT_SECRET: str
         CHECKS_MAGIC_PRODUCTS_CLIENT_SECRET_ID: str
         CHECKS_MAGIC_PRODUCTS_CLIENT_SECRET_EXP: date
+        CHECKS_ENGINE: str
 
     def dumps_safe(self) -> ConfigDumpSafe:
         """Dump config for output to the user with sensitive data redacted."""
@@ -122,6 +126,7 @@ class Config:  # noqa: PLW1641
             "STORE_GITLAB_PROJECT_ID": self.STORE_GITLAB_PROJECT_ID,
             "STORE_GITLAB_DEFAULT_BRANCH": self.STORE_GITLAB_DEFAULT_BRANCH,
             "STORE_GITLAB_CACHE_PATH": str(self.STORE_GITLAB_CACHE_PATH.resolve()),
+            "ENABLE_FEATURE_GITLAB_CACHE_ARCHIVE": self.ENABLE_FEATURE_GITLAB_CACHE_ARCHIVE,
             "STORE_ALGOLIA_APP_ID": self.STORE_ALGOLIA_APP_ID,
             "STORE_ALGOLIA_INDEX_NAME": self.STORE_ALGOLIA_INDEX_NAME,
             "STORE_ALGOLIA_WRITE_API_KEY": self.STORE_ALGOLIA_WRITE_API_KEY_SAFE,
@@ -143,6 +148,8 @@ class Config:  # noqa: PLW1641
             "SITE_TRUSTED_RSYNC_HOST": self.SITE_TRUSTED_RSYNC_HOST,
             "SITE_TRUSTED_RSYNC_BASE_PATH_TESTING": str(self.SITE_TRUSTED_RSYNC_BASE_PATH_TESTING),
             "SITE_TRUSTED_RSYNC_BASE_PATH_LIVE": str(self.SITE_TRUSTED_RSYNC_BASE_PATH_LIVE),
+            "ENABLE_FEATURE_EXPORT_COMPRESSION": self.ENABLE_FEATURE_EXPORT_COMPRESSION,
+            "ENABLE_FEATURE_EXPORT_SKIP_UNCHANGED": self.ENABLE_FEATURE_EXPORT_SKIP_UNCHANGED,
             "BASE_URL_TESTING": self.BASE_URL_TESTING,
             "BASE_URL_LIVE": self.BASE_URL_LIVE,
             "CHECKS_TRUSTED_USERNAME": self.CHECKS_TRUSTED_USERNAME,
@@ -152,6 +159,7 @@ class Config:  # noqa: PLW1641
             "CHECKS_MAGIC_PRODUCTS_CLIENT_SECRET": self.CHECKS_MAGIC_PRODUCTS_CLIENT_SECRET_SAFE,
             "CHECKS_MAGIC_PRODUCTS_CLIENT_SECRET_ID": self.CHECKS_MAGIC_PRODUCTS_CLIENT_SECRET_ID,
             "CHECKS_MAGIC_PRODUCTS_CLIENT_SECRET_EXP": self.CHECKS_MAGIC_PRODUCTS_CLIENT_SECRET_EXP,
+            "CHECKS_ENGINE": self.CHECKS_ENGINE,
         }
 
     def validate(self) -> None:
@@ -293,6 +301,12 @@ class Config:  # noqa: PLW1641
         with self._env.prefixed(self._app_prefix), self._env.prefixed("STORE_GITLAB_"):
             return self._env.path("CACHE_PATH", validate=self._opt_path_validator).resolve()
 
+    @property
+    def ENABLE_FEATURE_GITLAB_CACHE_ARCHIVE(self) -> bool:
+        """Controls whether the GitLab store cache is created from a repository archive, rather than per-record."""
+        with self._env.prefixed(self._app_prefix):
+            return self._env.bool("ENABLE_FEATURE_GITLAB_CACHE_ARCHIVE", default=True)
+
     @property
     def STORE_ALGOLIA_APP_ID(self) -> str:
         """Application ID for Algolia search store."""
@@ -448,6 +462,18 @@ class Config:  # noqa: PLW1641
         with self._env.prefixed(self._app_prefix), self._env.prefixed("SITE_TRUSTED_RSYNC_"):
             return self._env.path("BASE_PATH_LIVE")
 
+    @property
+    def ENABLE_FEATURE_EXPORT_COMPRESSION(self) -> bool:
+        """Controls whether site content is exported with gzip compressed variants for applicable media types."""
+        with self._env.prefixed(self._app_prefix):
+            return self._env.bool("ENABLE_FEATURE_EXPORT_COMPRESSION", default=False)
+
+    @property
+    def ENABLE_FEATURE_EXPORT_SKIP_UNCHANGED(self) -> bool:
+        """Controls whether site content already held unchanged in the untrusted site bucket is not uploaded again."""
+        with self._env.prefixed(self._app_prefix):
+            return self._env.bool("ENABLE_FEATURE_EXPORT_SKIP_UNCHANGED", default=False)
+
     @property
     def BASE_URL_TESTING(self) -> str:
         """
@@ -519,3 +545,9 @@ class Config:  # noqa: PLW1641
         """Non-sensitive expiry date for CHECKS_MAGIC_PRODUCTS_CLIENT_SECRET."""
         with self._env.prefixed(self._app_prefix), self._env.prefixed("CHECKS_MAGIC_PRODUCTS_"):
             return self._env.date("CLIENT_SECRET_EXP")
+
+    @property
+    def CHECKS_ENGINE(self) -> str:
+        """Engine used to run checks in parallel ('processes' or 'threads')."""
+        with self._env.prefixed(self._app_prefix), self._env.prefixed("CHECKS_"):
+            return self._env.str("ENGINE", default="threads", validate=validate.OneOf(["processes", "threads"]))
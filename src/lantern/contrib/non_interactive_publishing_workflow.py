@@ -43,20 +43,27 @@ class Args:
     webhook: str | None = None
 
 
-def _parse_records(logger: logging.Logger, search_path: Path) -> dict[Path, Record]:
-    """Attempt to load, parse and validate JSON encoded record files."""
-    records = {}
+def _parse_records(logger: logging.Logger, search_path: Path, parallel_jobs: int = 1) -> dict[Path, Record]:
+    """Attempt to load, parse and validate (optionally in parallel) JSON encoded record files."""
+    loaded = []
     for json_path in search_path.glob("*.json"):
         with json_path.open("r") as f:
             config = json.load(f)
         try:
-            record = Record.loads(config)
-            record.validate()
+            loaded.append((json_path, config, Record.loads(config)))
         except RecordInvalidError as e:
             logger.exception("Record '%s' does not validate, skipping.", config.get("file_identifier", "<unknown>"))
             logger.exception(e.validation_error)
+
+    records = {}
+    errors = Record.validate_many([record for _, _, record in loaded], parallel_jobs=parallel_jobs)
+    for (json_path, config, record), error in zip(loaded, errors, strict=True):
+        if error is not None:
+            fid = config.get("file_identifier", "<unknown>")
+            logger.error("Record '%s' does not validate, skipping.", fid, exc_info=error)
+            logger.error(error.validation_error)
             continue
-        if hasattr(Record, "_config_supported") and not Record._config_supported(config):
+        if not record._supported(config, logger=logger):
             logger.warning(
                 "Record '%s' contains unsupported content the catalogue will ignore.",
                 config.get("file_identifier", "<unknown>"),
@@ -93,10 +100,12 @@ def _clean_input_records(logger: logging.Logger, record_paths: dict[Path, Record
         path.unlink(missing_ok=True)
 
 
-def _reduce_records(logger: logging.Logger, cat: BasCatalogue, args: Args) -> dict[Path, Record]:
+def _reduce_records(
+    logger: logging.Logger, cat: BasCatalogue, args: Args, parallel_jobs: int = 1
+) -> dict[Path, Record]:
     """Reduce a set of records to be committed to exclude unchanged (existing) records."""
     logger.info("Importing records from '%s' to '%s", args.path.resolve(), args.changeset_base)
-    record_paths = _parse_records(logger=logger, search_path=args.path)
+    record_paths = _parse_records(logger=logger, search_path=args.path, parallel_jobs=parallel_jobs)
     return _filter_records(logger=logger, cat=cat, branch=args.changeset_base, record_paths=record_paths)
 
 
@@ -195,7 +204,7 @@ def _run(logger: logging.Logger, config: Config, args: Args) -> None:
     )
     catalogue = BasCatalogue(logger=logger, config=config, s3=s3)
 
-    records = _reduce_records(logger=logger, cat=catalogue, args=args)
+    records = _reduce_records(logger=logger, cat=catalogue, args=args, parallel_jobs=config.PARALLEL_JOBS)
     if len(records) < 1:
         logger.info("No new or updated records to commit, exiting.")
         return
@@ -3,7 +3,8 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     import logging
-    from collections.abc import Collection
+    from collections.abc import Collection, Container, Iterable
+    from pathlib import Path
 
     from lantern.models.site import SiteContent
 
@@ -31,3 +32,19 @@ class ExporterBase(ABC):
     def export(self, content: Collection[SiteContent]) -> None:
         """Persist content."""
         ...
+
+    def stream(self, content: Iterable[SiteContent], unchanged: Container[str] = ()) -> list[Path]:
+        """
+        Persist content as it is generated.
+
+        Returns the paths of persisted content (e.g. for invalidating cached content).
+
+        `unchanged` optionally gives paths of items known to be unchanged since they were last persisted (e.g. from a
+        build manifest). Exporters MAY use these to avoid persisting items again. It is ignored by default.
+
+        By default, content is collected and persisted using `export()`. Subclasses SHOULD override this method where
+        content can be persisted as each item is received, to overlap generating and persisting content.
+        """
+        items = list(content)
+        self.export(items)
+        return [item.path for item in items]
@@ -0,0 +1,58 @@
+import gzip
+from dataclasses import dataclass
+
+
+@dataclass(kw_only=True, frozen=True)
+class CompressionRule:
+    """
+    Compression settings for a media type.
+
+    - `min_size`: content smaller than this size (in bytes) is not compressed, as savings are outweighed by overhead
+    - `level`: gzip compression level (1-9), as content is compressed once at export, higher levels are preferred
+    """
+
+    min_size: int = 1024
+    level: int = 9
+
+
+COMPRESSION_RULES: dict[str, CompressionRule] = {
+    "text/html": CompressionRule(),
+    "text/css": CompressionRule(),
+    "text/csv": CompressionRule(),
+    "text/plain": CompressionRule(),
+    "text/javascript": CompressionRule(),
+    "application/javascript": CompressionRule(),
+    "application/json": CompressionRule(),
+    "application/xml": CompressionRule(),
+    "image/svg+xml": CompressionRule(),
+}
+
+
+def get_rule(media_type: str, rules: dict[str, CompressionRule]) -> CompressionRule | None:
+    """
+    Get compression rule for a media type, if any.
+
+    Any media type parameters (e.g. `;version=3.1`) are ignored. Media types with a structured syntax suffix (e.g.
+    `application/geo+json`) use the rule for the relevant base type (e.g. `application/json`) if not set directly.
+    """
+    essence = media_type.split(";", maxsplit=1)[0].strip().lower()
+    if essence in rules:
+        return rules[essence]
+    if "+" in essence:
+        return rules.get(f"application/{essence.rsplit('+', maxsplit=1)[1]}")
+    return None
+
+
+def compress(content: bytes, media_type: str, rules: dict[str, CompressionRule]) -> bytes | None:
+    """
+    Gzip compress content if applicable to its media type and size.
+
+    Output is deterministic (no timestamp is included) so unchanged content gives unchanged compressed content.
+
+    Returns None where content should not be compressed, including where compressed content would be larger.
+    """
+    rule = get_rule(media_type, rules)
+    if rule is None or len(content) < rule.min_size:
+        return None
+    compressed = gzip.compress(content, compresslevel=rule.level, mtime=0)
+    return compressed if len(compressed) < len(content) else None
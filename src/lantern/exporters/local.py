@@ -3,11 +3,13 @@ import time
 from typing import TYPE_CHECKING
 
 from lantern.exporters.base import ExporterBase
+from lantern.exporters.compression import compress
 
 if TYPE_CHECKING:
-    from collections.abc import Collection
+    from collections.abc import Collection, Container, Iterable
     from pathlib import Path
 
+    from lantern.exporters.compression import CompressionRule
     from lantern.models.site import SiteContent
 
 
@@ -22,47 +24,87 @@ class LocalExporter(ExporterBase):
     Default directory mode: 0022 (rwx-r-x-r-x)
     Default file mode: 0222 (rw-r--r--)
 
+    Optionally, gzip compressed variants of applicable content (see `lantern.exporters.compression`) can be written
+    alongside each file with a `.gz` suffix, for web servers that support pre-compressed files (e.g. Nginx
+    `gzip_static`). Any existing variant is removed where content is no longer compressed.
+
     Intended for use with other exporters (such as `lantern.exporters.rsync.RsyncExporter`) or external processes.
 
     Note: `pathlib.Path.mkdir(mode=...)` is subject to the Python process umask, meaning the default directory mode
     typically resolves to 755 (rwxr-xr-x) rather than 777 (rwxrwxrwx). This is intentional.
     """
 
-    def __init__(self, logger: logging.Logger, path: Path, mode_d: int = 0o755, mode_f: int = 0o644) -> None:
+    def __init__(
+        self,
+        logger: logging.Logger,
+        path: Path,
+        mode_d: int = 0o755,
+        mode_f: int = 0o644,
+        compression: dict[str, CompressionRule] | None = None,
+    ) -> None:
         super().__init__(logger=logger, name="Local Filesystem")
         self.base_path = path
         self._mode_dir = mode_d
         self._mode_file = mode_f
+        self._compression = compression
+
+    def _write_compressed(self, path: Path, content: bytes, media_type: str) -> None:
+        """Write or remove gzip compressed variant of a file."""
+        variant_path = path.with_name(f"{path.name}.gz")
+        compressed = compress(content=content, media_type=media_type, rules=self._compression or {})
+        if compressed is None:
+            variant_path.unlink(missing_ok=True)
+            return
+        with variant_path.open(mode="wb") as f:
+            f.write(compressed)
+        variant_path.chmod(mode=self._mode_file)
+
+    def _write(self, item: SiteContent) -> None:
+        """Write content item to file."""
+        path = self.base_path / item.path
+
+        # create parent directories and set permissions (using chmod to avoid umask)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        current = path.parent
+        while current != self.base_path:
+            current.chmod(self._mode_dir)
+            current = current.parent
+
+        item_content = item.content.encode("utf-8") if isinstance(item.content, str) else item.content
+        with path.open(mode="wb") as f:
+            f.write(item_content)
+        path.chmod(mode=self._mode_file)
+        if self._compression:
+            self._write_compressed(path=path, content=item_content, media_type=item.media_type)
+
+        # log any object metadata that local system doesn't support
+        if self._logger.isEnabledFor(logging.DEBUG) and (item.object_meta or item.redirect):
+            if item.redirect:
+                item.object_meta["redirect"] = item.redirect
+            self._logger.debug("Additional properties for %s:", path.resolve())
+            self._logger.debug(item.object_meta)
 
     def export(self, content: Collection[SiteContent]) -> None:
         """Persist content."""
-        start = time.monotonic()
-        count = 0
-
-        for item in content:
-            path = self.base_path / item.path
+        self.stream(content)
 
-            # create parent directories and set permissions (using chmod to avoid umask)
-            path.parent.mkdir(parents=True, exist_ok=True)
-            current = path.parent
-            while current != self.base_path:
-                current.chmod(self._mode_dir)
-                current = current.parent
+    def stream(self, content: Iterable[SiteContent], unchanged: Container[str] = ()) -> list[Path]:
+        """
+        Persist content as it is generated.
 
-            item_content = item.content.encode("utf-8") if isinstance(item.content, str) else item.content
-            with path.open(mode="wb") as f:
-                f.write(item_content)
-            path.chmod(mode=self._mode_file)
-
-            # log any object metadata that local system doesn't support
-            if self._logger.isEnabledFor(logging.DEBUG) and (item.object_meta or item.redirect):
-                if item.redirect:
-                    item.object_meta["redirect"] = item.redirect
-                self._logger.debug("Additional properties for %s:", path.resolve())
-                self._logger.debug(item.object_meta)
+        Items are written as they are received.
+        """
+        start = time.monotonic()
+        paths = []
 
-            count += 1
+        for item in content:
+            self._write(item)
+            paths.append(item.path)
 
         self._logger.info(
-            "Exported %s items to '%s' in %s seconds", count, self.base_path.resolve(), round(time.monotonic() - start)
+            "Exported %s items to '%s' in %s seconds",
+            len(paths),
+            self.base_path.resolve(),
+            round(time.monotonic() - start),
         )
+        return paths
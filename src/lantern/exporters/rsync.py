@@ -10,8 +10,9 @@ from lantern.exporters.local import LocalExporter
 
 if TYPE_CHECKING:
     import logging
-    from collections.abc import Collection
+    from collections.abc import Collection, Container, Iterable
 
+    from lantern.exporters.compression import CompressionRule
     from lantern.models.site import SiteContent
 
 
@@ -22,12 +23,21 @@ class RsyncExporter(ExporterBase):
     For use with local and remote file systems.
 
     Wrapper around https://github.com/gchamon/sysrsync client, which requires the `rsync` binary to be installed.
+
+    Optionally, gzip compressed variants of applicable content can be included (see `LocalExporter`).
     """
 
-    def __init__(self, logger: logging.Logger, path: Path, host: str | None = None) -> None:
+    def __init__(
+        self,
+        logger: logging.Logger,
+        path: Path,
+        host: str | None = None,
+        compression: dict[str, CompressionRule] | None = None,
+    ) -> None:
         super().__init__(logger=logger, name="Rsync")
         self._path = path
         self._host = host
+        self._compression = compression
 
     def _upload_dir(self, src_path: Path, target_path: Path, target_host: str | None = None) -> None:
         """
@@ -70,20 +80,25 @@ class RsyncExporter(ExporterBase):
         sysrsync.run(strict=True, **kwargs)
 
     def export(self, content: Collection[SiteContent]) -> None:
+        """Persist content."""
+        self.stream(content)
+
+    def stream(self, content: Iterable[SiteContent], unchanged: Container[str] = ()) -> list[Path]:
         """
-        Persist content.
+        Persist content as it is generated.
 
-        Requires materialised files to sync, created by dumping to a temp directory.
+        Requires materialised files to sync, created by dumping to a temp directory as items are received.
         """
         with TemporaryDirectory() as tmp_dir:
             tmp_path = Path(tmp_dir) / "output"
-            tmp_exporter = LocalExporter(logger=self._logger, path=tmp_path)
-            tmp_exporter.export(content)
+            tmp_exporter = LocalExporter(logger=self._logger, path=tmp_path, compression=self._compression)
+            paths = tmp_exporter.stream(content)
 
             start = time.monotonic()
             # `src_path=tmp_path` not used to allow ExporterLocal to be mocked in tests to give a predictable path.
             self._upload_dir(src_path=tmp_exporter.base_path, target_path=self._path, target_host=self._host)
             target = f"{self._host}:{self._path}" if self._host else str(self._path)
             self._logger.info(
-                "Exported %s items to '%s' in %s seconds", len(content), target, round(time.monotonic() - start)
+                "Exported %s items to '%s' in %s seconds", len(paths), target, round(time.monotonic() - start)
             )
+        return paths
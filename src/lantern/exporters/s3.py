@@ -1,18 +1,25 @@
+import hashlib
+import os
 import threading
 import time
+from itertools import takewhile
+from queue import Queue
 from typing import TYPE_CHECKING
 
 from boto3 import client as BotoClient  # noqa: N812
 from joblib import Parallel, delayed
 
 from lantern.exporters.base import ExporterBase
+from lantern.exporters.compression import compress
 
 if TYPE_CHECKING:
     import logging
-    from collections.abc import Collection
+    from collections.abc import Collection, Container, Iterable
+    from pathlib import Path
 
     from mypy_boto3_s3 import S3Client
 
+    from lantern.exporters.compression import CompressionRule
     from lantern.models.site import SiteContent
 
 
@@ -21,12 +28,28 @@ class S3Exporter(ExporterBase):
     (AWS) S3 exporter.
 
     For use with S3 compatible object stores.
+
+    Optionally, objects known to be unchanged, and whose content matches the existing object, are not uploaded again
+    (see `_upload_item`).
+
+    Optionally, content can be gzip compressed for applicable media types (see `lantern.exporters.compression`) and
+    stored with a `Content-Encoding` header.
     """
 
-    def __init__(self, logger: logging.Logger, s3: S3Client, bucket: str, parallel_jobs: int) -> None:
+    def __init__(
+        self,
+        logger: logging.Logger,
+        s3: S3Client,
+        bucket: str,
+        parallel_jobs: int,
+        skip_unchanged: bool = False,
+        compression: dict[str, CompressionRule] | None = None,
+    ) -> None:
         super().__init__(logger=logger, name="S3")
         self._s3 = s3
         self._bucket = bucket
+        self._skip_unchanged = skip_unchanged
+        self._compression = compression
 
         self._thread_local = threading.local()
         self._workers = parallel_jobs
@@ -46,6 +69,54 @@ class S3Exporter(ExporterBase):
 
         return self._thread_local.s3
 
+    @staticmethod
+    def _encode(body: str | bytes) -> bytes:
+        """Encode object body as bytes."""
+        return body.encode("utf-8") if isinstance(body, str) else body
+
+    def _get_etags(self, prefix: str = "") -> dict[str, str]:
+        """
+        Get ETags for existing objects within a prefix.
+
+        Uses a paginated object listing (1,000 keys per request) rather than a request per object.
+        """
+        etags: dict[str, str] = {}
+        paginator = self._s3.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self._bucket, Prefix=prefix):
+            for obj in page.get("Contents", []):
+                etags[obj["Key"]] = obj["ETag"].strip('"')
+        return etags
+
+    def _stream_item(
+        self,
+        item: SiteContent,
+        etags: dict[str, str],
+        listed: set[str],
+        lock: threading.Lock,
+        unchanged: Container[str],
+    ) -> int | None:
+        """
+        Upload streamed item unless unchanged.
+
+        Where unchanged items are skipped, ETags for existing objects in the parent 'directory' of the item are listed
+        first, if not already listed. Items at the root of the bucket are listed individually, to avoid listing the
+        whole bucket. Prefixes are listed outside the lock, so an item may be uploaded unnecessarily where another
+        thread is still listing its prefix.
+
+        Prefixes are only listed for items in `unchanged`, as other items are always uploaded.
+        """
+        if self._skip_unchanged and str(item.path) in unchanged:
+            parent = str(item.path.parent)
+            prefix = str(item.path) if parent == "." else f"{parent}/"
+            with lock:
+                new = prefix not in listed
+                listed.add(prefix)
+            if new:
+                prefix_etags = self._get_etags(prefix=prefix)
+                with lock:
+                    etags.update(prefix_etags)
+        return self._upload_item(item, etags, unchanged)
+
     def _upload_object(
         self,
         s3: S3Client,
@@ -55,6 +126,7 @@ class S3Exporter(ExporterBase):
         redirect: str | None = None,
         no_cache: bool = False,
         meta: dict | None = None,
+        encoding: str | None = None,
     ) -> None:
         """
         Upload file.
@@ -65,42 +137,157 @@ class S3Exporter(ExporterBase):
 
         Supports optional object cache control, to exclude from possible downstream caching [2].
 
+        Supports optional content encoding, for body content that has already been compressed.
+
         Requires S3 client as a parameter for use in parallel jobs.
 
         [1] https://docs.aws.amazon.com/AmazonS3/latest/userguide/how-to-page-redirect.html#redirect-requests-object-metadata
         [2] https://repost.aws/knowledge-center/prevent-cloudfront-from-caching-files
         """
-        params: dict = {"Bucket": self._bucket, "Key": key, "Body": body, "ContentType": content_type}
-        if isinstance(body, str):
-            params["Body"] = body.encode("utf-8")
+        params: dict = {"Bucket": self._bucket, "Key": key, "Body": self._encode(body), "ContentType": content_type}
         if redirect is not None:
             params["WebsiteRedirectLocation"] = redirect
         if no_cache:
             params["CacheControl"] = "no-store"
         if meta:
             params["Metadata"] = meta
+        if encoding is not None:
+            params["ContentEncoding"] = encoding
         self._logger.info("Putting %s as %s", key, content_type)
         s3.put_object(**params)
 
-    def _upload_item(self, item: SiteContent) -> None:
+    def _upload_item(self, item: SiteContent, etags: dict[str, str], unchanged: Container[str] = ()) -> int | None:
+        """
+        Upload item unless unchanged.
+
+        Where `skip_unchanged` is enabled, items are unchanged where:
+        - the item's path is in `unchanged`, i.e. its content, media type, caching, redirect and metadata are known to
+          be unchanged since it was last uploaded (e.g. from a build manifest)
+        - and, the ETag of an existing object matches the MD5 digest of the item's content (only valid for objects
+          uploaded in a single part without SSE-KMS/SSE-C encryption, which applies here)
+
+        Headers are not available in object listings, so items not known to be unchanged are always uploaded rather
+        than checking headers with a request per object. Changes made to object headers outside of exports are not
+        detected.
+
+        Redirects are always uploaded as their content is typically empty, with the redirect location held in metadata.
+
+        Where compression is enabled, items are compressed before checking for changes. Compressed content is
+        deterministic, so unchanged items remain unchanged.
+
+        Returns the number of bytes uploaded, or None if skipped.
+        """
+        key = str(item.path)
+        body = self._encode(item.content)
+        encoding = None
+        if self._compression and item.redirect is None:
+            compressed = compress(content=body, media_type=item.media_type, rules=self._compression)
+            if compressed is not None:
+                body = compressed
+                encoding = "gzip"
+
+        if (
+            self._skip_unchanged
+            and item.redirect is None
+            and key in unchanged
+            and etags.get(key) == hashlib.md5(body, usedforsecurity=False).hexdigest()
+        ):
+            self._logger.debug("Skipping unchanged %s", key)
+            return None
+
         self._upload_object(
             s3=self._get_client(),  # per-thread client
-            key=str(item.path),
+            key=key,
             content_type=item.media_type,
-            body=item.content,
+            body=body,
             redirect=item.redirect,
             no_cache=item.prevent_caching,
             meta=item.object_meta,
+            encoding=encoding,
         )
+        return len(body)
 
-    def export(self, content: Collection[SiteContent]) -> None:
+    def export(self, content: Collection[SiteContent], unchanged: Container[str] = ()) -> None:
         """
         Persist content.
 
         Uploads are processed in parallel using a threaded pool to avoid issues with picking the S3 client.
+
+        Unchanged items are skipped where `skip_unchanged` is enabled (see `_upload_item`).
+        """
+        start = time.monotonic()
+        etags: dict[str, str] = {}
+        if self._skip_unchanged and any(str(c.path) in unchanged for c in content):
+            etags = self._get_etags(prefix=os.path.commonprefix([str(c.path) for c in content]))
+        results = Parallel(n_jobs=self._workers, backend="threading")(
+            delayed(self._upload_item)(c, etags, unchanged) for c in content
+        )
+        self._log_export(start=start, results=results)
+
+    def stream(self, content: Iterable[SiteContent], unchanged: Container[str] = ()) -> list[Path]:
+        """
+        Persist content as it is generated.
+
+        Items are passed through a bounded queue to a pool of upload threads, so content is uploaded while further
+        content is generated. Where the queue is full, generating content is paused until uploads catch up.
+
+        As content paths aren't known in advance, where unchanged items are skipped, ETags are listed as needed for the
+        parent 'directory' of each item, rather than for the whole bucket. `unchanged` may be populated as content is
+        generated (e.g. `SiteManifest.unchanged_content`), provided each path is added before its item is given.
+
+        Where an upload fails, no further content is generated or uploaded and the error is raised.
+
+        Returns paths of uploaded items, excluding skipped unchanged items as these do not need invalidating.
         """
         start = time.monotonic()
-        Parallel(n_jobs=self._workers, backend="threading")(delayed(self._upload_item)(c) for c in content)
+        etags: dict[str, str] = {}
+        listed: set[str] = set()
+        lock = threading.Lock()
+        queue: Queue[SiteContent | None] = Queue(maxsize=self._workers * 10)
+        paths: list[Path] = []
+        results: dict[Path, int | None] = {}
+        errors: list[Exception] = []
+
+        def _worker() -> None:
+            while (item := queue.get()) is not None:
+                if errors:
+                    # drain queue without uploading to avoid blocking producer
+                    continue
+                try:
+                    results[item.path] = self._stream_item(
+                        item=item, etags=etags, listed=listed, lock=lock, unchanged=unchanged
+                    )
+                except Exception as e:  # noqa: BLE001
+                    errors.append(e)
+
+        workers = [threading.Thread(target=_worker, daemon=True) for _ in range(self._workers)]
+        for worker in workers:
+            worker.start()
+        try:
+            # stop generating content once any upload fails
+            for item in takewhile(lambda _: not errors, content):
+                queue.put(item)
+                paths.append(item.path)
+        finally:
+            for _ in workers:
+                queue.put(None)
+            for worker in workers:
+                worker.join()
+
+        if errors:
+            raise errors[0]
+        self._log_export(start=start, results=list(results.values()))
+        return [path for path in paths if results.get(path) is not None]
+
+    def _log_export(self, start: float, results: list[int | None]) -> None:
+        """Log export statistics from upload results."""
+        uploaded = [result for result in results if result is not None]
         self._logger.info(
-            "Exported %s items to 's3://%s' in %s seconds", len(content), self._bucket, round(time.monotonic() - start)
+            "Exported %s items to 's3://%s' in %s seconds (%s uploaded, %s unchanged skipped, %s bytes)",
+            len(results),
+            self._bucket,
+            round(time.monotonic() - start),
+            len(uploaded),
+            len(results) - len(uploaded),
+            sum(uploaded),
         )
@@ -15,12 +15,15 @@ class LinkifyPostprocessor(Postprocessor):
     def __init__(self, md: Markdown) -> None:
         super().__init__(md)
 
-        self._linker_options = {"skip_tags": ["code"], "parse_email": True}
+        self._linker = Linker(skip_tags=["code"], parse_email=True)
 
     def run(self, text: str) -> str:
-        """Convert URLs in text into full links."""
-        linker = Linker(**self._linker_options)
-        return linker.linkify(text)
+        """
+        Convert URLs in text into full links.
+
+        The linker is reused across conversions, as it's relatively expensive to create.
+        """
+        return self._linker.linkify(text)
 
 
 class LinkifyExtension(Extension):
@@ -1,6 +1,7 @@
 from copy import deepcopy
 from dataclasses import astuple, dataclass, field
 from datetime import UTC, date, datetime
+from functools import cache
 from typing import TypeVar
 
 import cattrs
@@ -15,6 +16,7 @@ from lantern.lib.metadata_library.models.record.enums import (
     OnlineResourceFunctionCode,
     ProgressCode,
 )
+from lantern.lib.metadata_library.models.record.utils.converter import CONVERTER
 
 TDate = TypeVar("TDate", bound="Date")
 TDates = TypeVar("TDates", bound="Dates")
@@ -132,8 +134,7 @@ class Contact:
         Example input: Contact(organisation=ContactIdentity(name="x"), role=[ContactRoleCode.POINT_OF_CONTACT])
         Example output: {'organisation': {'name': 'x'}, 'role': ['pointOfContact']}
         """
-        converter = cattrs.Converter()
-        contact = converter.unstructure(self)
+        contact = CONVERTER.unstructure(self)
         contact["role"] = sorted(contact["role"])
         return contact
 
@@ -166,6 +167,14 @@ class Contacts(list[Contact]):
     [2] multiple, see 'used in' section of: https://www.datypic.com/sc/niem21/e-gmd_CI_ResponsibleParty.html
     """
 
+    @staticmethod
+    @cache
+    def _converter() -> cattrs.Converter:
+        """Cattrs converter with hooks for this class, created once and shared."""
+        converter = cattrs.Converter()
+        converter.register_unstructure_hook(Contact, lambda d: d.unstructure())
+        return converter
+
     @classmethod
     def structure(cls: type[TContacts], value: list[dict]) -> Contacts:
         """
@@ -179,8 +188,7 @@ class Contacts(list[Contact]):
         Example input: [{'organisation': {'name': 'x'}, 'role': ['pointOfContact']}]
         Example output: Contacts([Contact(organisation=ContactIdentity(name="x"), role=[ContactRoleCode.POINT_OF_CONTACT])])
         """
-        converter = cattrs.Converter()
-        return cls([converter.structure(contact, Contact) for contact in value])
+        return cls([CONVERTER.structure(contact, Contact) for contact in value])
 
     def unstructure(self) -> list[dict]:
         """
@@ -192,8 +200,7 @@ class Contacts(list[Contact]):
         Example input: Contacts([Contact(organisation=ContactIdentity(name="x"), role=[ContactRoleCode.POINT_OF_CONTACT])])
         Example output: [{'organisation': {'name': 'x'}, 'role': ['pointOfContact']}]
         """
-        converter = cattrs.Converter()
-        converter.register_unstructure_hook(Contact, lambda d: d.unstructure())
+        converter = Contacts._converter()
         return [converter.unstructure(contact) for contact in self]
 
     def filter(self, roles: ContactRoleCode | list[ContactRoleCode]) -> Contacts:
@@ -424,8 +431,7 @@ class Identifiers(list[Identifier]):
         Example input: [{"identifier": "x", "href": "x", "namespace": "x"}]
         Example output: Identifiers([Identifier(identifier="x", href="x", namespace="x")])
         """
-        converter = cattrs.Converter()
-        return cls([converter.structure(identifier, Identifier) for identifier in value])
+        return cls([CONVERTER.structure(identifier, Identifier) for identifier in value])
 
     def unstructure(self) -> list[dict]:
         """
@@ -437,8 +443,7 @@ class Identifiers(list[Identifier]):
         Example input: Identifiers([Identifier(identifier="x", href="x", namespace="x")])
         Example output: [{"identifier": "x", "href": "x", "namespace": "x"}]
         """
-        converter = cattrs.Converter()
-        return [converter.unstructure(identifier) for identifier in self]
+        return [CONVERTER.unstructure(identifier) for identifier in self]
 
     def filter(self, namespace: str) -> Identifiers:
         """Filter identifiers by namespace."""
@@ -499,8 +504,14 @@ class Citation:
     contacts: Contacts = field(default_factory=Contacts)
 
     @classmethod
+    @cache
     def _converter(cls: type[TCitation]) -> cattrs.Converter:
-        """Cattrs converter with hooks for this class."""
+        """
+        Cattrs converter with hooks for this class.
+
+        Created once per class and shared, so MUST NOT be modified. Subclasses needing additional hooks should override
+        this method and extend a copy of this converter (see `Identification._converter()`).
+        """
         converter = cattrs.Converter()
         converter.register_structure_hook(Contacts, lambda d, t: Contacts.structure(d))
         converter.register_unstructure_hook(Contacts, lambda d: d.unstructure())
@@ -624,8 +635,7 @@ class Constraints(list[Constraint]):
         Example input: [{"type": "usage", "restriction_code": "license", "statement": "x", "href": "x"}]
         Example output: Constraints([Constraint(type=ConstraintTypeCode.USAGE, restriction_code=ConstraintRestrictionCode.LICENSE, statement="x", href="x")])
         """
-        converter = cattrs.Converter()
-        return cls([converter.structure(constraint, Constraint) for constraint in value])
+        return cls([CONVERTER.structure(constraint, Constraint) for constraint in value])
 
     def unstructure(self) -> list[dict]:
         """
@@ -638,8 +648,7 @@ class Constraints(list[Constraint]):
         Example output: [{"type": "usage", "restriction_code": "license", "statement": "x", "href": "x"}]
 
         """
-        converter = cattrs.Converter()
-        return [converter.unstructure(constraint) for constraint in self]
+        return [CONVERTER.unstructure(constraint) for constraint in self]
 
     def filter(
         self,
@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from functools import cache
 from typing import TypeVar
 
 import cattrs
@@ -54,6 +55,15 @@ class DomainConsistencies(list[DomainConsistency]):
     [2] https://www.datypic.com/sc/niem21/e-gmd_report-1.html
     """
 
+    @staticmethod
+    @cache
+    def _converter() -> cattrs.Converter:
+        """Cattrs converter with hooks for this class, created once and shared."""
+        converter = cattrs.Converter()
+        converter.register_structure_hook(Citation, lambda d, t: Citation.structure(d))
+        converter.register_unstructure_hook(Citation, lambda d: d.unstructure())
+        return converter
+
     @classmethod
     def structure(cls: type[TDomainConsistencies], value: list[dict]) -> DomainConsistencies:
         """
@@ -67,8 +77,7 @@ class DomainConsistencies(list[DomainConsistency]):
         Example input: [{"specification": {"title": {"value": "x"}, "dates": {"creation": '2014-06-30'}}, "explanation": "x", "result": True}]
         Example output: DomainConsistencies([DomainConsistency(specification=Citation(title="x", dates=Dates(creation=Date(date=date(2014, 6, 30)))), explanation="x", result=True)])
         """
-        converter = cattrs.Converter()
-        converter.register_structure_hook(Citation, lambda d, t: Citation.structure(d))
+        converter = DomainConsistencies._converter()
         return cls([converter.structure(domain, DomainConsistency) for domain in value])
 
     def unstructure(self) -> list[dict]:
@@ -81,8 +90,7 @@ class DomainConsistencies(list[DomainConsistency]):
         Example input: DomainConsistencies([DomainConsistency(specification=Citation(title="x", dates=Dates(creation=Date(date=date(2014, 6, 30)))), explanation="x", result=True)])
         Example output: [{"specification": {"title": {"value": "x"}, "dates": {"creation": '2014-06-30'}}, "explanation": "x", "result": True}]
         """
-        converter = cattrs.Converter()
-        converter.register_unstructure_hook(Citation, lambda d: d.unstructure())
+        converter = DomainConsistencies._converter()
         return [converter.unstructure(identifier) for identifier in self]
 
     def filter(self, href: str) -> DomainConsistencies:
@@ -116,6 +124,15 @@ class DataQuality:
     lineage: Lineage | None = None
     domain_consistency: DomainConsistencies = field(default_factory=DomainConsistencies)
 
+    @staticmethod
+    @cache
+    def _converter() -> cattrs.Converter:
+        """Cattrs converter with hooks for this class, created once and shared."""
+        converter = cattrs.Converter()
+        converter.register_structure_hook(DomainConsistencies, lambda d, t: DomainConsistencies.structure(d))
+        converter.register_unstructure_hook(DomainConsistencies, lambda d: d.unstructure())
+        return converter
+
     @classmethod
     def structure(cls: type[TDataQuality], value: dict) -> DataQuality:
         """
@@ -133,8 +150,7 @@ class DataQuality:
             del dc["specification"]["contact"]
             value["domain_consistency"][i] = dc
 
-        converter = cattrs.Converter()
-        converter.register_structure_hook(DomainConsistencies, lambda d, t: DomainConsistencies.structure(d))
+        converter = DataQuality._converter()
         return converter.structure(value, cls)
 
     def unstructure(self) -> dict:
@@ -144,8 +160,7 @@ class DataQuality:
         Intended to be used as a cattrs unstructure hook.
         E.g. `converter.register_unstructure_hook(DataQuality, lambda d: d.unstructure())`
         """
-        converter = cattrs.Converter()
-        converter.register_unstructure_hook(DomainConsistencies, lambda d: d.unstructure())
+        converter = DataQuality._converter()
         value = converter.unstructure(self)
 
         # workaround v4 schema not allowing multiple contacts
@@ -1,10 +1,12 @@
 from dataclasses import dataclass
+from functools import cache
 from typing import TypeVar
 
 import cattrs
 
 from lantern.lib.metadata_library.models.record.elements.common import Contact, OnlineResource
 from lantern.lib.metadata_library.models.record.enums import ContactRoleCode
+from lantern.lib.metadata_library.models.record.utils.converter import CONVERTER
 
 TDistributions = TypeVar("TDistributions", bound="Distributions")
 
@@ -79,6 +81,14 @@ class Distribution:
             msg = "Distributor contact must include the 'distributor' role."
             raise ValueError(msg) from None
 
+    @staticmethod
+    @cache
+    def _converter() -> cattrs.Converter:
+        """Cattrs converter with hooks for this class, created once and shared."""
+        converter = cattrs.Converter()
+        converter.register_unstructure_hook(Contact, lambda d: d.unstructure())
+        return converter
+
     def unstructure(self) -> dict:
         """
         Convert Metadata class into plain types.
@@ -86,8 +96,7 @@ class Distribution:
         Intended to be used as a cattrs unstructure hook.
         E.g. `converter.register_unstructure_hook(Distribution, lambda d: d.unstructure())`
         """
-        converter = cattrs.Converter()
-        converter.register_unstructure_hook(Contact, lambda d: d.unstructure())
+        converter = Distribution._converter()
         return converter.unstructure(self)
 
 
@@ -104,6 +113,14 @@ class Distributions(list[Distribution]):
     [2] https://www.datypic.com/sc/niem21/e-gmd_MD_Distribution.html
     """
 
+    @staticmethod
+    @cache
+    def _converter() -> cattrs.Converter:
+        """Cattrs converter with hooks for this class, created once and shared."""
+        converter = cattrs.Converter()
+        converter.register_unstructure_hook(Distribution, lambda d: d.unstructure())
+        return converter
+
     @classmethod
     def structure(cls: type[TDistributions], value: list[dict]) -> Distributions:
         """
@@ -117,8 +134,7 @@ class Distributions(list[Distribution]):
         Example input: [{"distributor": {"organisation": {"name": "x"}, "role": ["distributor"]}, "transfer_option": {"online_resource": {"href": "x", "function": "download"}}}]
         Example output: Distributions([Distribution(distributor=Contact(organisation=ContactIdentity(name="x"), role={ContactRoleCode.DISTRIBUTOR}), transfer_option=TransferOption(online_resource=OnlineResource(href="x", function=OnlineResourceFunctionCode.DOWNLOAD)))])
         """
-        converter = cattrs.Converter()
-        return cls([converter.structure(distribution, Distribution) for distribution in value])
+        return cls([CONVERTER.structure(distribution, Distribution) for distribution in value])
 
     def unstructure(self) -> list[dict]:
         """
@@ -130,8 +146,7 @@ class Distributions(list[Distribution]):
         Example input: Distributions([Distribution(distributor=Contact(organisation=ContactIdentity(name="x"), role={ContactRoleCode.DISTRIBUTOR}), transfer_option=TransferOption(online_resource=OnlineResource(href="x", function=OnlineResourceFunctionCode.DOWNLOAD)))])
         Example output: [{"distributor": {"organisation": {"name": "x"}, "role": ["distributor"]}, "transfer_option": {"online_resource": {"href": "x", "function": "download"}}}]
         """
-        converter = cattrs.Converter()
-        converter.register_unstructure_hook(Distribution, lambda d: d.unstructure())
+        converter = Distributions._converter()
         return [converter.unstructure(distribution) for distribution in self]
 
     def ensure(self, distribution: Distribution) -> None:
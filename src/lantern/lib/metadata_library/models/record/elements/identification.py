@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from functools import cache
 from typing import TypeVar
 
 import cattrs
@@ -15,6 +16,7 @@ from lantern.lib.metadata_library.models.record.enums import (
     AggregationAssociationCode,
     AggregationInitiativeCode,
 )
+from lantern.lib.metadata_library.models.record.utils.converter import CONVERTER
 
 TGraphicOverviews = TypeVar("TGraphicOverviews", bound="GraphicOverviews")
 TIdentification = TypeVar("TIdentification", bound="Identification")
@@ -92,8 +94,7 @@ class Aggregations(list[Aggregation]):
             Aggregation(identifier=Identifier(identifier="x", href="x", namespace="x"), "association_type": AggregationAssociationCode.CROSS_REFERENCE)
         ])
         """
-        converter = cattrs.Converter()
-        return cls([converter.structure(aggregation, Aggregation) for aggregation in value])
+        return cls([CONVERTER.structure(aggregation, Aggregation) for aggregation in value])
 
     def unstructure(self) -> list[dict]:
         """
@@ -109,8 +110,7 @@ class Aggregations(list[Aggregation]):
             {"identifier": {"identifier": "x", "href": "x", "namespace": "x"}, "association_type": "crossReference"}
         ]
         """
-        converter = cattrs.Converter()
-        return [converter.unstructure(aggregation) for aggregation in self]
+        return [CONVERTER.unstructure(aggregation) for aggregation in self]
 
     def identifiers(self, exclude: list[str] | None = None) -> list[str]:
         """
@@ -269,6 +269,17 @@ class Extents(list[Extent]):
     [2] See 'used in' section of: https://www.datypic.com/sc/niem21/e-gmd_extent-1.html
     """
 
+    @staticmethod
+    @cache
+    def _converter() -> cattrs.Converter:
+        """Cattrs converter with hooks for this class, created once and shared."""
+        converter = cattrs.Converter()
+        converter.register_structure_hook(Date, lambda d, t: Date.structure(d))
+        converter.register_unstructure_hook(Date, lambda d: d.unstructure())
+        converter.register_structure_hook(Dates, lambda d, t: Dates.structure(d))
+        converter.register_unstructure_hook(Dates, lambda d: d.unstructure())
+        return converter
+
     @classmethod
     def structure(cls: type[TExtents], value: list[dict]) -> Extents:
         """
@@ -286,9 +297,7 @@ class Extents(list[Extent]):
             Extent(identifier="x", geographic=ExtentGeographic(bounding_box=BoundingBox(west_longitude=1.0, east_longitude=2.0, south_latitude=3.0, north_latitude=4.0)))
         ]
         """
-        converter = cattrs.Converter()
-        converter.register_structure_hook(Date, lambda d, t: Date.structure(d))
-        converter.register_structure_hook(Dates, lambda d, t: Dates.structure(d))
+        converter = Extents._converter()
         return cls([converter.structure(extent, Extent) for extent in value])
 
     def unstructure(self) -> list[dict]:
@@ -305,9 +314,7 @@ class Extents(list[Extent]):
             {"identifier": "x", "geographic": { "bounding_box": {"west_longitude": 1.0,"east_longitude": 1.0,"south_latitude": 1.0,"north_latitude": 1.0}}}
         ]
         """
-        converter = cattrs.Converter()
-        converter.register_unstructure_hook(Date, lambda d: d.unstructure())
-        converter.register_unstructure_hook(Dates, lambda d: d.unstructure())
+        converter = Extents._converter()
         return [converter.unstructure(extent) for extent in self]
 
     def filter(self, identifier: str) -> Extents:
@@ -363,8 +370,7 @@ class GraphicOverviews(list[GraphicOverview]):
         Example input: [{"identifier": "x", "href": "x", "mime_type": "x"}]
         Example output: GraphicOverviews([GraphicOverview(identifier="x", description="x", href="x", mime_type="x")])
         """
-        converter = cattrs.Converter()
-        return cls([converter.structure(overview, GraphicOverview) for overview in value])
+        return cls([CONVERTER.structure(overview, GraphicOverview) for overview in value])
 
     def unstructure(self) -> list[dict]:
         """
@@ -376,8 +382,7 @@ class GraphicOverviews(list[GraphicOverview]):
         Example input: GraphicOverviews([GraphicOverview(identifier="x", description="x", href="x", mime_type="x")])
         Example output: [{"identifier": "x", "href": "x", "mime_type": "x"}]
         """
-        converter = cattrs.Converter()
-        return [converter.unstructure(overview) for overview in self]
+        return [CONVERTER.unstructure(overview) for overview in self]
 
     def filter(self, identifier: str) -> GraphicOverviews:
         """
@@ -452,6 +457,25 @@ class Identification(Citation):
         # redefine value based on order for keys defined in value
         return {key: value[key] for key in order if key in value}
 
+    @classmethod
+    @cache
+    def _converter(cls: type[TIdentification]) -> cattrs.Converter:
+        """
+        Cattrs converter with hooks for this class.
+
+        Extends a copy of the Citation converter, as that converter is shared.
+        """
+        converter = Citation._converter().copy()
+        converter.register_structure_hook(Aggregations, lambda d, t: Aggregations.structure(d))
+        converter.register_unstructure_hook(Aggregations, lambda d: d.unstructure())
+        converter.register_structure_hook(Constraints, lambda d, t: Constraints.structure(d))
+        converter.register_unstructure_hook(Constraints, lambda d: d.unstructure())
+        converter.register_structure_hook(Extents, lambda d, t: Extents.structure(d))
+        converter.register_unstructure_hook(Extents, lambda d: d.unstructure())
+        converter.register_structure_hook(GraphicOverviews, lambda d, t: GraphicOverviews.structure(d))
+        converter.register_unstructure_hook(GraphicOverviews, lambda d: d.unstructure())
+        return converter
+
     @classmethod
     def structure(cls: type[TIdentification], value: dict) -> Identification:
         """
@@ -465,11 +489,7 @@ class Identification(Citation):
         1. Unwrap title (i.e. `{'title': {'value': 'x'}, 'abstract': 'x'}` -> `{'title': 'x', 'abstract': 'x'}`)
         2. Convert the input dict to a new instance of this class via cattrs
         """
-        converter = Citation._converter()
-        converter.register_structure_hook(Aggregations, lambda d, t: Aggregations.structure(d))
-        converter.register_structure_hook(Constraints, lambda d, t: Constraints.structure(d))
-        converter.register_structure_hook(Extents, lambda d, t: Extents.structure(d))
-        converter.register_structure_hook(GraphicOverviews, lambda d, t: GraphicOverviews.structure(d))
+        converter = cls._converter()
 
         title = value.pop("title")["value"]
         value["title"] = title
@@ -487,12 +507,7 @@ class Identification(Citation):
         1. Convert the class instance into plain types via cattrs
         2. Wrap title (i.e. `{'title': 'x', 'abstract': 'x'}` -> {'title': {'value': 'x'}, 'abstract': 'x'})
         """
-        converter = super()._converter()
-        converter.register_unstructure_hook(Aggregations, lambda d: d.unstructure())
-        converter.register_unstructure_hook(Constraints, lambda d: d.unstructure())
-        converter.register_unstructure_hook(Extents, lambda d: d.unstructure())
-        converter.register_unstructure_hook(GraphicOverviews, lambda d: d.unstructure())
-
+        converter = Identification._converter()
         value = converter.unstructure(self)
 
         title = value.pop("title")
@@ -1,5 +1,6 @@
 from dataclasses import dataclass, field
 from datetime import UTC, date, datetime
+from functools import cache
 from typing import TypeVar
 
 import cattrs
@@ -59,6 +60,19 @@ class Metadata:
         if self.date_stamp is None:
             self.date_stamp = datetime.now(tz=UTC).date()
 
+    @staticmethod
+    @cache
+    def _converter() -> cattrs.Converter:
+        """Cattrs converter with hooks for this class, created once and shared."""
+        converter = cattrs.Converter()
+        converter.register_structure_hook(Contacts, lambda d, t: Contacts.structure(d))
+        converter.register_unstructure_hook(Contacts, lambda d: d.unstructure())
+        converter.register_structure_hook(Constraints, lambda d, t: Constraints.structure(d))
+        converter.register_unstructure_hook(Constraints, lambda d: d.unstructure())
+        converter.register_structure_hook(date, lambda d, t: date.fromisoformat(d))
+        converter.register_unstructure_hook(date, lambda d: d.isoformat())
+        return converter
+
     @classmethod
     def structure(cls: type[TMetadata], value: dict) -> Metadata:
         """
@@ -67,10 +81,7 @@ class Metadata:
         Returns a new class instance with parsed data. Intended to be used as a cattrs structure hook.
         E.g. `converter.register_structure_hook(Metadata, lambda d, t: Metadata.structure(d))`
         """
-        converter = cattrs.Converter()
-        converter.register_structure_hook(Contacts, lambda d, t: Contacts.structure(d))
-        converter.register_structure_hook(Constraints, lambda d, t: Constraints.structure(d))
-        converter.register_structure_hook(date, lambda d, t: date.fromisoformat(d))
+        converter = Metadata._converter()
         return converter.structure(value, cls)
 
     def unstructure(self) -> dict:
@@ -80,8 +91,5 @@ class Metadata:
         Intended to be used as a cattrs unstructure hook.
         E.g. `converter.register_unstructure_hook(Metadata, lambda d: d.unstructure())`
         """
-        converter = cattrs.Converter()
-        converter.register_unstructure_hook(Contacts, lambda d: d.unstructure())
-        converter.register_unstructure_hook(Constraints, lambda d: d.unstructure())
-        converter.register_unstructure_hook(date, lambda d: d.isoformat())
+        converter = Metadata._converter()
         return converter.unstructure(self)
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import cache
 from typing import TypeVar
 
 import cattrs
@@ -42,6 +43,15 @@ class ReferenceSystemInfo:
     version: str | None = None
     authority: Citation | None = None
 
+    @staticmethod
+    @cache
+    def _converter() -> cattrs.Converter:
+        """Cattrs converter with hooks for this class, created once and shared."""
+        converter = cattrs.Converter()
+        converter.register_structure_hook(Citation, lambda d, t: Citation.structure(d))
+        converter.register_unstructure_hook(Citation, lambda d: d.unstructure())
+        return converter
+
     @classmethod
     def structure(cls: type[TProjection], value: dict) -> ReferenceSystemInfo:
         """
@@ -56,8 +66,7 @@ class ReferenceSystemInfo:
             value["authority"]["contacts"] = [value["authority"]["contact"]]
             del value["authority"]["contact"]
 
-        converter = cattrs.Converter()
-        converter.register_structure_hook(Citation, lambda d, t: Citation.structure(d))
+        converter = ReferenceSystemInfo._converter()
         return converter.structure(value, cls)
 
     def unstructure(self) -> dict:
@@ -67,8 +76,7 @@ class ReferenceSystemInfo:
         Intended to be used as a cattrs unstructure hook.
         E.g. `converter.register_unstructure_hook(ReferenceSystemInfo, lambda d: d.unstructure())`
         """
-        converter = cattrs.Converter()
-        converter.register_unstructure_hook(Citation, lambda d: d.unstructure())
+        converter = ReferenceSystemInfo._converter()
         value = converter.unstructure(self)
 
         # workaround v4 schema not allowing multiple contacts
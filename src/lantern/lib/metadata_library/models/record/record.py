@@ -1,8 +1,10 @@
 import contextlib
 import json
+import logging
 from copy import deepcopy
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cache
 from hashlib import sha1
 from typing import TYPE_CHECKING, Any, TypeVar
 
@@ -12,7 +14,9 @@ from bas_metadata_library.standards.iso_19115_common.utils import _decode_date_p
 from deepdiff import DeepDiff
 from importlib_resources import as_file as resources_as_file
 from importlib_resources import files as resources_files
-from jsonschema import ValidationError, validate
+from joblib import Parallel, delayed
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 
 from lantern.lib.metadata_library.models.record.elements.data_quality import DataQuality
 from lantern.lib.metadata_library.models.record.elements.distribution import Distributions
@@ -23,8 +27,9 @@ from lantern.lib.metadata_library.models.record.enums import HierarchyLevelCode
 from lantern.lib.metadata_library.models.record.utils.clean import clean_dict
 
 if TYPE_CHECKING:
-    import logging
+    from collections.abc import Sequence
 
+    from jsonschema.protocols import Validator
 
 TRecord = TypeVar("TRecord", bound="Record")
 
@@ -92,6 +97,22 @@ class RecordSchema(Enum):
         ):
             return json.load(f)
 
+    @staticmethod
+    @cache
+    def get_validator(schema: RecordSchema) -> Validator:
+        """
+        Get JSON Schema validator for schema.
+
+        Validators are created once per schema (and process) and reused, as loading and checking schemas, and
+        resolving any references within them, is relatively expensive.
+
+        Raises a KeyError if unsupported or unknown.
+        """
+        contents = RecordSchema.get_schema_contents(schema)
+        cls = validator_for(contents)
+        cls.check_schema(contents)
+        return cls(contents)
+
 
 @dataclass(kw_only=True)
 class Record:
@@ -134,26 +155,48 @@ class Record:
 
     @property
     def sha1(self) -> str:
-        """SHA1 hash of Record configuration."""
-        return sha1(  # noqa: S324
-            json.dumps(self.dumps(strip_admin=False), indent=0, sort_keys=True, ensure_ascii=True).encode("utf-8")
-        ).hexdigest()
+        """
+        SHA1 hash of Record configuration.
+
+        Not cached, as Records (including nested elements) can be modified in place. Where the configuration is also
+        needed, use `hash_config()` with an existing `dumps(strip_admin=False)` output to avoid recreating it.
+        """
+        return self.hash_config(self.dumps(strip_admin=False))
+
+    @staticmethod
+    def hash_config(config: dict) -> str:
+        """
+        SHA1 hash of a Record configuration as returned by `dumps(strip_admin=False)`.
+
+        Configs are encoded as JSON with sorted keys and ASCII only characters so hashes are stable.
+        """
+        value = json.dumps(config, indent=0, sort_keys=True, ensure_ascii=True)
+        return sha1(value.encode("utf-8")).hexdigest()  # noqa: S324
 
     @staticmethod
     def _normalise_static_config_values(value: dict) -> dict:
-        """Adjust properties that will be set by default within a Record to allow for accurate config comparisons."""
-        normalised = deepcopy(value)
-
-        normalised["metadata"]["character_set"] = "utf8"
-        normalised["metadata"]["language"] = "eng"
-        normalised["metadata"]["metadata_standard"] = {
-            "name": "ISO 19115-2 Geographic Information - Metadata - Part 2: Extensions for Imagery and Gridded Data",
-            "version": "ISO 19115-2:2009(E)",
+        """
+        Adjust properties that will be set by default within a Record to allow for accurate config comparisons.
+
+        Only the top-level, metadata and identification dicts are copied, other values are shared with `value` and so
+        should not be modified.
+        """
+        normalised = {
+            **value,
+            "metadata": {
+                **value["metadata"],
+                "character_set": "utf8",
+                "language": "eng",
+                "metadata_standard": {
+                    "name": (
+                        "ISO 19115-2 Geographic Information - Metadata - Part 2: Extensions for Imagery and Gridded Data"
+                    ),
+                    "version": "ISO 19115-2:2009(E)",
+                },
+            },
+            "identification": {**value["identification"], "character_set": "utf8", "language": "eng"},
         }
 
-        normalised["identification"]["character_set"] = "utf8"
-        normalised["identification"]["language"] = "eng"
-
         if "$schema" in normalised and normalised["$schema"] == Record._schema:
             del normalised["$schema"]
 
@@ -168,8 +211,10 @@ class Record:
             logger.warning(
                 "Record '%s' contains unsupported content that will be ignored.", candidate.get("file_identifier")
             )
-            diff = DeepDiff(comparison, normalised, verbose_level=2)
-            logger.debug(diff.pretty(prefix="Diff: "))
+            if logger.isEnabledFor(logging.DEBUG):
+                # diffs are relatively expensive to compute so only create where they will be logged
+                diff = DeepDiff(comparison, normalised, verbose_level=2)
+                logger.debug(diff.pretty(prefix="Diff: "))
         return supported
 
     @staticmethod
@@ -181,10 +226,19 @@ class Record:
 
         Set `logger` to enable optional logging of any unsupported content as a debug message.
 
-        This method acts as a wrapper for `_check_supported` to allow easier subclassing.
+        This method acts as a wrapper for `_supported()` to allow easier subclassing.
         """
-        record = Record.loads(config)
-        return Record._eq(candidate=config, comparison=record.dumps(strip_admin=False), logger=logger)
+        return Record.loads(config)._supported(config, logger=logger)
+
+    def _supported(self, config: dict, logger: logging.Logger | None = None) -> bool:
+        """
+        Check if the record configuration this Record was loaded from is supported by this class.
+
+        I.e. that dumping this Record gives the same configuration, allowing for default/hard-coded values.
+
+        Standalone method for easier subclassing.
+        """
+        return Record._eq(candidate=config, comparison=self.dumps(strip_admin=False), logger=logger)
 
     @staticmethod
     def _pre_structure(value: dict) -> None:
@@ -213,11 +267,12 @@ class Record:
             value["data_quality"] = dq
 
     @staticmethod
+    @cache
     def _converter_up() -> cattrs.Converter:
         """
         Cattrs converter for structuring data.
 
-        Standalone method for easier subclassing.
+        Standalone method for easier subclassing. Created once and shared, so MUST NOT be modified.
         """
         converter = cattrs.Converter()
         converter.register_structure_hook(Metadata, lambda d, t: Metadata.structure(d))
@@ -242,11 +297,12 @@ class Record:
         return converter.structure(value_, cls)
 
     @staticmethod
+    @cache
     def _converter_down() -> cattrs.Converter:
         """
         Cattrs converter for unstructuring data.
 
-        Standalone method for easier subclassing.
+        Standalone method for easier subclassing. Created once and shared, so MUST NOT be modified.
         """
         converter = cattrs.Converter()
         converter.register_unstructure_hook(Metadata, lambda d: d.unstructure())
@@ -294,24 +350,25 @@ class Record:
         Set `check_supported` to True to check the configuration is fully supported by this class.
         Set `logger` to enable optional logging of any unsupported content as a debug message.
 
+        The configuration is structured once, with the resulting Record dumped for checking where needed.
+
         Kwargs included for subclasses.
         """
+        record = Record.structure(value)
         if check_supported:
-            cls._config_supported(value, logger=logger)
-
-        converter = cattrs.Converter()
-        converter.register_structure_hook(Record, lambda d, t: Record.structure(d))
-        return converter.structure(value, cls)
+            record._supported(value, logger=logger)
+        return record
 
     @staticmethod
-    def _strip_admin_meta(model: Record) -> None:
+    def _strip_admin_meta(value: dict) -> None:
         """
-        Remove any administration metadata element included in a record.
+        Remove any administration metadata element included in a dumped record.
 
         Can't use get/set_kv due to circular import.
-        If admin metadata was the only KV item, supplemental_information is set to None rather than an empty dict.
+        If admin metadata was the only KV item, supplemental_information is removed rather than set to an empty dict.
         """
-        sinfo = model.identification.supplemental_information
+        identification = value.get("identification", {})
+        sinfo = identification.get("supplemental_information")
         if sinfo is None:
             return
         try:
@@ -322,62 +379,72 @@ class Record:
             return
         kv.pop("admin_metadata", None)
         if len(kv) == 0:
-            model.identification.supplemental_information = None
+            del identification["supplemental_information"]
             return
-        model.identification.supplemental_information = json.dumps(kv)
+        identification["supplemental_information"] = json.dumps(kv)
 
     @staticmethod
-    def _strip_admin_conformance(model: Record) -> None:
-        """Remove any administration profile domain conformance element included in a record."""
+    def _strip_admin_conformance(value: dict) -> None:
+        """Remove any administration profile domain conformance element included in a dumped record."""
         check_url = "https://metadata-standards.data.bas.ac.uk/profiles/magic-administration/"  # non-versioned
-        for idx, dc in enumerate(model.data_quality.domain_consistency):
-            if not dc.specification or not dc.specification.href:
-                continue
-            if check_url not in dc.specification.href:
-                continue
-            model.data_quality.domain_consistency.pop(idx)
+        identification = value.get("identification", {})
+        if "domain_consistency" not in identification:
+            return
+        domain_consistency = [
+            dc
+            for dc in identification["domain_consistency"]
+            if check_url not in dc.get("specification", {}).get("title", {}).get("href", "")
+        ]
+        if len(domain_consistency) == 0:
+            del identification["domain_consistency"]
+            return
+        identification["domain_consistency"] = domain_consistency
 
     @staticmethod
-    def _strip_admin(model: Record) -> None:
-        """Remove any administration metadata and associated domain conformance included in a record."""
-        Record._strip_admin_meta(model)
-        Record._strip_admin_conformance(model)
+    def _strip_admin(value: dict) -> None:
+        """
+        Remove any administration metadata and associated domain conformance included in a dumped record.
+
+        Applied to the output of `unstructure()` (where data quality elements are within identification), which is not
+        shared with the record instance, so no copy of the record is needed.
+        """
+        Record._strip_admin_meta(value)
+        Record._strip_admin_conformance(value)
 
     def dumps(self, strip_admin: bool = True) -> dict:
         """
         Export Record as a dict with plain, JSON safe, types.
 
         If `strip_admin` is true, any administration metadata and associated domain conformance included are removed.
-        Where used, a copy of the record instance is made to avoid modifying the original record.
         """
-        model = self
+        value = self.unstructure()
         if strip_admin:
-            model = deepcopy(self)
-            self._strip_admin(model)
-
-        converter = cattrs.Converter()
-        converter.register_unstructure_hook(Record, lambda d: d.unstructure())
-        return converter.unstructure(model)
+            self._strip_admin(value)
+        return value
 
-    def dumps_json(self, strip_admin: bool = True) -> str:
+    def dumps_json(self, strip_admin: bool = True, data: dict | None = None) -> str:
         """
         Export Record as JSON Schema instance string.
 
         Note: Indentation is automatically enabled.
 
         If `strip_admin` is true, any administration metadata and associated domain conformance included are removed.
+
+        An existing output from `dumps()` can be given as `data` to avoid recreating it (`strip_admin` is then ignored).
         """
-        return json.dumps(
-            {"$schema": self._schema, **self.dumps(strip_admin=strip_admin)}, indent=2, ensure_ascii=False
-        )
+        data = data if data is not None else self.dumps(strip_admin=strip_admin)
+        return json.dumps({"$schema": self._schema, **data}, indent=2, ensure_ascii=False)
 
-    def dumps_xml(self, strip_admin: bool = True) -> str:
+    def dumps_xml(self, strip_admin: bool = True, data: dict | None = None) -> str:
         """
         Export Record as an ISO 19115 XML document using the BAS Metadata Library.
 
         If `strip_admin` is true, any administration metadata and associated domain conformance included are removed.
+
+        An existing output from `dumps()` can be given as `data` to avoid recreating it (`strip_admin` is then ignored).
         """
-        config = MetadataRecordConfigV4(**_decode_date_properties(self.dumps(strip_admin=strip_admin)))
+        data = data if data is not None else self.dumps(strip_admin=strip_admin)
+        config = MetadataRecordConfigV4(**_decode_date_properties(_copy_date_containers(data)))
         record = MetadataRecord(configuration=config)
         return record.generate_xml_document().decode()
 
@@ -395,15 +462,15 @@ class Record:
 
     def _get_validation_schemas(
         self, use_profiles: bool = True, force_schemas: list[RecordSchema] | None = None
-    ) -> list[dict]:
-        """Get contents of selected validation schemas."""
+    ) -> list[RecordSchema]:
+        """Get selected validation schemas."""
         selected_schemas = [RecordSchema.ISO_2_V4]
         if use_profiles:
             selected_schemas.extend(self._profile_schemas)
         if force_schemas is not None:
             selected_schemas = force_schemas
 
-        return [RecordSchema.get_schema_contents(schema) for schema in selected_schemas]
+        return selected_schemas
 
     def validate(self, use_profiles: bool = True, force_schemas: list[RecordSchema] | None = None) -> None:
         """
@@ -420,7 +487,83 @@ class Record:
         schemas = self._get_validation_schemas(use_profiles=use_profiles, force_schemas=force_schemas)
 
         for schema in schemas:
-            try:
-                validate(instance=config, schema=schema)
-            except ValidationError as e:
-                raise RecordInvalidError(e) from e
+            error = best_match(RecordSchema.get_validator(schema).iter_errors(config))
+            if error is not None:
+                raise RecordInvalidError(error) from error
+
+    @staticmethod
+    def validate_many(
+        records: Sequence[Record], use_profiles: bool = True, parallel_jobs: int = 1
+    ) -> list[RecordInvalidError | None]:
+        """
+        Validate multiple Records, optionally in parallel.
+
+        Each Record is validated using its own `validate()` method, so any subclass specific checks are included.
+
+        Unlike `validate()`, errors are returned rather than raised, as a list of `RecordInvalidError` exceptions, or
+        `None` for valid records, in the same order as `records`.
+
+        Validation errors can't be pickled, so in parallel only whether each Record is valid is determined, with any
+        invalid Records validated again afterwards to get errors.
+        """
+        if parallel_jobs == 1:
+            return [_validation_error(record, use_profiles) for record in records]
+
+        valid = Parallel(n_jobs=parallel_jobs)(delayed(_is_valid)(record, use_profiles) for record in records)
+        return [
+            None if is_valid else _validation_error(record, use_profiles)
+            for record, is_valid in zip(records, valid, strict=True)
+        ]
+
+
+def _validation_error(record: Record, use_profiles: bool) -> RecordInvalidError | None:
+    """Validate a Record, returning rather than raising any validation error."""
+    try:
+        record.validate(use_profiles=use_profiles)
+    except RecordInvalidError as e:
+        return e
+    return None
+
+
+def _is_valid(record: Record, use_profiles: bool) -> bool:
+    """
+    Check whether a Record is valid.
+
+    Standalone function for use in parallel processing.
+    """
+    return _validation_error(record, use_profiles) is None
+
+
+_DATE_KEYS = {"date_stamp", "date", "dates", "period"}
+
+
+def _copy_containers(value: Any) -> Any:  # noqa: ANN401
+    """Copy dicts and lists in a value, sharing (immutable) leaf values."""
+    if isinstance(value, dict):
+        return {key: _copy_containers(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_containers(item) for item in value]
+    return value
+
+
+def _copy_date_containers(value: Any) -> Any:  # noqa: ANN401
+    """
+    Copy only the parts of a record config modified when decoding date properties, sharing all others.
+
+    `_decode_date_properties()` replaces date strings in place, within dicts holding, or under, date keys. Only these
+    dicts, and those containing them, are copied so the original config is not modified, rather than the whole config.
+    """
+    if isinstance(value, list):
+        items = [_copy_date_containers(item) for item in value]
+        return items if any(item_ is not item for item_, item in zip(items, value, strict=True)) else value
+    if not isinstance(value, dict):
+        return value
+
+    copied: dict | None = None
+    for key, item in value.items():
+        item_ = _copy_containers(item) if key in _DATE_KEYS else _copy_date_containers(item)
+        if copied is None and (key in _DATE_KEYS or item_ is not item):
+            copied = dict(value)
+        if copied is not None:
+            copied[key] = item_
+    return value if copied is None else copied
@@ -0,0 +1,12 @@
+import cattrs
+
+CONVERTER = cattrs.Converter()
+"""
+Shared cattrs converter without custom hooks.
+
+For Record elements using default (un)structuring, such as lists of simple items. Elements needing custom hooks use a
+cached converter of their own (conventionally a `_converter()` class or static method).
+
+Converters are relatively expensive to create and generate (un)structure functions for each class on first use, which
+are only reused if the converter is. This converter MUST NOT be modified (e.g. by registering hooks) as it is shared.
+"""
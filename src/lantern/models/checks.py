@@ -1,5 +1,7 @@
+import json
 from dataclasses import dataclass
 from enum import Enum
+from hashlib import sha1
 from http import HTTPMethod, HTTPStatus
 from typing import TYPE_CHECKING, Final
 
@@ -82,6 +84,7 @@ class Check:
     - duration: duration of check processing as measured by `time`
     - result_http_status: HTTP status of check, compared against expected status
     - result_output: output of check, for reporting/troubleshooting
+    - cached: whether results were reused from a previous check (see `lantern.checks.CheckCache`) rather than fetched
     """
 
     type: CheckType
@@ -97,6 +100,7 @@ class Check:
     duration: float = 0.0
     result_http_status: HTTPStatus | None = None
     result_output: str | None = None
+    cached: bool = False
 
     @classmethod
     def from_site_content(cls, content: SiteContent, check_type: CheckType, base_url: str) -> Check:
@@ -113,6 +117,54 @@ class Check:
             file_identifier=content.object_meta.get("file_identifier"),
         )
 
+    @property
+    def key(self) -> str:
+        """
+        Key for the properties of a check that determine its result.
+
+        Checks with the same key make equivalent requests (e.g. for a resource shared by many Records) and so will have
+        the same result, other than attribution (i.e. file identifier).
+
+        Must be calculated before a check is run, as some check methods update check properties (e.g. HTTP method).
+        """
+        props = json.dumps(
+            [
+                self.type.value,
+                self.url,
+                self.http_method.value,
+                self.http_status.value,
+                self.content_length,
+                self.redirect_location,
+            ]
+        )
+        return sha1(props.encode("utf-8")).hexdigest()  # noqa: S324
+
+    @classmethod
+    def structure(cls, value: dict) -> Check:
+        """
+        Create from plain types.
+
+        Inverse of `unstructure()`, except any HTTP authentication, which is not included.
+
+        Example input: {'type': 'Site Pages', 'url': 'x', ..., 'http_auth': '[**REDACTED**]'}
+        Example output: Check(type=CheckType.SITE_PAGES, url='x', ..., http_auth=None)
+        """
+        result_http_status = value.get("result_http_status")
+        return cls(
+            type=CheckType(value["type"]),
+            url=value["url"],
+            http_method=HTTPMethod(value["http_method"]),
+            http_status=HTTPStatus(value["http_status"]),
+            content_length=value.get("content_length"),
+            redirect_location=value.get("redirect_location"),
+            file_identifier=value.get("file_identifier"),
+            state=CheckState(value["state"]),
+            duration=value.get("duration", 0.0),
+            result_http_status=HTTPStatus(result_http_status) if result_http_status is not None else None,
+            result_output=value.get("result_output"),
+            cached=value.get("cached", False),
+        )
+
     def unstructure(self) -> dict:
         """
         Convert to plain types.
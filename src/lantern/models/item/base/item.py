@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from lantern.lib.metadata_library.models.record.elements.common import (
@@ -35,6 +36,60 @@ if TYPE_CHECKING:
     )
     from lantern.models.record.record import Record
 
+_ADMIN_METADATA_CACHE: dict[
+    tuple[str | None, str | None, str | None], tuple[AdminMetadataKeys, AdministrationMetadata | None]
+] = {}
+ADMIN_METADATA_CACHE_SIZE = 10_000
+
+
+def _same_keys(a: AdminMetadataKeys, b: AdminMetadataKeys) -> bool:
+    """
+    Whether administrative metadata keys are the same instance or have equal values.
+
+    Optional keys (e.g. the signing private key) are equal only where both are unset, as JWKs cannot be compared to None.
+    """
+    if a is b:
+        return True
+    pairs = [
+        (a.encryption_private, b.encryption_private),
+        (a.signing_public, b.signing_public),
+        (a.signing_private, b.signing_private),
+    ]
+    return all(x is y if x is None or y is None else x == y for x, y in pairs)
+
+
+def get_admin_cached(keys: AdminMetadataKeys, record: Record | RecordRevision) -> AdministrationMetadata | None:
+    """
+    Get administrative metadata for record, reusing previously decrypted values where possible.
+
+    Decrypting and verifying administrative metadata is relatively expensive and may be repeated many times for the
+    same record (e.g. as a summary for each related item). Decrypted values are cached per process, keyed by file
+    identifier, revision and encoded administrative metadata (so changed values are not missed), for equal keys.
+
+    Keys are compared by value, as keys are typically unpickled separately for each batch of parallel jobs.
+
+    Cached values are shared and MUST NOT be modified. Oldest values are evicted once the cache is full.
+    """
+    key = (
+        record.file_identifier,
+        record.file_revision if isinstance(record, RecordRevision) else None,
+        record.identification.supplemental_information,
+    )
+    cached = _ADMIN_METADATA_CACHE.get(key)
+    if cached is not None and _same_keys(cached[0], keys):
+        return cached[1]
+
+    admin_meta = get_admin(keys=keys, record=record)
+    if len(_ADMIN_METADATA_CACHE) >= ADMIN_METADATA_CACHE_SIZE:
+        del _ADMIN_METADATA_CACHE[next(iter(_ADMIN_METADATA_CACHE))]
+    _ADMIN_METADATA_CACHE[key] = (keys, admin_meta)
+    return admin_meta
+
+
+def clear_admin_cache() -> None:
+    """Clear cached administrative metadata."""
+    _ADMIN_METADATA_CACHE.clear()
+
 
 class ItemCore:
     """
@@ -45,6 +100,9 @@ class ItemCore:
     Includes methods to access administrative metadata, if defined and encryption.signing keys are set via the
     `admin_keys` argument. Properties for administrative metadata elements can be accessed from the `admin_metadata`
     property, which is cached on first access unless the underlying record changes.
+
+    Subclasses MAY memoise derived properties using `functools.cached_property`. These are cleared whenever the
+    underlying record changes.
     """
 
     def __init__(self, record: Record | RecordRevision, admin_keys: AdminMetadataKeys | None = None) -> None:
@@ -72,22 +130,31 @@ class ItemCore:
         """
         Update underlying Record(Revision).
 
-        Clears cached admin metadata to ensure it reflects the new record.
+        Clears cached admin metadata and any memoised properties to ensure they reflect the new record.
         """
         self._record = value
         self._admin_metadata = None
+        self._clear_cached_properties()
+
+    def _clear_cached_properties(self) -> None:
+        """Clear any memoised (`functools.cached_property`) property values."""
+        for cls in type(self).__mro__:
+            for name, attr in vars(cls).items():
+                if isinstance(attr, cached_property):
+                    self.__dict__.pop(name, None)
 
     @property
     def admin_metadata(self) -> AdministrationMetadata | None:
         """
         Optional administrative metadata.
 
-        If present, value is decrypted and verified on first access.
+        If present, value is decrypted and verified on first access, or reused from a previously decrypted value for
+        the same record revision (see `get_admin_cached()`).
         """
         if self._admin_keys is None:
             return None
         if self._admin_metadata is None:
-            self._admin_metadata = get_admin(keys=self._admin_keys, record=self.record)
+            self._admin_metadata = get_admin_cached(keys=self._admin_keys, record=self.record)
         return self._admin_metadata
 
     @property
@@ -1,5 +1,9 @@
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
 from lxml import html as lhtml
-from markdown import Markdown, markdown
+from markdown import Markdown
 from markdown_gfm_admonition import GfmAdmonitionExtension
 from markupsafe import Markup
 
@@ -7,30 +11,58 @@ from lantern.lib.markdown.extensions.links import LinkifyExtension
 from lantern.lib.markdown.extensions.prepend_new_line import PrependNewLineExtension
 from lantern.lib.markdown.formats.plaintext import PlainTextExtension
 
+if TYPE_CHECKING:
+    from functools import _CacheInfo
+
+MD_CACHE_SIZE = 4096
+_converters = threading.local()
+
+
+def _html_converter() -> Markdown:
+    """
+    Markdown to HTML converter.
+
+    Converters are created once per thread (and so per process) and reset before each use, as creating a Markdown
+    instance and its extensions is relatively expensive.
+    """
+    if not hasattr(_converters, "html"):
+        _converters.html = Markdown(
+            output_format="html",
+            extensions=[
+                "tables",
+                "admonition",
+                GfmAdmonitionExtension(),
+                PrependNewLineExtension(),
+                LinkifyExtension(),
+            ],
+        )
+    return _converters.html.reset()
+
+
+def _plain_converter() -> Markdown:
+    """
+    Markdown to plain text converter.
+
+    See `_html_converter()` for details.
+    """
+    if not hasattr(_converters, "plain"):
+        _converters.plain = Markdown(extensions=[PlainTextExtension()])
+    return _converters.plain.reset()
+
 
+@lru_cache(maxsize=MD_CACHE_SIZE)
 def md_as_html(string: str) -> str:
     """
     Encode string with possible Markdown as HTML.
 
     At a minimum the string will be returned as a paragraph.
+
+    Results are cached by input (see `md_cache_info()`).
     """
-    return str(
-        Markup(  # noqa: S704
-            markdown(
-                string,
-                output_format="html",
-                extensions=[
-                    "tables",
-                    "admonition",
-                    GfmAdmonitionExtension(),
-                    PrependNewLineExtension(),
-                    LinkifyExtension(),
-                ],
-            )
-        )
-    )
+    return str(Markup(_html_converter().convert(string)))  # noqa: S704
 
 
+@lru_cache(maxsize=MD_CACHE_SIZE)
 def md_as_html_unwrapped(string: str) -> str:
     """
     Encode string with possible Markdown as HTML, without wrapping paragraph tags.
@@ -38,6 +70,8 @@ def md_as_html_unwrapped(string: str) -> str:
     Applies to outer tags only. I.e. '<div><p>...</p></div>' will not be modified.
 
     At a minimum returns an empty string.
+
+    Results are cached by input (see `md_cache_info()`).
     """
     doc = lhtml.fromstring(md_as_html(string))
 
@@ -53,10 +87,25 @@ def md_as_html_unwrapped(string: str) -> str:
     return lhtml.tostring(doc, encoding="unicode", method="html")
 
 
+@lru_cache(maxsize=MD_CACHE_SIZE)
 def md_as_plain(string: str | None) -> str:
-    """Strip possible Markdown formatting from a string."""
+    """
+    Strip possible Markdown formatting from a string.
+
+    Results are cached by input (see `md_cache_info()`).
+    """
     if string is None:
         return ""
 
-    md = Markdown(extensions=[PlainTextExtension()])
-    return md.convert(string)
+    return _plain_converter().convert(string)
+
+
+def md_cache_info() -> dict[str, _CacheInfo]:
+    """Cache statistics (hits, misses, size) for Markdown conversions, for profiling."""
+    return {func.__name__: func.cache_info() for func in (md_as_html, md_as_html_unwrapped, md_as_plain)}
+
+
+def md_cache_clear() -> None:
+    """Clear cached Markdown conversions."""
+    for func in (md_as_html, md_as_html_unwrapped, md_as_plain):
+        func.cache_clear()
@@ -1,4 +1,5 @@
 import json
+from functools import cached_property
 from json import JSONDecodeError
 from typing import TYPE_CHECKING, Any
 
@@ -163,7 +164,7 @@ class ItemCataloguePhysicalMap(ItemCatalogue):
             > 0
         )
 
-    @property
+    @cached_property
     def _sides(self) -> list[RecordRevision]:
         """Records that make up the sides/pages of a physical map."""
         side_identifiers = self.record.identification.aggregations.filter(
@@ -172,7 +173,7 @@ class ItemCataloguePhysicalMap(ItemCatalogue):
         )
         return [self._select_record(side_identifier.identifier.identifier) for side_identifier in side_identifiers]
 
-    @property
+    @cached_property
     def _extent(self) -> ExtentTab:
         """
         Extent tab.
@@ -195,7 +196,7 @@ class ItemCataloguePhysicalMap(ItemCatalogue):
 
         return ExtentTab(extents=extents)
 
-    @property
+    @cached_property
     def _additional_info(self) -> AdditionalInfoTab:
         """
         Additional info tab.
@@ -1,6 +1,7 @@
 import json
 import locale
 from abc import ABC, abstractmethod
+from functools import cached_property
 from typing import TYPE_CHECKING, cast
 
 from lantern.lib.metadata_library.models.record.elements.common import Constraint, Date, Identifier, Series
@@ -296,7 +297,7 @@ class LicenceTab(Tab):
         """Tab icon class."""
         return "fa-regular fa-file-certificate"
 
-    @property
+    @cached_property
     def copyright_holders(self) -> list[Link | str]:
         """
         Copyright/rights holders.
@@ -812,7 +813,7 @@ class AdminTab(Tab):
         """Link to record revision if known."""
         return self._revision
 
-    @property
+    @cached_property
     def gitlab_issues(self) -> list[Link]:
         """GitLab issue references if set."""
         return [
@@ -829,7 +830,7 @@ class AdminTab(Tab):
         """Base item metadata access level."""
         return self._metadata_access.name
 
-    @property
+    @cached_property
     def metadata_permissions(self) -> list[str]:
         """
         Metadata access permissions if set.
@@ -845,7 +846,7 @@ class AdminTab(Tab):
         """Base item resource access level."""
         return self._resource_access.name
 
-    @property
+    @cached_property
     def resource_permissions(self) -> list[str]:
         """
         Resource access permissions if set.
@@ -0,0 +1,169 @@
+import json
+from hashlib import sha1
+from pathlib import Path
+from typing import TYPE_CHECKING, TypedDict
+
+from lantern.models.site import SiteRedirect
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from lantern.models.site import SiteContent
+
+
+class SiteManifestContent(TypedDict):
+    """Manifest entry for a content item."""
+
+    sha1: str
+    output: str
+    file_identifier: str | None
+    redirect: str | None
+
+
+class SiteManifest:
+    """
+    Site build manifest.
+
+    Records what was last exported to a site to allow for incremental builds:
+    - `records`: a fingerprint per record (file identifier) and output of the inputs used to generate its content
+    - `content`: a hash per content item (path), the output that generated it and, for record content, the file
+      identifier it relates to
+
+    Where a record's fingerprint is unchanged, its content does not need to be generated again. Where a content item's
+    hash is unchanged, it does not need to be exported again.
+
+    Redirects are included in content entries so that a complete set of redirects can be returned when only some
+    content is generated (e.g. for the `RedirectsOutput`).
+
+    Outputs are tracked by name so that builds limited to some outputs only replace entries for those outputs.
+
+    Manifests are loaded from and dumped to a JSON file. They should be dumped only after content has been exported.
+
+    If `full` is set, existing entries are not used to skip generating or exporting content, forcing a full rebuild.
+    Existing entries are still kept (e.g. for redirects of records not selected) and replaced as content is generated.
+    Paths of content whose hash is unchanged are tracked in `unchanged_content`, so that exporters can confirm these
+    items are held by their target rather than exporting them again (see `S3Exporter`).
+    """
+
+    def __init__(self, path: Path, full: bool = False) -> None:
+        self._path = path
+        self._full = full
+        self.records: dict[str, dict[str, str]] = {}
+        self.content: dict[str, SiteManifestContent] = {}
+        self.unchanged_content: set[str] = set()
+
+        if self._path.exists():
+            with self._path.open() as f:
+                data = json.load(f)
+            self.records = data["records"]
+            self.content = data["content"]
+
+    def __len__(self) -> int:
+        """Number of content items in manifest."""
+        return len(self.content)
+
+    @property
+    def path(self) -> Path:
+        """Path to manifest file."""
+        return self._path
+
+    @staticmethod
+    def content_hash(item: SiteContent) -> str:
+        """
+        Hash of a content item.
+
+        Includes properties used when exporting content (e.g. S3 metadata) in addition to the content itself.
+        """
+        content = item.content.encode("utf-8") if isinstance(item.content, str) else item.content
+        props = json.dumps(
+            {
+                "media_type": item.media_type,
+                "object_meta": item.object_meta,
+                "redirect": item.redirect,
+                "prevent_caching": item.prevent_caching,
+            },
+            sort_keys=True,
+        ).encode("utf-8")
+        return sha1(props + content).hexdigest()  # noqa: S324
+
+    def unchanged(self, file_identifier: str, fingerprint: str, outputs: list[str]) -> bool:
+        """Whether a record's fingerprint matches the manifest for each of a set of outputs."""
+        if self._full:
+            return False
+        fingerprints = self.records.get(file_identifier, {})
+        return all(fingerprints.get(output) == fingerprint for output in outputs)
+
+    def prune(self, file_identifiers: set[str]) -> None:
+        """Remove records, and their content, not in a set of file identifiers (i.e. deleted records)."""
+        for file_identifier in set(self.records) - file_identifiers:
+            del self.records[file_identifier]
+        self.content = {
+            path: entry
+            for path, entry in self.content.items()
+            if entry["file_identifier"] is None or entry["file_identifier"] in file_identifiers
+        }
+
+    def update(
+        self, content: Iterable[tuple[str, SiteContent]], fingerprints: dict[str, str], outputs: list[str]
+    ) -> list[SiteContent]:
+        """
+        Update manifest from generated content and record fingerprints.
+
+        Content is given as (output name, content item) pairs. `outputs` are the names of the individual outputs
+        content was generated for, for records in `fingerprints`.
+
+        Where content has been regenerated for a record, any previous content for the record from these outputs not
+        included (e.g. a removed alias) is removed from the manifest. Content from other outputs is kept.
+
+        Returns new or changed content items.
+        """
+        return list(self.iter_update(content=content, fingerprints=fingerprints, outputs=outputs))
+
+    def iter_update(
+        self, content: Iterable[tuple[str, SiteContent]], fingerprints: dict[str, str], outputs: list[str]
+    ) -> Iterator[SiteContent]:
+        """
+        Lazily update manifest from generated content and record fingerprints.
+
+        As `update()` but content is processed, and new or changed content items yielded, as it is generated. The
+        manifest is only complete once all content has been consumed.
+        """
+        previous_content = self.content
+        self.content = {
+            path: entry
+            for path, entry in previous_content.items()
+            if entry["file_identifier"] not in fingerprints or entry["output"] not in outputs
+        }
+        for file_identifier, fingerprint in fingerprints.items():
+            self.records.setdefault(file_identifier, {}).update(dict.fromkeys(outputs, fingerprint))
+
+        for output, item in content:
+            path = str(item.path)
+            previous = previous_content.get(path, None)
+            entry: SiteManifestContent = {
+                "sha1": self.content_hash(item),
+                "output": output,
+                "file_identifier": item.object_meta.get("file_identifier", None),
+                "redirect": item.redirect,
+            }
+            self.content[path] = entry
+            if previous is None or previous["sha1"] != entry["sha1"]:
+                yield item
+            elif self._full:
+                self.unchanged_content.add(path)
+                yield item
+
+    @property
+    def redirects(self) -> list[SiteRedirect]:
+        """All redirects in manifest, including those for content not generated in the current build."""
+        return [
+            SiteRedirect(path=Path(path), target=entry["redirect"])
+            for path, entry in self.content.items()
+            if entry["redirect"]
+        ]
+
+    def dump(self) -> None:
+        """Save manifest to file."""
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with self._path.open("w") as f:
+            json.dump({"records": self.records, "content": self.content}, f, indent=2, sort_keys=True)
@@ -3,8 +3,6 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, TypeVar
 from uuid import UUID
 
-import cattrs
-
 from lantern.lib.metadata_library.models.record.enums import ContactRoleCode, HierarchyLevelCode
 from lantern.lib.metadata_library.models.record.record import Record as RecordBase
 from lantern.lib.metadata_library.models.record.record import RecordInvalidError, RecordSchema
@@ -67,12 +65,10 @@ class Record(RecordBase):
 
         See the parent class for details on other parameters.
         """
+        record = cls.structure(value)
         if check_supported:
-            cls._config_supported(value, logger=logger)
-
-        converter = cattrs.Converter()
-        converter.register_structure_hook(Record, lambda d, t: cls.structure(d))
-        return converter.structure(value, cls)
+            record._supported(value, logger=logger)
+        return record
 
     def _validate_file_identifier(self) -> None:
         """Verify resource file identifier."""
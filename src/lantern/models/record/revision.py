@@ -2,8 +2,6 @@ from copy import deepcopy
 from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any, TypeVar
 
-import cattrs
-
 from lantern.lib.metadata_library.models.record.utils.clean import clean_dict
 from lantern.models.record.record import Record
 
@@ -47,10 +45,15 @@ class RecordRevision(Record):
 
         Set `logger` to enable optional logging of any unsupported content as a debug message.
         """
-        record = RecordRevision.loads(config)
-        return Record._eq(
-            candidate=config, comparison=record.dumps(strip_admin=False, with_revision=True), logger=logger
-        )
+        return RecordRevision.loads(config)._supported(config, logger=logger)
+
+    def _supported(self, config: dict, logger: logging.Logger | None = None) -> bool:
+        """
+        Check if the record configuration this Record Revision was loaded from is supported by this class.
+
+        Includes the file revision, which is excluded by default when dumping.
+        """
+        return Record._eq(candidate=config, comparison=self.dumps(strip_admin=False, with_revision=True), logger=logger)
 
     @classmethod
     def structure(cls: type[TRecordRevision], value: dict) -> RecordRevision:
@@ -90,30 +93,22 @@ class RecordRevision(Record):
 
         See the parent class for details on other parameters.
         """
+        record = cls.structure(value)
         if check_supported:
-            cls._config_supported(value, logger=logger)
-
-        converter = cattrs.Converter()
-        converter.register_structure_hook(RecordRevision, lambda d, t: cls.structure(d))
-        return converter.structure(value, cls)
+            record._supported(value, logger=logger)
+        return record
 
     def dumps(self, strip_admin: bool = True, with_revision: bool = False) -> dict:
         """
         Export Record Revision as a dict with plain, JSON safe, types.
 
         If `strip_admin` is true, any administrative metadata instance included in the record is removed.
-        If true, the record instance needs to be cloned to avoid modifying the original.
 
         `with_revision` is false by default for compatibility with `dumps_xml()`, `validate()`, etc. from parent class.
         """
-        model = self
+        data = self.unstructure()
         if strip_admin:
-            model = deepcopy(self)
-            self._strip_admin(model)
-
-        converter = cattrs.Converter()
-        converter.register_unstructure_hook(RecordRevision, lambda d: d.unstructure())
-        data = converter.unstructure(model)
+            self._strip_admin(data)
 
         if not with_revision:
             data.pop("file_revision", None)
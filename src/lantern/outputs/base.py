@@ -1,15 +1,19 @@
 from abc import ABC, abstractmethod
+from functools import cached_property
 from typing import TYPE_CHECKING
 
+from lxml import etree
+
 from lantern.models.checks import Check, CheckType
 from lantern.utils import get_jinja_env
 
 if TYPE_CHECKING:
     import logging
+    from collections.abc import Iterable
 
     from lantern.models.record.revision import RecordRevision
     from lantern.models.site import ExportMeta, SiteContent
-    from lantern.stores.base import SelectRecordsProtocol
+    from lantern.stores.base import IterRecordsProtocol, SelectRecordsProtocol
 
 
 class OutputBase(ABC):
@@ -96,19 +100,81 @@ class OutputSite(OutputBase, ABC):
         self._jinja = get_jinja_env()
 
 
+class OutputRecordContext:
+    """
+    Shared intermediate representations of a record for use across record outputs.
+
+    Representations are generated on first use and then reused, to avoid regenerating them for each output (and action)
+    processing the same record (e.g. the record as XML is needed for both ISO XML and ISO HTML outputs).
+
+    Records MUST NOT be modified after a representation has been generated.
+    """
+
+    def __init__(self, record: RecordRevision, strip_admin: bool) -> None:
+        self._record = record
+        self._strip_admin = strip_admin
+
+    @property
+    def strip_admin(self) -> bool:
+        """Whether administration metadata is removed from representations."""
+        return self._strip_admin
+
+    @cached_property
+    def data(self) -> dict:
+        """Record as a dict with plain, JSON safe, types."""
+        return self._record.dumps(strip_admin=self._strip_admin)
+
+    @cached_property
+    def json(self) -> str:
+        """Record as BAS ISO JSON."""
+        return self._record.dumps_json(data=self.data)
+
+    @cached_property
+    def xml(self) -> str:
+        """Record as ISO 19139 XML."""
+        return self._record.dumps_xml(data=self.data)
+
+    @cached_property
+    def xml_doc(self) -> etree._ElementTree:
+        """Record as a parsed ISO 19139 XML document."""
+        return etree.ElementTree(etree.fromstring(self.xml.encode()))
+
+
 class OutputRecord(OutputBase, ABC):
-    """Outputs relating to processing a target record."""
+    """
+    Outputs relating to processing a target record.
+
+    An OutputRecordContext can be provided to share record representations with other outputs for the same record.
+    """
 
     def __init__(
-        self, logger: logging.Logger, meta: ExportMeta, name: str, check_type: CheckType, record: RecordRevision
+        self,
+        logger: logging.Logger,
+        meta: ExportMeta,
+        name: str,
+        check_type: CheckType,
+        record: RecordRevision,
+        context: OutputRecordContext | None = None,
     ) -> None:
         super().__init__(logger=logger, meta=meta, name=name, check_type=check_type)
         self._record = record
         self._strip_admin = not self._meta.trusted
+        self._context_ = context
+
+    @property
+    def _context(self) -> OutputRecordContext:
+        """Shared record representations, created on first use if not provided."""
+        if self._context_ is None or self._context_.strip_admin != self._strip_admin:
+            self._context_ = OutputRecordContext(record=self._record, strip_admin=self._strip_admin)
+        return self._context_
 
 
 class OutputRecords(OutputBase, ABC):
-    """Outputs relating to processing multiple records."""
+    """
+    Outputs relating to processing multiple records.
+
+    Where given, `iter_records` is used to load records lazily (to limit memory use), rather than `select_records`.
+    """
 
     def __init__(
         self,
@@ -117,6 +183,14 @@ class OutputRecords(OutputBase, ABC):
         name: str,
         check_type: CheckType,
         select_records: SelectRecordsProtocol,
+        iter_records: IterRecordsProtocol | None = None,
     ) -> None:
         super().__init__(logger=logger, meta=meta, name=name, check_type=check_type)
         self._select_records = select_records
+        self._iter_records = iter_records
+
+    def _records(self) -> Iterable[RecordRevision]:
+        """All records, loaded lazily if supported."""
+        if self._iter_records is not None:
+            return self._iter_records()
+        return self._select_records()
@@ -19,12 +19,20 @@ class ChecksOutput(OutputSite):
 
     Processes a set of completed checks into a report with calculated statistics and overall result.
 
+    Checks with results reused from a previous run (see `lantern.checks.CheckCache`) are counted and marked as cached.
+
+    Optionally, the file revision of each record checked can be included in the data file, to allow for incremental
+    checks (see `lantern.checks.CheckHistory`).
+
     Generates a formatted page for manual review and data file for automatic review and/or further processing.
     """
 
-    def __init__(self, logger: logging.Logger, meta: ExportMeta, checks: list[Check]) -> None:
+    def __init__(
+        self, logger: logging.Logger, meta: ExportMeta, checks: list[Check], revisions: dict[str, str] | None = None
+    ) -> None:
         super().__init__(logger=logger, meta=meta, name="Site Index", check_type=CheckType.NONE)
         self._checks = checks
+        self._revisions = revisions or {}
         self._template_path = "_views/-/checks.html.j2"
 
         self._site_types = [
@@ -99,6 +107,8 @@ class ChecksOutput(OutputSite):
             "duration": duration,
             "pass_fail": pass_fail,
             "stats": {label.value: value for label, value in stats.items() if label != CheckState.PENDING},
+            "cached": sum(check.cached for check in self._checks),
+            "revisions": self._revisions,
             "site_checks": converter.unstructure(site_checks),
             "resource_checks": converter.unstructure(resource_checks),
         }
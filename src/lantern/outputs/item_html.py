@@ -1,3 +1,4 @@
+from functools import cached_property
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -50,8 +51,9 @@ class ItemCatalogueOutput(OutputRecord):
             return ItemCataloguePhysicalMap
         return ItemCatalogue
 
-    @property
+    @cached_property
     def _item(self) -> ItemCatalogue:
+        """Item for record, reused for content and content properties."""
         item_class = self._item_class()
         return item_class(
             site_meta=self._meta.site_metadata,
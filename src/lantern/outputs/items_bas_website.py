@@ -11,9 +11,10 @@ from lantern.outputs.base import OutputRecords
 
 if TYPE_CHECKING:
     import logging
+    from collections.abc import Iterable
 
     from lantern.models.record.revision import RecordRevision
-    from lantern.stores.base import SelectRecordsProtocol
+    from lantern.stores.base import IterRecordsProtocol, SelectRecordsProtocol, SupersededIdsProtocol
 
 
 class ItemsBasWebsiteOutput(OutputRecords):
@@ -35,24 +36,35 @@ class ItemsBasWebsiteOutput(OutputRecords):
         1. open access (based on an `unrestricted` resource permissions)
         2. not superseded by another Item (based on not being the target of any `RevisionOf` aggregations)
 
-    Note: This second filtering condition is not implemented efficiently as it requires a reverse lookup.
+    The second filtering condition requires a reverse lookup. Where available, a `superseded_ids` callable (such as
+    `StoreBase.superseded_ids`) SHOULD be used to take advantage of any index a store has. Otherwise, all records are
+    checked.
     """
 
-    def __init__(self, logger: logging.Logger, meta: ExportMeta, select_records: SelectRecordsProtocol) -> None:
+    def __init__(
+        self,
+        logger: logging.Logger,
+        meta: ExportMeta,
+        select_records: SelectRecordsProtocol,
+        iter_records: IterRecordsProtocol | None = None,
+        superseded_ids: SupersededIdsProtocol | None = None,
+    ) -> None:
         super().__init__(
             logger=logger,
             meta=meta,
             name="Items Public Website Search Results",
             check_type=CheckType.BAS_WEBSITE_SEARCH,
             select_records=select_records,
+            iter_records=iter_records,
         )
+        self._superseded_ids = superseded_ids
 
     @property
     def _object_meta(self) -> dict[str, str]:
         return {"build_ref": self._meta.build_repo_ref} if self._meta.build_repo_ref else {}
 
     @staticmethod
-    def _get_superseded_records(records: list[RecordRevision]) -> list[str]:
+    def _get_superseded_records(records: Iterable[RecordRevision]) -> set[str]:
         """List identifiers of records superseded by other records."""
         supersedes = set()
         for record in records:
@@ -60,7 +72,7 @@ class ItemsBasWebsiteOutput(OutputRecords):
                 namespace=CATALOGUE_NAMESPACE, associations=AggregationAssociationCode.REVISION_OF
             )
             supersedes.update(aggregations.identifiers())
-        return list(supersedes)
+        return supersedes
 
     @property
     def _in_scope_items(self) -> list[ItemWebsiteSearch]:
@@ -69,8 +81,7 @@ class ItemsBasWebsiteOutput(OutputRecords):
 
         See https://gitlab.data.bas.ac.uk/MAGIC/add-metadata-toolbox/-/issues/450/#note_142966 for initial criteria.
         """
-        records = self._select_records()
-        superseded = self._get_superseded_records(records)
+        superseded = self._superseded_ids() if self._superseded_ids else self._get_superseded_records(self._records())
         items = [
             ItemWebsiteSearch(
                 record=record,
@@ -78,7 +89,7 @@ class ItemsBasWebsiteOutput(OutputRecords):
                 source=self._meta.generator,
                 base_url=self._meta.base_url,
             )
-            for record in records
+            for record in self._records()
         ]
         filtered_items = [item for item in items if item.resource_id not in superseded and item.open_access]
         self._logger.debug(
@@ -6,7 +6,7 @@ from lxml import etree
 
 from lantern.models.checks import Check, CheckType, RecordChecks
 from lantern.models.site import ExportMeta, SiteContent
-from lantern.outputs.base import OutputRecord
+from lantern.outputs.base import OutputRecord, OutputRecordContext
 from lantern.utils import is_live_record
 
 if TYPE_CHECKING:
@@ -28,9 +28,20 @@ class RecordIsoJsonOutput(OutputRecord):
     [1] https://metadata-standards.data.bas.ac.uk/standards/iso-19115-19139#json-schemas
     """
 
-    def __init__(self, logger: logging.Logger, meta: ExportMeta, record: RecordRevision) -> None:
+    def __init__(
+        self,
+        logger: logging.Logger,
+        meta: ExportMeta,
+        record: RecordRevision,
+        context: OutputRecordContext | None = None,
+    ) -> None:
         super().__init__(
-            logger=logger, meta=meta, name="Record ISO JSON", check_type=CheckType.RECORD_PAGES_JSON, record=record
+            logger=logger,
+            meta=meta,
+            name="Record ISO JSON",
+            check_type=CheckType.RECORD_PAGES_JSON,
+            record=record,
+            context=context,
         )
 
     @property
@@ -44,7 +55,7 @@ class RecordIsoJsonOutput(OutputRecord):
     @property
     def _content(self) -> str:
         """Encode record as BAS ISO JSON."""
-        return self._record.dumps_json(strip_admin=self._strip_admin)
+        return self._context.json
 
     @property
     def content(self) -> list[SiteContent]:
@@ -73,9 +84,20 @@ class RecordIsoXmlOutput(OutputRecord):
     Supports trusted publishing (via export meta).
     """
 
-    def __init__(self, logger: logging.Logger, meta: ExportMeta, record: RecordRevision) -> None:
+    def __init__(
+        self,
+        logger: logging.Logger,
+        meta: ExportMeta,
+        record: RecordRevision,
+        context: OutputRecordContext | None = None,
+    ) -> None:
         super().__init__(
-            logger=logger, meta=meta, name="Record ISO XML", check_type=CheckType.RECORD_PAGES_XML, record=record
+            logger=logger,
+            meta=meta,
+            name="Record ISO XML",
+            check_type=CheckType.RECORD_PAGES_XML,
+            record=record,
+            context=context,
         )
 
     @property
@@ -89,7 +111,7 @@ class RecordIsoXmlOutput(OutputRecord):
     @property
     def _content(self) -> str:
         """Encode record as ISO 19139 XML."""
-        return self._record.dumps_xml(strip_admin=self._strip_admin)
+        return self._context.xml
 
     @property
     def content(self) -> list[SiteContent]:
@@ -125,7 +147,7 @@ class RecordIsoHtmlOutput(OutputRecord):
     improved readability.
 
     Returns the rendered HTML output after applying the stylesheet to avoid issues with loading XML stylesheets client
-    side and overriding media types. Uses the RecordIsoXmlOutput to get input XML.
+    side and overriding media types. Uses the same input XML as the RecordIsoXmlOutput (via the record context).
 
     Intended for human inspection of ISO records, typically for evaluation or debugging.
 
@@ -142,9 +164,15 @@ class RecordIsoHtmlOutput(OutputRecord):
         meta: ExportMeta,
         record: RecordRevision,
         transform: etree.XSLT | None = None,
+        context: OutputRecordContext | None = None,
     ) -> None:
         super().__init__(
-            logger=logger, meta=meta, name="Record ISO HTML", check_type=CheckType.RECORD_PAGES_HTML, record=record
+            logger=logger,
+            meta=meta,
+            name="Record ISO HTML",
+            check_type=CheckType.RECORD_PAGES_HTML,
+            record=record,
+            context=context,
         )
         self._transform = transform
 
@@ -164,28 +192,24 @@ class RecordIsoHtmlOutput(OutputRecord):
         xsl_doc = etree.fromstring(xsl_bytes)
         return etree.XSLT(xsl_doc)
 
-    def _apply_iso_html_xslt(self, record: RecordRevision) -> str:
+    def _apply_iso_html_xslt(self) -> str:
         """
         Apply XSLT to record and return rendered output.
 
         Uses an existing XSLT transformer if available (for performance in parallel processing).
+
+        Uses the record XML document from the record context, which may be shared with a `RecordIsoXmlOutput`.
         """
         if self._transform is None:
             self._transform = self.create_xslt_transformer()
 
-        # Build XML document from the record XML string
-        record_xml = RecordIsoXmlOutput(logger=self._logger, meta=self._meta, record=record).content[0].content
-        record_bytes = bytes(record_xml) if isinstance(record_xml, (bytes, bytearray)) else str(record_xml).encode()
-        record_doc = etree.ElementTree(etree.fromstring(record_bytes))
-
-        # Apply transformation
-        result = self._transform(record_doc)
+        result = self._transform(self._context.xml_doc)
         return etree.tostring(result, method="html", pretty_print=True, encoding="utf-8").decode()
 
     @property
     def _content(self) -> str:
         """Encode record as ISO 19139 XML with HTML stylesheet."""
-        return self._apply_iso_html_xslt(record=self._record)
+        return self._apply_iso_html_xslt()
 
     @property
     def content(self) -> list[SiteContent]:
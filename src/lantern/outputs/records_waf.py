@@ -10,7 +10,7 @@ from lantern.outputs.base import OutputRecords
 if TYPE_CHECKING:
     import logging
 
-    from lantern.stores.base import SelectRecordsProtocol
+    from lantern.stores.base import IterRecordsProtocol, SelectRecordsProtocol
 
 
 class RecordsWafOutput(OutputRecords):
@@ -25,13 +25,20 @@ class RecordsWafOutput(OutputRecords):
     (i.e. via the `lantern.outputs.records_iso.RecordIsoXmlOutput` output class).
     """
 
-    def __init__(self, logger: logging.Logger, meta: ExportMeta, select_records: SelectRecordsProtocol) -> None:
+    def __init__(
+        self,
+        logger: logging.Logger,
+        meta: ExportMeta,
+        select_records: SelectRecordsProtocol,
+        iter_records: IterRecordsProtocol | None = None,
+    ) -> None:
         super().__init__(
             logger=logger,
             meta=meta,
             name="Web Accessible Folder",
             check_type=CheckType.WAF_PAGES,
             select_records=select_records,
+            iter_records=iter_records,
         )
 
     @property
@@ -63,7 +70,7 @@ class RecordsWafOutput(OutputRecords):
 
         main = ET.SubElement(body, "main")
         ul = ET.SubElement(main, "ul")
-        for record in self._select_records():
+        for record in self._records():
             fid = record.file_identifier
             li = ET.SubElement(ul, "li")
             a = ET.SubElement(li, "a", attrib={"href": f"{self._meta.base_url}/records/{fid}.xml"})
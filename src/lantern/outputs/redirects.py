@@ -9,6 +9,7 @@ from lantern.outputs.base import OutputSite
 
 if TYPE_CHECKING:
     import logging
+    from collections.abc import Sequence
 
 
 class RedirectsOutput(OutputSite):
@@ -18,7 +19,7 @@ class RedirectsOutput(OutputSite):
     Processes redirects defined in a set of content items. Generates a CSV file for use in other systems.
     """
 
-    def __init__(self, logger: logging.Logger, meta: ExportMeta, content: list[SiteContent]) -> None:
+    def __init__(self, logger: logging.Logger, meta: ExportMeta, content: Sequence[SiteContent]) -> None:
         super().__init__(logger=logger, meta=meta, name="Site Redirects", check_type=CheckType.NONE)
         self._items = content
 
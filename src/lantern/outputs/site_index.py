@@ -4,16 +4,16 @@ from typing import TYPE_CHECKING
 from lantern.models.checks import CheckType
 from lantern.models.item.base.enums import ResourceTypeIcon
 from lantern.models.site import ExportMeta, SiteContent
-from lantern.outputs.base import OutputSite
+from lantern.outputs.base import OutputRecords, OutputSite
 from lantern.utils import get_record_aliases, minify_html
 
 if TYPE_CHECKING:
     import logging
 
-    from lantern.stores.base import SelectRecordsProtocol
+    from lantern.stores.base import IterRecordsProtocol, SelectRecordsProtocol
 
 
-class SiteIndexOutput(OutputSite):
+class SiteIndexOutput(OutputRecords, OutputSite):
     """
     Proto catalogue index output.
 
@@ -22,9 +22,21 @@ class SiteIndexOutput(OutputSite):
     Not intended for general use (but also not sensitive).
     """
 
-    def __init__(self, logger: logging.Logger, meta: ExportMeta, select_records: SelectRecordsProtocol) -> None:
-        super().__init__(logger=logger, meta=meta, name="Site Index", check_type=CheckType.SITE_INDEX)
-        self._select_records = select_records
+    def __init__(
+        self,
+        logger: logging.Logger,
+        meta: ExportMeta,
+        select_records: SelectRecordsProtocol,
+        iter_records: IterRecordsProtocol | None = None,
+    ) -> None:
+        super().__init__(
+            logger=logger,
+            meta=meta,
+            name="Site Index",
+            check_type=CheckType.SITE_INDEX,
+            select_records=select_records,
+            iter_records=iter_records,
+        )
         self._template_path = "_views/-/index.html.j2"
 
     @property
@@ -41,7 +53,7 @@ class SiteIndexOutput(OutputSite):
         idx_records = []
         idx_aliases = []
 
-        for record in self._select_records():
+        for record in self._records():
             idx_records.append(
                 {
                     "icon_class": ResourceTypeIcon[record.hierarchy_level.name].value,
@@ -122,7 +122,10 @@ class BasRepository(RepositoryBase):
 
         cache_path = self._config.STORE_GITLAB_CACHE_PATH / sanitize_filepath(source.ref)
         cached_store = GitLabCachedStore.from_gitlab_store(
-            store=store, parallel_jobs=self._config.PARALLEL_JOBS, cache_dir=cache_path
+            store=store,
+            parallel_jobs=self._config.PARALLEL_JOBS,
+            cache_dir=cache_path,
+            cache_archive=self._config.ENABLE_FEATURE_GITLAB_CACHE_ARCHIVE,
         )
         cached_store.freeze()
         return cached_store
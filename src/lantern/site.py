@@ -1,26 +1,35 @@
+import json
 import logging
 import time
-from copy import deepcopy
+from contextlib import contextmanager
+from dataclasses import asdict
 from datetime import date
+from hashlib import sha1
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from typing import TYPE_CHECKING, Literal, NamedTuple, cast
 
 from joblib import Parallel, delayed
 
 from lantern.log import init as init_logging
+from lantern.outputs.base import OutputRecordContext
 from lantern.outputs.item_html import ItemAliasesOutput, ItemCatalogueOutput
 from lantern.outputs.items_bas_website import ItemsBasWebsiteOutput
 from lantern.outputs.record_iso import RecordIsoHtmlOutput, RecordIsoJsonOutput, RecordIsoXmlOutput
 from lantern.outputs.records_waf import RecordsWafOutput
 from lantern.outputs.site_health import SiteHealthOutput, SiteHealthOutputComponentValues
 from lantern.outputs.site_index import SiteIndexOutput
+from lantern.stores.base import RecordNotFoundError
 from lantern.stores.gitlab_cache import GitLabCachedStore
+from lantern.stores.snapshot import SnapshotStore
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable, Iterator
 
     from lxml import etree
 
     from lantern.models.checks import Check
+    from lantern.models.manifest import SiteManifest
     from lantern.models.record.revision import RecordRevision
     from lantern.models.site import ExportMeta, SiteContent
     from lantern.outputs.base import OutputBase
@@ -37,12 +46,18 @@ def _job_worker_store(store: StoreBase) -> StoreBase:
     Store per worker process.
 
     Singleton used to avoid initialising store for each job as some stores cannot be pickled.
+
+    Replaced if a different store is given (e.g. from a later `Site.execute()` call). Snapshot stores are compared by
+    path, as each unpickled instance of the same snapshot is a different object.
     """
     global _STORE_SINGLETON  # noqa: PLW0603
-    if _STORE_SINGLETON is None:
+    same = _STORE_SINGLETON is store or (
+        isinstance(store, SnapshotStore)
+        and isinstance(_STORE_SINGLETON, SnapshotStore)
+        and _STORE_SINGLETON.path == store.path
+    )
+    if not same:
         _STORE_SINGLETON = store
-        if isinstance(store, GitLabCachedStore):
-            _STORE_SINGLETON.select()  # recreate flash cache
     # noinspection PyTypeChecker
     return _STORE_SINGLETON
 
@@ -60,23 +75,18 @@ def _job_worker_iso_html_transform() -> etree.XSLT:
     return _ISO_HTML_XSLT_SINGLETON
 
 
-def _run_job(
-    log_level: int,
+def _job_output_instance(
+    logger: logging.Logger,
     meta: ExportMeta,
     store: StoreBase,
+    iso_html_transform: etree.XSLT,
     job: SiteJob,
-) -> list[SiteContent] | list[Check] | list[str]:
-    """
-    Generate content or checks from an Output.
-
-    Standalone function for use in parallel processing.
-    """
-    init_logging(log_level)
-    logger = logging.getLogger("lantern")
-    store = _job_worker_store(store=store)
-    iso_html_transform = _job_worker_iso_html_transform()
+    context: OutputRecordContext | None = None,
+) -> OutputBase:
+    """Create an Output instance for a job, with the arguments its Output class requires."""
     select_record = store.select_one
     select_records = store.select
+    iter_records = store.iter_records
     job_extras = job.extras or {}
 
     if job.output == ItemCatalogueOutput:
@@ -93,15 +103,41 @@ def _run_job(
             meta=meta,
             component_values=component_values,
         )
-    elif job.output in [SiteIndexOutput, ItemsBasWebsiteOutput, RecordsWafOutput]:
-        output = job.output(logger=logger, meta=meta, select_records=select_records)
+    elif job.output in [SiteIndexOutput, RecordsWafOutput]:
+        output = job.output(logger=logger, meta=meta, select_records=select_records, iter_records=iter_records)
+    elif job.output == ItemsBasWebsiteOutput:
+        output = job.output(
+            logger=logger,
+            meta=meta,
+            select_records=select_records,
+            iter_records=iter_records,
+            superseded_ids=store.superseded_ids,
+        )
     elif job.output == RecordIsoHtmlOutput:
-        output = job.output(logger=logger, meta=meta, record=job.record, transform=iso_html_transform)
-    elif job.output in [ItemAliasesOutput, RecordIsoJsonOutput, RecordIsoXmlOutput]:
+        output = job.output(logger=logger, meta=meta, record=job.record, transform=iso_html_transform, context=context)
+    elif job.output in [RecordIsoJsonOutput, RecordIsoXmlOutput]:
+        output = job.output(logger=logger, meta=meta, record=job.record, context=context)
+    elif job.output == ItemAliasesOutput:
         output = job.output(logger=logger, meta=meta, record=job.record)
     else:
         output = job.output(logger=logger, meta=meta)
+    return output
+
+
+def _job_output(
+    logger: logging.Logger,
+    meta: ExportMeta,
+    store: StoreBase,
+    iso_html_transform: etree.XSLT,
+    job: SiteJob,
+    context: OutputRecordContext | None = None,
+) -> list[SiteContent] | list[Check] | list[str]:
+    """
+    Generate content or checks from an Output.
 
+    A record context can be provided to share record representations between jobs for the same record.
+    """
+    output = _job_output_instance(logger, meta, store, iso_html_transform, job, context)
     msg = f"Outputting {job.action} for {output.name}."
     if job.record:
         msg = f"Outputting {job.action} for record '{job.record.file_identifier}' using {output.name}."
@@ -116,6 +152,54 @@ def _run_job(
     return output.content
 
 
+def _run_jobs(
+    log_level: int,
+    meta: ExportMeta,
+    store: StoreBase,
+    jobs: list[SiteJob],
+) -> list[list[SiteContent] | list[Check] | list[str]]:
+    """
+    Generate content or checks from Outputs for a batch of jobs.
+
+    Standalone function for use in parallel processing.
+
+    Per-process setup (logging, store and transform) is done once per batch rather than per job.
+
+    Jobs for the same record share a record context, so record representations (e.g. as XML) are generated once.
+    """
+    init_logging(log_level)
+    logger = logging.getLogger("lantern")
+    store = _job_worker_store(store=store)
+    iso_html_transform = _job_worker_iso_html_transform()
+    contexts: dict[str, OutputRecordContext] = {}
+
+    results = []
+    for job in jobs:
+        context = None
+        if job.record is not None:
+            fid = job.record.file_identifier
+            if fid not in contexts:
+                contexts[fid] = OutputRecordContext(record=job.record, strip_admin=not meta.trusted)
+            context = contexts[fid]
+        results.append(_job_output(logger, meta, store, iso_html_transform, job, context))
+    return results
+
+
+def _run_batch(
+    index: int,
+    log_level: int,
+    meta: ExportMeta,
+    store: StoreBase,
+    jobs: list[SiteJob],
+) -> tuple[int, list[list[SiteContent] | list[Check] | list[str]]]:
+    """
+    Generate content or checks for a batch of jobs, returning the index of the batch with its results.
+
+    Standalone function for use in parallel processing where results may be returned in any order.
+    """
+    return index, _run_jobs(log_level=log_level, meta=meta, store=store, jobs=jobs)
+
+
 class SiteJob(NamedTuple):
     """Output class, action, and optional Record instance and/or any extras for a Site generator job."""
 
@@ -132,32 +216,111 @@ class Site:
     Generates content or content checks for selected Output classes and records from a Store.
 
     Flexible class intended to be used in a higher level and opinionated Catalogue class.
+
+    Jobs are processed in batches, with all jobs for a record in the same batch, and up to `batch_size` records per
+    batch, to reduce the overhead of parallel processing.
+
+    `pre_dispatch` sets how many batches are dispatched to workers ahead of results being returned (as per joblib).
+    Higher values keep workers busier at the cost of holding more batches (and their records) in memory.
     """
 
-    def __init__(self, logger: logging.Logger, meta: ExportMeta, store: StoreBase, extras: dict | None = None) -> None:
+    def __init__(
+        self,
+        logger: logging.Logger,
+        meta: ExportMeta,
+        store: StoreBase,
+        extras: dict | None = None,
+        batch_size: int = 10,
+        pre_dispatch: int | str = "2 * n_jobs",
+    ) -> None:
         self._logger = logger
         self._meta = meta
         self._store = store
         self._extras = extras or {}
+        self._batch_size = batch_size
+        self._pre_dispatch = pre_dispatch
 
         self._workers = meta.parallel_jobs
+        self._meta_digest = self._digest_meta(meta)
+        self._snapshot: SnapshotStore | None = None
+        self._snapshot_dir: TemporaryDirectory | None = None
+
+    @staticmethod
+    def _digest_meta(meta: ExportMeta) -> str:
+        """
+        Digest of site metadata used when generating content.
 
-    def _prep_store(self) -> StoreBase:
+        Covers values rendered into content (e.g. base URL, environment and template config such as search keys and
+        service endpoints). Excludes values that change with every build (`build_time`, `build_repo_ref`) or are set
+        per page (`html_title`), so that these don't cause all content to be regenerated.
+        """
+        values = asdict(meta.site_metadata)
+        for key in ("build_time", "build_repo_ref", "html_title"):
+            values.pop(key)
+        return sha1(json.dumps(values, sort_keys=True, default=str).encode("utf-8")).hexdigest()  # noqa: S324
+
+    @contextmanager
+    def _prep_store(self) -> Iterator[StoreBase]:
         """
         Prepare store for use in parallel processing jobs.
 
-        Applies specifically to GitLabCachedStore which contain an in-memory dict of pickled records, and add
-        significant overhead when pickling and unpickling these stores for each parallel job.
+        Applies specifically to GitLabCachedStore which contain an in-memory dict of pickled records and a database
+        connection, and add significant overhead when pickling and unpickling these stores for each parallel job.
+
+        A read-only snapshot of all records is created in a temporary directory instead, which each worker process
+        memory-maps and unpickles records from on demand. This limits memory use to roughly one copy of records
+        regardless of the number of workers.
 
-        A copy of the store without the in-memory cache layer is made to avoid this, and the `_STORE_SINGLETON`
-        singleton will then recreate it for each worker process.
+        Where jobs run in a single process (one parallel job), the store is not pickled and is used as-is.
+
+        Where the store is frozen, its records cannot change, so the snapshot is created once and reused for later
+        `execute()` calls (e.g. for checks after content), until the site instance is discarded. Otherwise, a snapshot
+        is created for, and removed after, each call.
+        """
+        if not isinstance(self._store, GitLabCachedStore) or self._workers == 1:
+            yield self._store
+            return
+
+        if self._store.frozen:
+            if self._snapshot is None:
+                self._snapshot_dir = TemporaryDirectory()
+                path = Path(self._snapshot_dir.name)
+                self._snapshot = SnapshotStore.create(logger=self._logger, store=self._store, path=path)
+            yield self._snapshot
+            return
+
+        with TemporaryDirectory() as tmp_path:
+            yield SnapshotStore.create(logger=self._logger, store=self._store, path=Path(tmp_path))
+
+    @staticmethod
+    def _output_names(outputs: list[type[OutputBase]]) -> list[str]:
+        """Names of Output classes as used in build manifests."""
+        return sorted(cls.__name__ for cls in outputs)
+
+    def _record_fingerprint(self, record: RecordRevision) -> str:
         """
-        if not isinstance(self._store, GitLabCachedStore):
-            return self._store
+        Fingerprint of the inputs used to generate content for a record.
 
-        store = deepcopy(self._store)
-        store._cache._flash.clear()
-        return store
+        Includes the record revision, the revisions of any related records (as used for item summaries), the build
+        key (which changes between application versions) and a digest of site metadata (see `_digest_meta()`). Output
+        classes are tracked separately in build manifests.
+        """
+        related = {}
+        for aggregation in record.identification.aggregations:
+            identifier = aggregation.identifier.identifier
+            try:
+                related[identifier] = self._store.select_one(identifier).file_revision
+            except RecordNotFoundError:
+                related[identifier] = None
+
+        inputs = {
+            "build_key": self._meta.build_key,
+            "trusted": self._meta.trusted,
+            "meta": self._meta_digest,
+            "file_revision": record.file_revision,
+            "related": related,
+        }
+        return sha1(json.dumps(inputs, sort_keys=True).encode("utf-8")).hexdigest()  # noqa: S324
 
     def _generate_jobs(
         self,
@@ -165,59 +328,212 @@ class Site:
         global_outputs: list[type[OutputBase]],
         individual_outputs: list[type[OutputBase]],
         identifiers: set[str] | None = None,
-    ) -> list[SiteJob]:
+        fingerprints: dict[str, str] | None = None,
+    ) -> Iterator[SiteJob]:
         """
-        Create jobs for generating content, checks and/or invalidation keys for Output classes and records.
+        Lazily create jobs for generating content, checks and/or invalidation keys for Output classes and records.
 
         Includes any site extras for use in Outputs.
 
         Output classes are 'global' or 'individual' depending on whether they operate on individual records.
 
-        Generated as: [actions] * [output class] (* [record])
+        Where `fingerprints` is set, individual jobs are limited to records it contains (i.e. changed records).
+
+        Records are loaded as jobs are consumed, so that all records are not held in memory at once.
+
+        Generated as: [actions] * [global output class], then [record] * [actions] * [individual output class]
         """
         extras = self._extras or None
-        global_ = [SiteJob(action=action, output=cls, extras=extras) for action in actions for cls in global_outputs]
-        individual_ = [
-            SiteJob(action=action, output=cls, record=record, extras=extras)
-            for action in actions
-            for cls in individual_outputs
-            for record in self._store.select(identifiers)
-        ]
-        return global_ + individual_
+        for action in actions:
+            for cls in global_outputs:
+                yield SiteJob(action=action, output=cls, extras=extras)
+        if not individual_outputs:
+            return
+
+        for record in self._store.iter_records(identifiers):
+            if fingerprints is not None and record.file_identifier not in fingerprints:
+                continue
+            for action in actions:
+                for cls in individual_outputs:
+                    yield SiteJob(action=action, output=cls, record=record, extras=extras)
+
+    def _changed_records(
+        self, manifest: SiteManifest, individual_outputs: list[type[OutputBase]], identifiers: set[str] | None = None
+    ) -> dict[str, str]:
+        """
+        Fingerprints for records that have changed compared to a build manifest for any of a set of Output classes.
 
-    def execute(self, jobs: list[SiteJob]) -> list[SiteContent | Check | list[str]]:
+        Where all records are selected, records in the manifest no longer in the store are pruned from it.
+        """
+        if not individual_outputs:
+            if identifiers is None:
+                manifest.prune({record.file_identifier for record in self._store.iter_records()})
+            return {}
+
+        outputs = self._output_names(individual_outputs)
+        fingerprints = {
+            record.file_identifier: self._record_fingerprint(record) for record in self._store.iter_records(identifiers)
+        }
+        if identifiers is None:
+            manifest.prune(set(fingerprints.keys()))
+        changed = {fid: fp for fid, fp in fingerprints.items() if not manifest.unchanged(fid, fp, outputs)}
+        self._logger.info("%s of %s records changed since last build", len(changed), len(fingerprints))
+        return changed
+
+    def _batch_jobs(self, jobs: Iterable[SiteJob]) -> Iterator[list[SiteJob]]:
+        """
+        Lazily group jobs into batches for parallel processing.
+
+        Jobs for global outputs are batched individually, as these typically process all records.
+
+        Jobs for individual outputs are grouped by record, so all jobs for a record are processed together, with up to
+        `batch_size` records per batch. Jobs for the same record are expected to be consecutive (as from
+        `_generate_jobs()`), so that jobs can be batched without holding all jobs in memory.
+        """
+        batch: list[SiteJob] = []
+        batch_records: set[str] = set()
+        for job in jobs:
+            if job.record is None:
+                yield [job]
+                continue
+            fid = job.record.file_identifier
+            if fid not in batch_records and len(batch_records) >= self._batch_size:
+                yield batch
+                batch = []
+                batch_records = set()
+            batch.append(job)
+            batch_records.add(fid)
+        if batch:
+            yield batch
+
+    def execute(self, jobs: Iterable[SiteJob]) -> list[SiteContent | Check | str]:
         """
         Execute a set of jobs in parallel to generate site content, checks and/or invalidation keys.
 
-        Returns generated content, checks or invalidation keys as a flattened list.
+        Returns generated content, checks or invalidation keys as a flattened list, in the order of jobs.
         """
-        store = self._prep_store()
-        start = time.monotonic()
-        nested_outputs: list[list[SiteContent | Check | list[str]]] = Parallel(n_jobs=self._workers)(
-            delayed(_run_job)(self._logger.level, self._meta, store, job) for job in jobs
-        )
-        outputs: list[SiteContent | Check | list[str]] = [
-            output for output_outputs in nested_outputs for output in output_outputs
-        ]
-        self._logger.info(
-            "Generated %s site content/checks/keys in %s seconds", len(outputs), round(time.monotonic() - start)
-        )
-        return outputs
+        return list(self.iter_execute(jobs, ordered=True))
 
-    def generate_content(
+    def iter_execute(self, jobs: Iterable[SiteJob], ordered: bool = False) -> Iterator[SiteContent | Check | str]:
+        """
+        Lazily execute a set of jobs in parallel to generate site content, checks and/or invalidation keys.
+
+        As `execute()` but outputs are yielded as each batch of jobs completes (in any order unless `ordered` is set),
+        so they can be processed (e.g. exported) while remaining jobs run.
+        """
+        for _job, job_outputs in self._iter_job_outputs(jobs, ordered=ordered):
+            yield from job_outputs
+
+    def _iter_job_outputs(
+        self, jobs: Iterable[SiteJob], ordered: bool = False
+    ) -> Iterator[tuple[SiteJob, list[SiteContent] | list[Check] | list[str]]]:
+        """
+        Lazily execute a set of jobs in parallel, yielding each job with its outputs as each batch of jobs completes.
+
+        Batches complete in any order unless `ordered` is set.
+        """
+        with self._prep_store() as store:
+            start = time.monotonic()
+            count = 0
+            # batches are held until their results are returned, to pair jobs with their outputs
+            pending: dict[int, list[SiteJob]] = {}
+
+            def _dispatch() -> Iterator:
+                for i, batch in enumerate(self._batch_jobs(jobs)):
+                    pending[i] = batch
+                    yield delayed(_run_batch)(i, self._logger.level, self._meta, store, batch)
+
+            # jobs are already batched, so joblib's automatic batching is disabled
+            results = Parallel(
+                n_jobs=self._workers,
+                batch_size=1,
+                pre_dispatch=self._pre_dispatch,
+                return_as="generator" if ordered else "generator_unordered",
+            )(_dispatch())
+            for i, batch_outputs in results:
+                for job, job_outputs in zip(pending.pop(i), batch_outputs, strict=True):
+                    count += len(job_outputs)
+                    yield job, job_outputs
+        self._logger.info("Generated %s site content/checks/keys in %s seconds", count, round(time.monotonic() - start))
+
+    def _iter_output_content(self, jobs: Iterable[SiteJob], ordered: bool = False) -> Iterator[tuple[str, SiteContent]]:
+        """Lazily generate site content as (Output class name, content item) pairs for build manifests."""
+        for job, job_outputs in self._iter_job_outputs(jobs, ordered=ordered):
+            name = cast("type[OutputBase]", job.output).__name__
+            for item in cast("list[SiteContent]", job_outputs):
+                yield name, item
+
+    def _content_jobs(
         self,
         global_outputs: list[type[OutputBase]],
         individual_outputs: list[type[OutputBase]],
         identifiers: set[str] | None = None,
-    ) -> list[SiteContent]:
-        """Generate site content."""
+        manifest: SiteManifest | None = None,
+    ) -> tuple[Iterator[SiteJob], dict[str, str] | None]:
+        """Jobs for generating site content, and fingerprints of changed records where a build manifest is given."""
+        fingerprints = None
+        if manifest is not None:
+            fingerprints = self._changed_records(
+                manifest=manifest, individual_outputs=individual_outputs, identifiers=identifiers
+            )
         jobs = self._generate_jobs(
             actions=["content"],
             global_outputs=global_outputs,
             individual_outputs=individual_outputs,
             identifiers=identifiers,
+            fingerprints=fingerprints,
+        )
+        return jobs, fingerprints
+
+    def generate_content(
+        self,
+        global_outputs: list[type[OutputBase]],
+        individual_outputs: list[type[OutputBase]],
+        identifiers: set[str] | None = None,
+        manifest: SiteManifest | None = None,
+    ) -> list[SiteContent]:
+        """
+        Generate site content.
+
+        Where a build manifest is given, content is only generated for records that have changed since the last build,
+        and only new or changed content is returned. The manifest is updated but not saved.
+        """
+        jobs, fingerprints = self._content_jobs(global_outputs, individual_outputs, identifiers, manifest)
+        if manifest is None or fingerprints is None:
+            return cast("list[SiteContent]", self.execute(jobs))
+
+        content = list(self._iter_output_content(jobs, ordered=True))
+        changed = manifest.update(
+            content=content, fingerprints=fingerprints, outputs=self._output_names(individual_outputs)
         )
-        return cast("list[SiteContent]", self.execute(jobs))
+        self._logger.info("%s of %s site content items changed since last build", len(changed), len(content))
+        return changed
+
+    def iter_content(
+        self,
+        global_outputs: list[type[OutputBase]],
+        individual_outputs: list[type[OutputBase]],
+        identifiers: set[str] | None = None,
+        manifest: SiteManifest | None = None,
+    ) -> Iterator[SiteContent]:
+        """
+        Lazily generate site content.
+
+        As `generate_content()` but content is yielded as it is generated (in any order), for streaming to an exporter.
+        Where a build manifest is given, it is only fully updated once all content has been consumed.
+        """
+        jobs, fingerprints = self._content_jobs(global_outputs, individual_outputs, identifiers, manifest)
+        if manifest is None or fingerprints is None:
+            yield from cast("Iterator[SiteContent]", self.iter_execute(jobs))
+            return
+
+        changed = 0
+        content = self._iter_output_content(jobs)
+        outputs = self._output_names(individual_outputs)
+        for item in manifest.iter_update(content=content, fingerprints=fingerprints, outputs=outputs):
+            changed += 1
+            yield item
+        self._logger.info("%s site content items changed since last build", changed)
 
     def generate_checks(
         self,
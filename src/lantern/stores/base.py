@@ -1,7 +1,12 @@
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Protocol
 
+from lantern.lib.metadata_library.models.record.enums import AggregationAssociationCode
+from lantern.models.record.const import CATALOGUE_NAMESPACE
+
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from lantern.models.record.revision import RecordRevision
 
 
@@ -60,11 +65,57 @@ class StoreBase(ABC):
         """Return all records or raise a `RecordsNotFoundError` exception."""
         ...
 
+    def iter_records(self, file_identifiers: set[str] | None = None) -> Iterator[RecordRevision]:
+        """
+        Yield all records or raise a `RecordsNotFoundError` exception.
+
+        Stores that can load records lazily (e.g. to limit memory use) should override this default implementation.
+        """
+        yield from self.select(file_identifiers)
+
     @abstractmethod
     def select_one(self, file_identifier: str) -> RecordRevision:
         """Return a specific record or raise a `RecordNotFoundError` exception."""
         ...
 
+    def revisions(self, file_identifiers: set[str] | None = None) -> dict[str, str]:
+        """
+        Return file revisions for all or selected records, indexed by file identifier.
+
+        Stores that index file revisions should override this default implementation, which loads all records.
+        """
+        return {record.file_identifier: record.file_revision for record in self.iter_records(file_identifiers)}
+
+    def select_related(self, file_identifier: str, association: AggregationAssociationCode) -> list[RecordRevision]:
+        """
+        Return records with a catalogue aggregation to a record, for an association type (i.e. a reverse lookup).
+
+        Stores that can index aggregations should override this default implementation, which checks all records.
+        """
+        return [
+            record
+            for record in self.iter_records()
+            if record.identification.aggregations.filter(
+                namespace=CATALOGUE_NAMESPACE, identifiers=file_identifier, associations=association
+            )
+        ]
+
+    def superseded_ids(self) -> set[str]:
+        """
+        Return identifiers of records superseded by other records.
+
+        I.e. records that are the target of a catalogue `RevisionOf` aggregation in any record.
+
+        Stores that can index aggregations should override this default implementation, which checks all records.
+        """
+        superseded = set()
+        for record in self.iter_records():
+            aggregations = record.identification.aggregations.filter(
+                namespace=CATALOGUE_NAMESPACE, associations=AggregationAssociationCode.REVISION_OF
+            )
+            superseded.update(aggregations.identifiers())
+        return superseded
+
     @abstractmethod
     def freeze(self) -> None:
         """
@@ -83,6 +134,20 @@ class SelectRecordsProtocol(Protocol):
     ) -> list[RecordRevision]: ...
 
 
+class IterRecordsProtocol(Protocol):
+    """Callable protocol for lazily selecting records from Store."""
+
+    def __call__(  # pragma: no branch  # noqa: D102
+        self, file_identifiers: set[str] | None = None
+    ) -> Iterator[RecordRevision]: ...
+
+
+class SupersededIdsProtocol(Protocol):
+    """Callable protocol for selecting identifiers of superseded records from Store."""
+
+    def __call__(self) -> set[str]: ...  # pragma: no branch  # noqa: D102
+
+
 class SelectRecordProtocol(Protocol):
     """Callable protocol for selecting a record from Store."""
 
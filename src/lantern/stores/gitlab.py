@@ -366,8 +366,11 @@ class GitLabStore(StoreBase):
 
         existing_hashes = self._get_hashes_callable(file_identifiers={record.file_identifier for record in records})
         for record in records:
-            self._logger.debug("Existing: '%s', New: '%s'", existing_hashes[record.file_identifier], record.sha1)
-            if record.sha1 == existing_hashes[record.file_identifier]:
+            # dump each record once for hashing and encoding
+            config = record.dumps(strip_admin=False)
+            sha1 = record.hash_config(config)
+            self._logger.debug("Existing: '%s', New: '%s'", existing_hashes[record.file_identifier], sha1)
+            if sha1 == existing_hashes[record.file_identifier]:
                 self._logger.debug("Record '%s' is unchanged, skipping", record.file_identifier)
                 continue
 
@@ -382,12 +385,12 @@ class GitLabStore(StoreBase):
                     {
                         "action": action,
                         "file_path": self._get_remote_hashed_path(f"{record.file_identifier}.json"),
-                        "content": record.dumps_json(strip_admin=False),
+                        "content": record.dumps_json(data=config),
                     },
                     {
                         "action": action,
                         "file_path": self._get_remote_hashed_path(f"{record.file_identifier}.xml"),
-                        "content": record.dumps_xml(strip_admin=False),
+                        "content": record.dumps_xml(data=config),
                     },
                 ]
             )
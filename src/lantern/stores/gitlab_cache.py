@@ -1,24 +1,29 @@
 import json
 import pickle
 import shutil
+import tarfile
 from base64 import b64decode
 from copy import deepcopy
 from dataclasses import dataclass
 from functools import cached_property
+from tempfile import TemporaryFile
 from typing import TYPE_CHECKING
 
 from joblib import Parallel, delayed
 from requests.exceptions import ConnectionError as RequestsConnectionError
 from sqlorm import SQL, Engine
 
+from lantern.lib.metadata_library.models.record.enums import AggregationAssociationCode
 from lantern.log import init as init_logging
+from lantern.models.record.const import CATALOGUE_NAMESPACE
 from lantern.stores.base import RecordNotFoundError, RecordsNotFoundError, StoreFrozenError
 from lantern.stores.gitlab import CommitResults, GitLabSource, GitLabStore, ProcessedRecord
 
 if TYPE_CHECKING:
     import logging
-    from collections.abc import Collection
+    from collections.abc import Collection, Iterator
     from pathlib import Path
+    from typing import IO
 
     from gitlab import Gitlab
     from gitlab.v4.objects import Project
@@ -56,17 +61,23 @@ class RawRecord:
 
 
 class CachedProcessedRecord(ProcessedRecord):
-    """Represents a record in raw, model and pickled forms with eager processing."""
+    """Represents a record in raw, model, pickled and hashed forms with eager processing."""
 
     def __init__(self, logger: logging.Logger | None, config_str: str, commit_id: str) -> None:
         super().__init__(logger, config_str, commit_id)
         self._pickled = pickle.dumps(self.record, pickle.HIGHEST_PROTOCOL)
+        self._sha1 = self.record.sha1
 
     @property
     def pickled(self) -> bytes:
         """Pre-pickled RecordRevision."""
         return self._pickled
 
+    @property
+    def sha1(self) -> str:
+        """Pre-computed RecordRevision SHA1 hash."""
+        return self._sha1
+
 
 def _process_record(logger: logging.Logger, log_level: int, record_data: RawRecord) -> CachedProcessedRecord:
     """
@@ -90,6 +101,29 @@ def _fetch_record_commit(project: Project, path: str, ref: str) -> RawRecord:
     )
 
 
+def _read_archive_records(archive: IO[bytes]) -> dict[str, str]:
+    """
+    Get record configurations from a GitLab repository archive (tar.gz).
+
+    Archive entries are prefixed with a directory based on the project, ref and commit which is removed.
+
+    Returns a mapping of repository paths to record configurations.
+    """
+    records = {}
+    with tarfile.open(fileobj=archive, mode="r:gz") as tar:
+        for member in tar:
+            if not member.isfile():
+                continue
+            path = member.name.split("/", maxsplit=1)[-1]
+            if not path.startswith("records/") or not path.endswith(".json"):
+                continue
+            f = tar.extractfile(member)
+            if f is None:  # pragma: no cover
+                continue
+            records[path] = f.read().decode("utf-8")
+    return records
+
+
 class GitLabLocalCache:
     """
     Cache of records from a GitLab project repository using a SQLite backing database and in-memory 'flash' layer.
@@ -99,6 +133,7 @@ class GitLabLocalCache:
     - the last known commit for each record (the head commit for each record file when cached)
     - the SHA1 hash for each record (for refreshing the cache)
     - the configured GitLab instance, project ID, branch/ref and head commit from the last cache refresh
+    - catalogue aggregations between records (for reverse lookups, e.g. superseded records)
 
     The cache is automatically populated and/or refreshed when records are accessed using `get()`. The cache can be
     manually invalidated using `purge()` - which will trigger cache recreation on the next `get()` call.
@@ -113,6 +148,10 @@ class GitLabLocalCache:
     Parallel processing is optionally available to improve the performance of:
     - fetching record configurations from GitLab
     - processing and pre-pickling record instances
+
+    Optionally, the cache can be created from a repository archive, rather than fetching each record individually.
+    Record configurations are read from a single archive download and the last commit for each record is resolved in
+    batches using the GitLab GraphQL API.
     """
 
     def __init__(
@@ -123,6 +162,7 @@ class GitLabLocalCache:
         gitlab_client: Gitlab,
         gitlab_token: str,
         gitlab_source: GitLabSource,
+        archive: bool = False,
     ) -> None:
         """Initialize cache."""
         self._logger = logger
@@ -131,6 +171,7 @@ class GitLabLocalCache:
         self._client = gitlab_client
         self._token = gitlab_token
         self._source_ = gitlab_source
+        self._archive = archive
         self._cache_path = path / "cache.db"
 
         self._frozen = False
@@ -295,6 +336,19 @@ class GitLabLocalCache:
                );
                 """
             )
+            tx.execute(
+                """
+                CREATE TABLE IF NOT EXISTS aggregation
+                (
+                    source_id   TEXT NOT NULL,
+                    target_id   TEXT NOT NULL,
+                    association TEXT NOT NULL,
+                    initiative  TEXT
+                );
+                """
+            )
+            tx.execute("CREATE INDEX IF NOT EXISTS aggregation_source ON aggregation (source_id);")
+            tx.execute("CREATE INDEX IF NOT EXISTS aggregation_target ON aggregation (target_id, association);")
 
     @staticmethod
     def _record_upsert(record: CachedProcessedRecord) -> SQL:
@@ -304,7 +358,7 @@ class GitLabLocalCache:
             values={
                 "record_pickled": record.pickled,
                 "record_jsonb": SQL.funcs.jsonb(json.dumps(record.config)),  # ty:ignore[unresolved-attribute]
-                "sha1": record.record.sha1,
+                "sha1": record.sha1,
             },
         )
         upsert = SQL(
@@ -319,6 +373,22 @@ class GitLabLocalCache:
         )
         return insert + upsert
 
+    @staticmethod
+    def _aggregation_inserts(record: RecordRevision) -> list[SQL]:
+        """Generates SQL for indexing catalogue aggregations in a record."""
+        return [
+            SQL.insert(
+                table="aggregation",
+                values={
+                    "source_id": record.file_identifier,
+                    "target_id": aggregation.identifier.identifier,
+                    "association": aggregation.association_type.value,
+                    "initiative": aggregation.initiative_type.value if aggregation.initiative_type else None,
+                },
+            )
+            for aggregation in record.identification.aggregations.filter(namespace=CATALOGUE_NAMESPACE)
+        ]
+
     @staticmethod
     def _meta_upsert(key: str, value: str) -> SQL:
         """Generates SQL for upserting a meta key-value."""
@@ -332,6 +402,9 @@ class GitLabLocalCache:
         self._cache_path.parent.mkdir(parents=True, exist_ok=True)
 
         self._logger.info("Ensuring DB structure")
+        if self.exists:
+            # index existing records before adding aggregations table to prevent an incomplete index
+            self._ensure_aggregations()
         self._init_db(engine=self._engine)
 
     def _build_cache(self, records: list[RawRecord], head_commit_id: str) -> None:
@@ -354,6 +427,9 @@ class GitLabLocalCache:
             self._logger.info("Storing records")
             for record in results:
                 tx.execute(self._record_upsert(record))
+                tx.execute("DELETE FROM aggregation WHERE source_id = ?;", (record.record.file_identifier,))
+                for statement in self._aggregation_inserts(record.record):
+                    tx.execute(statement)
             self._logger.info("Stored %s records", len(records))
             self._logger.info("Storing source and head commit metadata")
             tx.execute(self._meta_upsert(key="source_endpoint", value=self._source.endpoint))
@@ -386,6 +462,75 @@ class GitLabLocalCache:
             delayed(_fetch_record_commit)(project_, path, self._source.ref) for path in paths
         )
 
+    def _fetch_record_last_commits(self, paths: list[str], ref: str) -> dict[str, str]:
+        """
+        Get the last commit ID for a set of files in the GitLab project repository.
+
+        Uses the GitLab GraphQL API to query the last commit for multiple paths in each request (using aliases), in
+        batches to stay within query complexity limits.
+
+        Raises a `RemoteStoreUnavailableError` exception if the commit for any path can't be resolved.
+        """
+        batch_size = 50
+        commits = {}
+
+        for i in range(0, len(paths), batch_size):
+            batch = paths[i : i + batch_size]
+            fields = " ".join(
+                f"p{j}: tree(ref: $ref, path: {json.dumps(path)}) {{ lastCommit {{ sha }} }}"
+                for j, path in enumerate(batch)
+            )
+            query = (
+                f"query($project: ID!, $ref: String!) {{ project(fullPath: $project) {{ repository {{ {fields} }} }} }}"
+            )
+            self._logger.debug("Resolving last commits for records %s to %s", i, i + len(batch))
+            result = self._client.http_post(
+                f"{self._client.url}/api/graphql",
+                post_data={"query": query, "variables": {"project": self._project.path_with_namespace, "ref": ref}},
+            )
+            if not isinstance(result, dict):
+                msg = "Cannot resolve record commits: unexpected response from GitLab GraphQL API."
+                raise RemoteStoreUnavailableError(msg) from None
+            if result.get("errors"):
+                msg = f"Cannot resolve record commits: {result['errors']}"
+                raise RemoteStoreUnavailableError(msg) from None
+            repository = result["data"]["project"]["repository"]
+            for j, path in enumerate(batch):
+                tree = repository.get(f"p{j}") or {}
+                commit = (tree.get("lastCommit") or {}).get("sha")
+                if commit is None:
+                    msg = f"Cannot resolve commit for record '{path}'."
+                    raise RemoteStoreUnavailableError(msg) from None
+                commits[path] = commit
+
+        return commits
+
+    def _fetch_record_archive(self, head_commit: str) -> list[RawRecord]:
+        """
+        Get all record configurations and their head commit IDs from a GitLab project repository archive.
+
+        Steps:
+        - download an archive of the records directory at the given head commit (to a temporary file)
+        - read record configurations from the archive
+        - resolve the last commit for each record in bulk
+
+        The archive is pinned to the head commit so records and commits are consistent. The same head commit should be
+        recorded in the cache.
+
+        Returns a list of tuples ('record configuration as JSON string', 'record commit string').
+        """
+        self._logger.info("Fetching records archive at commit %s", head_commit)
+        with TemporaryFile() as archive:
+            self._project.repository_archive(
+                sha=head_commit, path="records", format="tar.gz", streamed=True, action=archive.write
+            )
+            archive.seek(0)
+            configs = _read_archive_records(archive)
+
+        self._logger.info("Resolving commits for %s records", len(configs))
+        commits = self._fetch_record_last_commits(paths=list(configs.keys()), ref=head_commit)
+        return [RawRecord(config_str=config_str, commit_id=commits[path]) for path, config_str in configs.items()]
+
     def _fetch_latest_records(self) -> list[RawRecord]:
         """
         Get record configurations and their latest commit IDs from the GitLab project repository from after a commit.
@@ -433,13 +578,19 @@ class GitLabLocalCache:
             delayed(_fetch_record_commit)(project_, path, self._source.ref) for path in paths
         )
 
-    def _create_refresh(self, records: list[RawRecord]) -> None:
-        """Common tasks for creating or refreshing the cache."""
-        self._logger.info("Fetching head commit")
-        head_commit = self._project.commits.get(self._head_commit).attributes
+    def _create_refresh(self, records: list[RawRecord], head_commit_id: str | None = None) -> None:
+        """
+        Common tasks for creating or refreshing the cache.
+
+        Where records were fetched at a known head commit (e.g. from an archive), it should be given so the cache
+        records the commit the records relate to, rather than a later commit.
+        """
+        if head_commit_id is None:
+            self._logger.info("Fetching head commit")
+            head_commit_id = self._project.commits.get(self._head_commit).attributes["id"]
 
         self._logger.info("Populating local cache")
-        self._build_cache(records=records, head_commit_id=head_commit["id"])
+        self._build_cache(records=records, head_commit_id=head_commit_id)
 
         self._logger.info("Clearing flash")
         self._flash.clear()
@@ -451,16 +602,24 @@ class GitLabLocalCache:
         Any existing cache is removed and recreated, regardless of whether it's up-to-date. Use `_refresh()` to update
         an existing cache instead.
 
-        Annoyingly, and inefficiently, Git commits for records must be fetched using individual HTTP requests.
+        Unless the cache is set to use a repository archive, Git commits for records must be fetched using individual
+        HTTP requests, which is inefficient.
 
         Steps:
         - remove any existing cache directory if present
-        - query the GitLab API for the JSON config and commit of all records
-        - query the GitLab API for the head commit of the project repo
+        - query the GitLab API for the JSON config and commit of all records (individually or via an archive)
+        - query the GitLab API for the head commit of the project repo (before fetching an archive pinned to it)
         - build and populate the local cache
         """
         self.purge()
 
+        if self._archive:
+            self._logger.info("Fetching all records from repository archive")
+            head_commit = self._head_commit
+            records = self._fetch_record_archive(head_commit=head_commit)
+            self._create_refresh(records=records, head_commit_id=head_commit)
+            return
+
         self._logger.info("Fetching all records (this will take some time)")
         records = self._fetch_record_commits()
         self._create_refresh(records=records)
@@ -579,6 +738,90 @@ class GitLabLocalCache:
         self._flash.update({record.file_identifier: record for record in records})
         return records
 
+    def iter_records(self, file_identifiers: set[str] | None = None, chunk_size: int = 100) -> Iterator[RecordRevision]:
+        """
+        Lazily load all or selected cached records.
+
+        Records are loaded from the backing database in chunks (ordered by file identifier) to bound memory use and
+        are not added to the flash cache. Intended for processing all records once, rather than repeated access.
+
+        Yields RecordRevision instances where they exist in the cache (i.e. unknown records are omitted).
+        """
+        self._ensure_exists()  # cache entrypoint and possibly initial interaction
+
+        selected = sorted(file_identifiers) if file_identifiers else None
+        last_fid = ""
+        while True:
+            query = SQL("SELECT file_identifier, record_pickled FROM record WHERE file_identifier > ?")
+            params: tuple = (last_fid,)
+            if selected is not None:
+                query += SQL(f"AND file_identifier IN ({('?,' * len(selected))[:-1]})")
+                params += tuple(selected)
+            query += SQL("ORDER BY file_identifier LIMIT ?")
+            params += (chunk_size,)
+            with self._engine as tx:
+                results = tx.fetchall(query, params)
+            if not results:
+                return
+
+            self._logger.debug("Loading %s pickled records from cache", len(results))
+            for result in results:
+                yield pickle.loads(result["record_pickled"])  # noqa: S301
+            last_fid = results[-1]["file_identifier"]
+
+    def _ensure_aggregations(self) -> None:
+        """
+        Ensure aggregations are indexed.
+
+        Caches created before aggregations were indexed are indexed from their cached records.
+        """
+        with self._engine as tx:
+            result = tx.fetchone("SELECT name FROM sqlite_master WHERE type='table' AND name='aggregation';")
+        if result is not None:
+            return
+
+        self._logger.info("Indexing aggregations for existing cache")
+        self._init_db(engine=self._engine)
+        with self._engine as tx:
+            for pickled_record in tx.fetchscalars("SELECT record_pickled FROM record"):
+                for statement in self._aggregation_inserts(pickle.loads(pickled_record)):  # noqa: S301
+                    tx.execute(statement)
+
+    def get_related(self, file_identifier: str, association: AggregationAssociationCode) -> list[RecordRevision]:
+        """
+        Load cached records with a catalogue aggregation to a record, for an association type.
+
+        Uses the aggregations index, rather than checking all records.
+        """
+        self._ensure_exists()  # cache entrypoint and possibly initial interaction
+        self._ensure_aggregations()
+
+        with self._engine as tx:
+            file_identifiers = tx.fetchscalars(
+                "SELECT DISTINCT source_id FROM aggregation WHERE target_id = ? AND association = ?;",
+                (file_identifier, association.value),
+            )
+        if not file_identifiers:
+            return []
+        return self.get(file_identifiers=set(file_identifiers))
+
+    def get_superseded_ids(self) -> set[str]:
+        """
+        Get identifiers of records superseded by other records.
+
+        Uses the aggregations index, rather than checking all records.
+        """
+        self._ensure_exists()  # cache entrypoint and possibly initial interaction
+        self._ensure_aggregations()
+
+        with self._engine as tx:
+            return set(
+                tx.fetchscalars(
+                    "SELECT DISTINCT target_id FROM aggregation WHERE association = ?;",
+                    (AggregationAssociationCode.REVISION_OF.value,),
+                )
+            )
+
     def get_hashes(self, file_identifiers: set[str]) -> dict[str, str | None]:
         """
         Get SHA1 hashes for selected cached records.
@@ -601,6 +844,26 @@ class GitLabLocalCache:
         hashes = {result["file_identifier"]: result["sha1"] for result in results}
         return {file_id: hashes.get(file_id) for file_id in file_identifiers}
 
+    def get_revisions(self, file_identifiers: set[str] | None = None) -> dict[str, str]:
+        """
+        Get file revisions for all or selected cached records.
+
+        Uses the stored `file_revision` column, rather than loading records.
+
+        Returns a mapping of file identifiers to file revisions, for records in the cache (i.e. unknown records are
+        omitted).
+        """
+        self._ensure_exists()  # cache entrypoint and possibly initial interaction
+
+        query = SQL("SELECT file_identifier, file_revision FROM record")
+        params: tuple = ()
+        if file_identifiers:
+            query += SQL(f"WHERE file_identifier IN ({('?,' * len(file_identifiers))[:-1]})")
+            params = tuple(file_identifiers)
+        with self._engine as tx:
+            results = tx.fetchall(query, params)
+        return {result["file_identifier"]: result["file_revision"] for result in results}
+
     def get_count(self) -> int:
         """Get number of cached records."""
         self._ensure_exists()  # cache entrypoint and possibly initial interaction
@@ -635,6 +898,8 @@ class GitLabCachedStore(GitLabStore):
 
     The local cache is refreshed on record access or update. It can be fully reset if needed using `purge()`.
 
+    The local cache can optionally be created from a repository archive using `cache_archive` (see `GitLabLocalCache`).
+
     The contents of the given `cache_dir` directory MUST be assumed to be exclusively managed by this class.
     """
 
@@ -645,6 +910,7 @@ class GitLabCachedStore(GitLabStore):
         access_token: str,
         parallel_jobs: int,
         cache_dir: Path,
+        cache_archive: bool = False,
     ) -> None:
         super().__init__(logger=logger, source=source, access_token=access_token)
         self._frozen = False
@@ -656,11 +922,14 @@ class GitLabCachedStore(GitLabStore):
             gitlab_client=self._client,
             gitlab_token=self._access_token,
             gitlab_source=source,
+            archive=cache_archive,
         )
         self._get_hashes_callable = self._cache.get_hashes
 
     @classmethod
-    def from_gitlab_store(cls, store: GitLabStore, parallel_jobs: int, cache_dir: Path) -> GitLabCachedStore:
+    def from_gitlab_store(
+        cls, store: GitLabStore, parallel_jobs: int, cache_dir: Path, cache_archive: bool = False
+    ) -> GitLabCachedStore:
         """Create cached store from base GitLab store."""
         return GitLabCachedStore(
             logger=store._logger,
@@ -668,6 +937,7 @@ class GitLabCachedStore(GitLabStore):
             access_token=store._access_token,
             parallel_jobs=parallel_jobs,
             cache_dir=cache_dir,
+            cache_archive=cache_archive,
         )
 
     def __len__(self) -> int:
@@ -706,6 +976,30 @@ class GitLabCachedStore(GitLabStore):
         missing_fids = file_identifiers - {record.file_identifier for record in results}
         raise RecordsNotFoundError(missing_fids) from None
 
+    def iter_records(self, file_identifiers: set[str] | None = None) -> Iterator[RecordRevision]:
+        """
+        Lazily get some or all records filtered by file identifier.
+
+        Records are loaded from the local cache in chunks, rather than all at once, to bound memory use.
+
+        Raises a `RecordsNotFoundError` exception once all found records are yielded if any selected records aren't
+        found.
+        """
+        found = set()
+        for record in self._cache.iter_records(file_identifiers=file_identifiers):
+            found.add(record.file_identifier)
+            yield record
+        if file_identifiers and len(found) != len(file_identifiers):
+            raise RecordsNotFoundError(file_identifiers - found) from None
+
+    def revisions(self, file_identifiers: set[str] | None = None) -> dict[str, str]:
+        """
+        Get file revisions for all or selected records.
+
+        Uses the local cache rather than loading records.
+        """
+        return self._cache.get_revisions(file_identifiers=file_identifiers)
+
     def select_one(self, file_identifier: str) -> RecordRevision:
         """
         Get specific record by file identifier.
@@ -717,6 +1011,22 @@ class GitLabCachedStore(GitLabStore):
         except RecordsNotFoundError as e:
             raise RecordNotFoundError(file_identifier) from e
 
+    def select_related(self, file_identifier: str, association: AggregationAssociationCode) -> list[RecordRevision]:
+        """
+        Get records with a catalogue aggregation to a record, for an association type (i.e. a reverse lookup).
+
+        Uses an index of aggregations in the local cache.
+        """
+        return self._cache.get_related(file_identifier=file_identifier, association=association)
+
+    def superseded_ids(self) -> set[str]:
+        """
+        Get identifiers of records superseded by other records.
+
+        Uses an index of aggregations in the local cache.
+        """
+        return self._cache.get_superseded_ids()
+
     def _ensure_branch(self, branch: str) -> None:
         if self._frozen:
             msg = f"Branch '{branch}' does not exist and store is frozen. Cannot create."
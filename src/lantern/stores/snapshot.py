@@ -0,0 +1,172 @@
+import mmap
+import pickle
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from lantern.lib.metadata_library.models.record.enums import AggregationAssociationCode
+from lantern.models.record.const import CATALOGUE_NAMESPACE
+from lantern.stores.base import RecordNotFoundError, RecordsNotFoundError, StoreBase
+
+if TYPE_CHECKING:
+    import logging
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from lantern.models.record.revision import RecordRevision
+
+
+class SnapshotStore(StoreBase):
+    """
+    Read-only store backed by a snapshot file of pickled records.
+
+    Snapshots are created from another store using `create()` and consist of:
+    - a data file containing concatenated pickled RecordRevision instances
+    - an index file mapping file identifiers to the offset and length of each record in the data file
+    - an aggregations file mapping target file identifiers and association types to source file identifiers
+
+    The data file is memory-mapped and records are unpickled on demand, so separate processes using the same snapshot
+    share a single copy of the underlying data (via the OS page cache).
+
+    Instances can be pickled cheaply (as only paths are included) for use in parallel processing. Snapshots are always
+    frozen.
+    """
+
+    def __init__(self, logger: logging.Logger, path: Path) -> None:
+        self._logger = logger
+        self._path = path
+        self._data_path = path / "records.bin"
+        self._index_path = path / "index.pickle"
+        self._aggregations_path = path / "aggregations.pickle"
+        self._mmap: mmap.mmap | None = None
+
+    def __getstate__(self):  # noqa: ANN204
+        """Unset memory map and indexes to allow pickling."""
+        state = self.__dict__.copy()
+        state["_mmap"] = None
+        state.pop("_index", None)
+        state.pop("_aggregations", None)
+        return state
+
+    def __len__(self) -> int:
+        """Count of records in store."""
+        return len(self._index)
+
+    @property
+    def path(self) -> Path:
+        """Snapshot directory."""
+        return self._path
+
+    @property
+    def frozen(self) -> bool:
+        """Static value, as snapshots are always frozen."""
+        return True
+
+    @cached_property
+    def _index(self) -> dict[str, tuple[int, int]]:
+        """Mapping of file identifiers to record offsets and lengths in data file."""
+        with self._index_path.open("rb") as f:
+            return pickle.load(f)  # noqa: S301
+
+    @cached_property
+    def _aggregations(self) -> dict[tuple[str, str], list[str]]:
+        """Mapping of target file identifiers and association types to source file identifiers for aggregations."""
+        with self._aggregations_path.open("rb") as f:
+            return pickle.load(f)  # noqa: S301
+
+    @property
+    def _data(self) -> mmap.mmap:
+        """Read-only memory map of data file."""
+        if self._mmap is None:
+            with self._data_path.open("rb") as f:
+                self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mmap
+
+    @classmethod
+    def create(cls, logger: logging.Logger, store: StoreBase, path: Path) -> SnapshotStore:
+        """
+        Create snapshot from all records in a store.
+
+        Any existing snapshot in `path` is overwritten.
+        """
+        snapshot = cls(logger=logger, path=path)
+        path.mkdir(parents=True, exist_ok=True)
+
+        index: dict[str, tuple[int, int]] = {}
+        aggregations: dict[tuple[str, str], list[str]] = {}
+        offset = 0
+        with snapshot._data_path.open("wb") as f:
+            for record in store.iter_records():
+                data = pickle.dumps(record, pickle.HIGHEST_PROTOCOL)
+                f.write(data)
+                index[record.file_identifier] = (offset, len(data))
+                offset += len(data)
+                for aggregation in record.identification.aggregations.filter(namespace=CATALOGUE_NAMESPACE):
+                    key = (aggregation.identifier.identifier, aggregation.association_type.value)
+                    aggregations.setdefault(key, []).append(record.file_identifier)
+            if offset == 0:
+                # empty files cannot be memory-mapped
+                f.write(b"\0")
+        with snapshot._index_path.open("wb") as f:
+            pickle.dump(index, f, pickle.HIGHEST_PROTOCOL)
+        with snapshot._aggregations_path.open("wb") as f:
+            pickle.dump(aggregations, f, pickle.HIGHEST_PROTOCOL)
+
+        logger.info("Created snapshot of %s records at '%s'", len(index), path.resolve())
+        return snapshot
+
+    def _load(self, file_identifier: str) -> RecordRevision:
+        """Unpickle record from data file."""
+        offset, length = self._index[file_identifier]
+        return pickle.loads(self._data[offset : offset + length])  # noqa: S301
+
+    def select(self, file_identifiers: set[str] | None = None) -> list[RecordRevision]:
+        """
+        Get some or all records filtered by file identifier.
+
+        Raises a `RecordsNotFoundError` exception if any selected records aren't found (i.e. all or nothing).
+        """
+        return list(self.iter_records(file_identifiers))
+
+    def iter_records(self, file_identifiers: set[str] | None = None) -> Iterator[RecordRevision]:
+        """
+        Lazily get some or all records filtered by file identifier.
+
+        Raises a `RecordsNotFoundError` exception before yielding if any selected records aren't found.
+        """
+        if file_identifiers:
+            missing_fids = file_identifiers - self._index.keys()
+            if missing_fids:
+                raise RecordsNotFoundError(missing_fids) from None
+        for file_identifier in file_identifiers or self._index.keys():
+            yield self._load(file_identifier)
+
+    def select_one(self, file_identifier: str) -> RecordRevision:
+        """
+        Get specific record by file identifier.
+
+        Raises a `RecordNotFoundError` exception if not found.
+        """
+        if file_identifier not in self._index:
+            raise RecordNotFoundError(file_identifier) from None
+        return self._load(file_identifier)
+
+    def select_related(self, file_identifier: str, association: AggregationAssociationCode) -> list[RecordRevision]:
+        """
+        Get records with a catalogue aggregation to a record, for an association type (i.e. a reverse lookup).
+
+        Uses the snapshot aggregations index.
+        """
+        sources = self._aggregations.get((file_identifier, association.value), [])
+        return [self._load(source) for source in dict.fromkeys(sources)]
+
+    def superseded_ids(self) -> set[str]:
+        """
+        Get identifiers of records superseded by other records.
+
+        Uses the snapshot aggregations index.
+        """
+        revision_of = AggregationAssociationCode.REVISION_OF.value
+        return {target for target, association in self._aggregations if association == revision_of}
+
+    def freeze(self) -> None:
+        """No-op, as snapshots are always frozen."""
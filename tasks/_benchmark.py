@@ -0,0 +1,48 @@
+import logging
+from argparse import ArgumentParser
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+from tests.resources.stores.fake_records_store import FakeRecordsStore
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def get_iterations(description: str, action: str) -> int:
+    """Get number of iterations from command line arguments."""
+    parser = ArgumentParser(description=description)
+    parser.add_argument(
+        "--iterations",
+        "-n",
+        type=int,
+        default=5,
+        help=f"Number of times to {action} all records.",
+    )
+    return parser.parse_args().iterations
+
+
+def init_store() -> tuple[logging.Logger, FakeRecordsStore]:
+    """Initialise a quiet logger and a store of test records."""
+    logger = logging.getLogger("app")
+    logger.setLevel(logging.WARNING)
+    return logger, FakeRecordsStore(logger=logger)
+
+
+def time_iterations(func: Callable[[], object], iterations: int) -> list[float]:
+    """Call a function a number of times, returning the duration of each call."""
+    durations = []
+    for _ in range(iterations):
+        start = perf_counter()
+        func()
+        durations.append(perf_counter() - start)
+    return durations
+
+
+def report(operation: str, count: int, noun: str, durations: list[float]) -> None:
+    """Print total duration, throughput and mean duration per item for a set of timed iterations."""
+    iterations = len(durations)
+    total = sum(durations)
+    mean = total / (iterations * count) * 1000
+    print(f"{operation} {count} {noun}(s) x {iterations} iteration(s) in {total:.3f}s")
+    print(f"Throughput: {iterations * count / total:.0f} {noun}s/s, mean per {noun}: {mean:.2f}ms")
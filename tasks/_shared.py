@@ -111,6 +111,7 @@ def parse_records(
     validate_base: bool = True,
     validate_profiles: bool = True,
     validate_catalogue: Literal[False] = False,
+    parallel_jobs: int = 1,
 ) -> list[tuple[Record, Path]]: ...
 
 
@@ -122,6 +123,7 @@ def parse_records(
     validate_base: bool = True,
     validate_profiles: bool = True,
     validate_catalogue: Literal[True] = True,
+    parallel_jobs: int = 1,
 ) -> list[tuple[RecordCatalogue, Path]]: ...
 
 
@@ -135,6 +137,7 @@ def parse_records(
     validate_base: bool = True,
     validate_profiles: bool = True,
     validate_catalogue: bool = False,
+    parallel_jobs: int = 1,
 ) -> list[tuple[ParseRecordType, Path]]:
     """
     Try to create Records from record configurations within a directory.
@@ -144,29 +147,43 @@ def parse_records(
 
     If needed, profiles validation can be disabled. Invalid records are skipped with a warning.
 
+    Records are validated in parallel where `parallel_jobs` is greater than 1.
+
     Valid records are checked for unsupported content but will not be skipped if present.
 
     Records are returned as a list of (RecordClass, Path) tuples, where 'Path' is the Path to the source file.
     """
     RecordClass = RecordCatalogue if validate_catalogue else Record  # noqa: N806
+    loaded: list[tuple[dict, ParseRecordType, Path]] = []
     records: list[tuple[ParseRecordType, Path]] = []
 
     for config_path in _parse_configs(search_path, glob_pattern=glob_pattern):
         config, path = config_path
         try:
             record = RecordClass.loads(config)
-            if validate_base or validate_catalogue:
-                record.validate(use_profiles=validate_profiles)
         except RecordInvalidError as e:
             logger.warning("Record '%s' does not validate, skipping.", config["file_identifier"])
             logger.info(e.validation_error)
             continue
+        loaded.append((config, cast("ParseRecordType", record), path))
+
+    errors: list[RecordInvalidError | None] = [None] * len(loaded)
+    if validate_base or validate_catalogue:
+        errors = Record.validate_many(
+            [record for _, record, _ in loaded], use_profiles=validate_profiles, parallel_jobs=parallel_jobs
+        )
+
+    for (config, record, path), error in zip(loaded, errors, strict=True):
+        if error is not None:
+            logger.warning("Record '%s' does not validate, skipping.", config["file_identifier"])
+            logger.info(error.validation_error)
+            continue
 
-        if not Record._config_supported(config=config, logger=logger):
+        if not record._supported(config, logger=logger):
             logger.warning(
                 "Record '%s' contains unsupported content the catalogue will ignore.", config["file_identifier"]
             )
-        records.append((cast("ParseRecordType", record), path))
+        records.append((record, path))
 
     logger.info("Discovered %s valid records", len(records))
     return records
@@ -0,0 +1,51 @@
+# Time rendering catalogue item pages for test records
+
+from typing import TYPE_CHECKING
+
+from tasks._benchmark import get_iterations, init_store, report, time_iterations
+from tests.resources.admin_keys import test_keys
+
+from lantern.config import Config as ConfigBase
+from lantern.models.site import ExportMeta
+from lantern.outputs.item_html import ItemCatalogueOutput
+
+if TYPE_CHECKING:
+    import logging
+
+    from bas_metadata_library.standards.magic_administration.v1.utils import AdministrationKeys
+    from tests.resources.stores.fake_records_store import FakeRecordsStore
+
+
+class Config(ConfigBase):
+    """Config with test keys."""
+
+    @property
+    def ADMIN_METADATA_KEYS(self) -> AdministrationKeys:  # noqa: N802
+        """Administration metadata keys."""
+        return test_keys()
+
+
+def benchmark(logger: logging.Logger, store: FakeRecordsStore, iterations: int) -> list[float]:
+    """Render item pages for all records in store a number of times, returning the duration of each iteration."""
+    meta = ExportMeta.from_config(config=Config(), env="testing", build_repo_ref="83fake48", trusted=True)
+    records = store.select()
+
+    def _render() -> None:
+        for record in records:
+            output = ItemCatalogueOutput(logger=logger, meta=meta, record=record, select_record=store.select_one)
+            _ = output.content
+
+    return time_iterations(_render, iterations)
+
+
+def main() -> None:
+    """Entrypoint."""
+    iterations = get_iterations(description="Time rendering catalogue item pages for test records.", action="render")
+    logger, store = init_store()
+
+    durations = benchmark(logger=logger, store=store, iterations=iterations)
+    report(operation="Rendered", count=len(store), noun="item", durations=durations)
+
+
+if __name__ == "__main__":
+    main()
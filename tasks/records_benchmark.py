@@ -0,0 +1,40 @@
+# Time loading and dumping test records
+
+from typing import TYPE_CHECKING
+
+from tasks._benchmark import get_iterations, init_store, report, time_iterations
+
+from lantern.models.record.revision import RecordRevision
+
+if TYPE_CHECKING:
+    from tests.resources.stores.fake_records_store import FakeRecordsStore
+
+
+def benchmark(store: FakeRecordsStore, iterations: int) -> tuple[list[float], list[float]]:
+    """Load and dump all records in store a number of times, returning the duration of each iteration per operation."""
+    records = store.select()
+    configs = [record.dumps(strip_admin=False, with_revision=True) for record in records]
+
+    def _loads() -> None:
+        for config in configs:
+            _ = RecordRevision.loads(config)
+
+    def _dumps() -> None:
+        for record in records:
+            _ = record.dumps(strip_admin=False, with_revision=True)
+
+    return time_iterations(_loads, iterations), time_iterations(_dumps, iterations)
+
+
+def main() -> None:
+    """Entrypoint."""
+    iterations = get_iterations(description="Time loading and dumping test records.", action="load and dump")
+    _logger, store = init_store()
+
+    loads_durations, dumps_durations = benchmark(store=store, iterations=iterations)
+    report(operation="Loaded", count=len(store), noun="record", durations=loads_durations)
+    report(operation="Dumped", count=len(store), noun="record", durations=dumps_durations)
+
+
+if __name__ == "__main__":
+    main()
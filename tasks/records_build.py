@@ -18,7 +18,7 @@ if TYPE_CHECKING:
     from lantern.outputs.base import OutputBase
 
 
-def _get_cli_args() -> tuple[bool, str | None, ExportTarget, SiteEnvironment, set[str]]:
+def _get_cli_args() -> tuple[bool, bool, str | None, ExportTarget, SiteEnvironment, set[str]]:
     """Get command line arguments."""
     parser = ArgumentParser(description="Generate and upload content for selected records and wider static site.")
     parser.add_argument(
@@ -27,6 +27,11 @@ def _get_cli_args() -> tuple[bool, str | None, ExportTarget, SiteEnvironment, se
         action="store_true",
         help="Force branch to set value or default, and selection of records to CLI argument or all.",
     )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Generate and export all selected content, rather than only content changed since the last build.",
+    )
     parser.add_argument(
         "--branch",
         "-b",
@@ -62,26 +67,28 @@ def _get_cli_args() -> tuple[bool, str | None, ExportTarget, SiteEnvironment, se
     )
     args = parser.parse_args()
     records = set(list(args.records or []) + list(args.record or []))
-    return args.force, args.branch, args.target, args.env, records
+    return args.force, args.full, args.branch, args.target, args.env, records
 
 
 def _get_args(
     logger: logging.Logger,
     cat: BasCatalogue,
-    cli_args: tuple[bool, str | None, ExportTarget, SiteEnvironment, set[str]],
-) -> tuple[SiteEnvironment, ExportTarget, str, set[str], str]:
+    cli_args: tuple[bool, bool, str | None, ExportTarget, SiteEnvironment, set[str]],
+) -> tuple[SiteEnvironment, ExportTarget, str, set[str], bool, str]:
     """Get task inputs, interactively if needed/allowed."""
-    cli_force, cli_branch, cli_target, cli_env, cli_references = cli_args
+    cli_force, cli_full, cli_branch, cli_target, cli_env, cli_references = cli_args
 
     env = cli_env
     target = cli_target
     branch = cli_branch or cat.repo.gitlab_default_branch
     identifiers = process_record_references(logger=logger, references=cli_references)
+    _task = "task build-records --force"
+    _task += " --full" if cli_full else ""
 
     if cli_force:
         _records_param = " ".join([f"--record {i}" for i in identifiers]) if identifiers else ""
-        params = f"task build-records --force --branch {branch} --target {target} --env {env} {_records_param}"
-        return env, target, branch, identifiers, params
+        params = f"{_task} --branch {branch} --target {target} --env {env} {_records_param}"
+        return env, target, branch, identifiers, cli_full, params
 
     env = inquirer.list_input(message="Site environment (testing/live)", choices=get_args(SiteEnvironment), default=env)
     target = inquirer.list_input(message="Export target (local/remote)", choices=get_args(ExportTarget), default=target)
@@ -93,8 +100,8 @@ def _get_args(
         logger.info("Note: Any empty set is allowed and will select all records.")
         if not inquirer.confirm(message="Add others?", default=False):
             _records_param = " ".join([f"--record {i}" for i in identifiers]) if identifiers else ""
-            params = f"task check-records --force --branch {branch} --target {target} --env {env} {_records_param}"
-            return env, target, branch, identifiers, params
+            params = f"{_task} --branch {branch} --target {target} --env {env} {_records_param}"
+            return env, target, branch, identifiers, cli_full, params
 
     references = set()
     message = [
@@ -133,8 +140,8 @@ def _get_args(
     identifiers = identifiers.union(process_record_references(logger=logger, references=references))
 
     _records_param = " ".join([f"--record {i}" for i in identifiers]) if identifiers else ""
-    params = f"task build-records --force --branch {branch} --target {target} --env {env} {_records_param}"
-    return env, target, branch, identifiers, params
+    params = f"{_task} --branch {branch} --target {target} --env {env} {_records_param}"
+    return env, target, branch, identifiers, cli_full, params
 
 
 def export(
@@ -144,12 +151,13 @@ def export(
     branch: str,
     identifiers: set[str],
     outputs: list[type[OutputBase]] | None = None,
+    full: bool = False,
 ) -> None:
-    """Run catalogue export, optionally overloading exporter."""
+    """Run catalogue export, optionally overloading exporter and ignoring build manifests."""
     if target == "local":
         cat._envs[env]._untrusted._exporter = LocalExporter(logger=cat._logger, path=Path("export"))  # ty:ignore[invalid-assignment]
         cat._envs[env]._trusted._exporter = LocalExporter(logger=cat._logger, path=Path("export-trusted"))  # ty:ignore[invalid-assignment]
-    cat.export(env=env, identifiers=identifiers, branch=branch, outputs=outputs)
+    cat.export(env=env, identifiers=identifiers, branch=branch, outputs=outputs, full=full)
 
 
 def main() -> None:
@@ -157,10 +165,10 @@ def main() -> None:
     logger, _config, catalogue = init()
 
     cli_args = _get_cli_args()
-    env, target, branch, identifiers, params = _get_args(logger=logger, cat=catalogue, cli_args=cli_args)
+    env, target, branch, identifiers, full, params = _get_args(logger=logger, cat=catalogue, cli_args=cli_args)
 
     start = time.monotonic()
-    export(cat=catalogue, env=env, target=target, branch=branch, identifiers=identifiers)
+    export(cat=catalogue, env=env, target=target, branch=branch, identifiers=identifiers, full=full)
     logger.info("Built site in %s seconds.", round(time.monotonic() - start))
     logger.info("Re-run as: '%s'", params)
 
@@ -18,7 +18,7 @@ if TYPE_CHECKING:
     from lantern.catalogues.bas import BasCatalogue
 
 
-def _get_cli_args() -> tuple[bool, str | None, ExportTarget, SiteEnvironment, set[str]]:
+def _get_cli_args() -> tuple[bool, bool, bool, str | None, ExportTarget, SiteEnvironment, set[str]]:
     """Get command line arguments."""
     parser = ArgumentParser(description="Run checks for selected records and wider static site.")
     parser.add_argument(
@@ -27,6 +27,18 @@ def _get_cli_args() -> tuple[bool, str | None, ExportTarget, SiteEnvironment, se
         action="store_true",
         help="Force branch to set value or default, and selection of records to CLI argument or all.",
     )
+    parser.add_argument(
+        "--refresh",
+        "-r",
+        action="store_true",
+        help="Check all external resources, rather than reusing recent results from the checks cache.",
+    )
+    parser.add_argument(
+        "--incremental",
+        "-i",
+        action="store_true",
+        help="Check only records changed since the last checks for all records. Ignored if records are selected.",
+    )
     parser.add_argument(
         "--branch",
         "-b",
@@ -62,26 +74,30 @@ def _get_cli_args() -> tuple[bool, str | None, ExportTarget, SiteEnvironment, se
     )
     args = parser.parse_args()
     records = set(list(args.records or []) + list(args.record or []))
-    return args.force, args.branch, args.target, args.env, records
+    return args.force, args.refresh, args.incremental, args.branch, args.target, args.env, records
 
 
 def _get_args(
     logger: logging.Logger,
     cat: BasCatalogue,
-    cli_args: tuple[bool, str | None, ExportTarget, SiteEnvironment, set[str]],
-) -> tuple[SiteEnvironment, ExportTarget, str, set[str], str]:
+    cli_args: tuple[bool, bool, bool, str | None, ExportTarget, SiteEnvironment, set[str]],
+) -> tuple[SiteEnvironment, ExportTarget, str, set[str], tuple[bool, bool], str]:
     """Get task inputs, interactively if needed/allowed."""
-    cli_force, cli_branch, cli_target, cli_env, cli_references = cli_args
+    cli_force, cli_refresh, cli_incremental, cli_branch, cli_target, cli_env, cli_references = cli_args
 
     env = cli_env
     target = cli_target
     branch = cli_branch or cat.repo.gitlab_default_branch
     identifiers = process_record_references(logger=logger, references=cli_references)
+    _task = "task check-records --force"
+    _task += " --refresh" if cli_refresh else ""
+    _task += " --incremental" if cli_incremental else ""
+    modes = (cli_refresh, cli_incremental)
 
     if cli_force:
         _records_param = " ".join([f"--record {i}" for i in identifiers]) if identifiers else ""
-        params = f"task check-records --force --branch {branch} --target {target} --env {env} {_records_param}"
-        return env, target, branch, identifiers, params
+        params = f"{_task} --branch {branch} --target {target} --env {env} {_records_param}"
+        return env, target, branch, identifiers, modes, params
 
     env = inquirer.list_input(message="Site environment (testing/live)", choices=get_args(SiteEnvironment), default=env)
     target = inquirer.list_input(message="Export target (local/remote)", choices=get_args(ExportTarget), default=target)
@@ -93,8 +109,8 @@ def _get_args(
         logger.info("Note: Any empty set is allowed and will select all records.")
         if not inquirer.confirm(message="Add others?", default=False):
             _records_param = " ".join([f"--record {i}" for i in identifiers]) if identifiers else ""
-            params = f"task check-records --force --branch {branch} --target {target} --env {env} {_records_param}"
-            return env, target, branch, identifiers, params
+            params = f"{_task} --branch {branch} --target {target} --env {env} {_records_param}"
+            return env, target, branch, identifiers, modes, params
 
     references = set()
     message = [
@@ -133,18 +149,25 @@ def _get_args(
     identifiers = identifiers.union(process_record_references(logger=logger, references=references))
 
     _records_param = " ".join([f"--record {i}" for i in identifiers]) if identifiers else ""
-    params = f"task check-records --force --branch {branch} --target {target} --env {env} {_records_param}"
-    return env, target, branch, identifiers, params
+    params = f"{_task} --branch {branch} --target {target} --env {env} {_records_param}"
+    return env, target, branch, identifiers, modes, params
 
 
 def check(
-    cat: BasCatalogue, env: SiteEnvironment, target: ExportTarget, branch: str, identifiers: set[str], local_path: Path
+    cat: BasCatalogue,
+    env: SiteEnvironment,
+    target: ExportTarget,
+    branch: str,
+    identifiers: set[str],
+    local_path: Path,
+    refresh: bool = False,
+    incremental: bool = False,
 ) -> None:
-    """Run catalogue checks, optionally overloading exporter."""
+    """Run catalogue checks, optionally overloading exporter, bypassing checks cache and/or checking changed records."""
     if target == "local":
         cat._envs[env]._untrusted._exporter = LocalExporter(logger=cat._logger, path=local_path)  # ty:ignore[invalid-assignment]
         # don't need to overload trusted exporter as checks are not supported
-    cat.check(env=env, identifiers=identifiers, branch=branch)
+    cat.check(env=env, identifiers=identifiers, branch=branch, force=refresh, incremental=incremental)
 
 
 def main() -> None:
@@ -152,11 +175,21 @@ def main() -> None:
     logger, _config, catalogue = init()
 
     cli_args = _get_cli_args()
-    env, target, branch, identifiers, params = _get_args(logger=logger, cat=catalogue, cli_args=cli_args)
+    env, target, branch, identifiers, modes, params = _get_args(logger=logger, cat=catalogue, cli_args=cli_args)
+    refresh, incremental = modes
     local_path = Path(f"checks/ad-hoc/{datetime.now(tz=UTC).strftime('%Y-%m-%d--%H-%M-%S')}")
 
     start = time.monotonic()
-    check(cat=catalogue, env=env, target=target, branch=branch, identifiers=identifiers, local_path=local_path)
+    check(
+        cat=catalogue,
+        env=env,
+        target=target,
+        branch=branch,
+        identifiers=identifiers,
+        local_path=local_path,
+        refresh=refresh,
+        incremental=incremental,
+    )
     logger.info("Checked site in %s seconds.", round(time.monotonic() - start))
     logger.info("Re-run as: '%s'", params)
 
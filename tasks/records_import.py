@@ -136,16 +136,18 @@ def _get_args(
     return path, context, params
 
 
-def load(logger: logging.Logger, import_path: Path) -> dict[Path, Record]:
+def load(logger: logging.Logger, import_path: Path, parallel_jobs: int = 1) -> dict[Path, Record]:
     """
     Load valid records from import path.
 
-    Records must pass catalogue validation.
+    Records must pass catalogue validation, optionally validated in parallel.
 
     Returned as a dict of {RecordPath: Record} to allow targeted clean-up later.
     """
     logger.info("Loading records from: '%s'", import_path.resolve())
-    records: list[tuple[Record, Path]] = parse_records(logger=logger, search_path=import_path, validate_catalogue=True)
+    records: list[tuple[Record, Path]] = parse_records(
+        logger=logger, search_path=import_path, validate_catalogue=True, parallel_jobs=parallel_jobs
+    )
     logger.info("Loaded %s valid records from '%s'.", len(records), import_path.resolve())
     return {path: record for record, path in records}
 
@@ -180,12 +182,12 @@ def clean(logger: logging.Logger, records: dict[Path, Record], results: GitUpser
 
 def main() -> None:
     """Entrypoint."""
-    logger, _config, catalogue = init()
+    logger, config, catalogue = init()
 
     cli_args = _get_cli_args()
     import_path, commit_context, params = _get_args(logger=logger, cli_args=cli_args)
 
-    records = load(logger=logger, import_path=import_path)
+    records = load(logger=logger, import_path=import_path, parallel_jobs=config.PARALLEL_JOBS)
     commit = push(logger=logger, cat=catalogue, records=list(records.values()), commit_context=commit_context)
     clean(logger=logger, records=records, results=commit)
     logger.info('Re-run as: "%s"', params)
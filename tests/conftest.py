@@ -67,6 +67,7 @@ from lantern.site import Site
 from lantern.stores.algolia import AlgoliaStore
 from lantern.stores.gitlab import GitLabSource, GitLabStore
 from lantern.stores.gitlab_cache import GitLabCachedStore, GitLabLocalCache
+from lantern.stores.snapshot import SnapshotStore
 from lantern.utils import get_jinja_env, minify_html
 from tests.resources.admin_keys import test_keys
 from tests.resources.catalogues.fake_catalogue import FakeCatalogue
@@ -785,6 +786,12 @@ def fx_gitlab_cached_store_pop(
     return fx_gitlab_cached_store
 
 
+@pytest.fixture()
+def fx_snapshot_store(tmp_path: Path, fx_logger: logging.Logger, fx_fake_store: FakeRecordsStore) -> SnapshotStore:
+    """Snapshot store of fake records."""
+    return SnapshotStore.create(logger=fx_logger, store=fx_fake_store, path=tmp_path / "snapshot")
+
+
 @pytest.fixture()
 def fx_algolia_store(fx_logger: logging.Logger) -> AlgoliaStore:
     """Algolia store."""
@@ -14,9 +14,11 @@ from lantern.catalogues.bas import BasCatalogue, BasCatEnv, BasCatTrusted, BasCa
 from lantern.exporters.cloudfront import CloudFrontExporter
 from lantern.lib.metadata_library.models.record.elements.identification import Aggregations
 from lantern.models.checks import CheckType
+from lantern.models.manifest import SiteManifest
 from lantern.models.repository import GitUpsertContext, GitUpsertResults
-from lantern.models.site import ExportMeta, SiteEnvironment, SiteRedirect
-from lantern.outputs.item_html import ItemAliasesOutput
+from lantern.models.site import ExportMeta, SiteContent, SiteEnvironment, SiteRedirect
+from lantern.outputs.item_html import ItemAliasesOutput, ItemCatalogueOutput
+from lantern.outputs.record_iso import RecordIsoJsonOutput
 from lantern.outputs.redirects import RedirectsOutput
 from lantern.outputs.site_health import SiteHealthOutput
 from lantern.outputs.site_resources import SiteResourcesOutput
@@ -112,6 +114,26 @@ class TestBasCatUntrusted:
         invalidation_keys = set(fx_bas_cat_untrusted._invalidator.invalidate.call_args.args[0])
         assert invalidation_keys.issuperset(expected_invalidation_keys)
 
+    @pytest.mark.cov()
+    def test_export_incremental(self, mocker: MockerFixture, fx_bas_cat_untrusted: BasCatUntrusted):
+        """Can skip exporting unchanged content for untrusted catalogue using a build manifest."""
+        outputs = [ItemAliasesOutput, RecordIsoJsonOutput]
+        fx_bas_cat_untrusted.export(outputs=outputs)
+        assert fx_bas_cat_untrusted._manifest_path.exists()
+
+        spy_stream = mocker.spy(fx_bas_cat_untrusted._exporter, "stream")
+        fx_bas_cat_untrusted.export(outputs=outputs)
+        assert spy_stream.spy_return == []
+
+        fx_bas_cat_untrusted.export(outputs=outputs, full=True)
+        assert len(spy_stream.spy_return) > 0
+
+        fx_bas_cat_untrusted._exporter._skip_unchanged = True
+        spy_upload = mocker.spy(fx_bas_cat_untrusted._exporter, "_upload_object")
+        fx_bas_cat_untrusted.export(outputs=outputs, full=True)
+        assert spy_stream.spy_return == []
+        spy_upload.assert_not_called()
+
     def test_export_site_health(
         self,
         mocker: MockerFixture,
@@ -161,9 +183,9 @@ class TestBasCatUntrusted:
         freezer.move_to(fx_freezer_time)
         # mock Site.generate_content() to return empty list of outputs initially
         meta = ExportMeta.from_config(config=fx_bas_cat_untrusted._config, env=fx_bas_cat_untrusted._env)
-        mocker.patch.object(
-            Site, "generate_content", return_value=[SiteRedirect(path=Path("x"), target=f"{meta.base_url}/y")]
-        )
+        redirect = SiteRedirect(path=Path("x"), target=f"{meta.base_url}/y")
+        mocker.patch.object(Site, "generate_content", return_value=[redirect])
+        mocker.patch.object(SiteManifest, "redirects", new_callable=PropertyMock, return_value=[redirect])
 
         expected_key = "-/redirects.csv"
         expected_row = {
@@ -288,6 +310,24 @@ class TestBasCatEnv:
             Bucket=fx_bas_cat_env._bucket, Key="-/checks/data.json"
         )
         assert result["ResponseMetadata"]["HTTPStatusCode"] == HTTPStatus.OK
+        assert fx_bas_cat_env._checker._cache.path.exists()
+
+    def test_check_incremental(self, mocker: MockerFixture, fx_bas_cat_env: BasCatEnv):
+        """Can check only records changed since the last checks, where history from a previous run exists."""
+        fx_bas_cat_env._checker.check.side_effect = lambda **kwargs: [
+            SiteContent(
+                content=json.dumps({"revisions": kwargs["revisions"], "resource_checks": {}}),
+                path=Path("-/checks/data.json"),
+                media_type="application/json",
+            )
+        ]
+        fx_bas_cat_env.check()
+        assert fx_bas_cat_env._history_path.exists()
+        spy = mocker.spy(fx_bas_cat_env._untrusted, "checks")
+
+        fx_bas_cat_env.check(incremental=True)
+        assert spy.call_args.kwargs["identifiers"] == set()
+        assert ItemCatalogueOutput not in spy.call_args.kwargs["outputs"]
 
     @pytest.mark.cov()
     def test_check_no_trusted_outputs(self, fx_bas_cat_env: BasCatEnv):
@@ -8,6 +8,8 @@ from tests.resources.exporters.fake_exporters import FakeExporterBase
 if TYPE_CHECKING:
     import logging
 
+    from lantern.models.site import SiteContent
+
 
 class TestBaseExporter:
     """Test base exporter via fake exporter class."""
@@ -24,3 +26,10 @@ class TestBaseExporter:
         """Can export some content."""
         base = FakeExporterBase(logger=fx_logger)
         base.export(content=[])
+
+    @pytest.mark.cov()
+    def test_stream(self, fx_logger: logging.Logger, fx_site_content: SiteContent):
+        """Can export some content from an iterable, returning exported paths."""
+        base = FakeExporterBase(logger=fx_logger)
+        result = base.stream(content=iter([fx_site_content]))
+        assert result == [fx_site_content.path]
@@ -0,0 +1,49 @@
+import gzip
+
+import pytest
+
+from lantern.exporters.compression import COMPRESSION_RULES, CompressionRule, compress, get_rule
+
+
+class TestCompression:
+    """Test content compression."""
+
+    @pytest.mark.parametrize(
+        ("media_type", "expected"),
+        [
+            ("text/html", True),
+            ("TEXT/HTML; charset=utf-8", True),
+            ("application/vnd.oai.openapi+json;version=3.1", True),
+            ("image/svg+xml", True),
+            ("image/png", False),
+            ("x", False),
+        ],
+    )
+    def test_get_rule(self, media_type: str, expected: bool):
+        """Can get compression rule for a media type."""
+        result = get_rule(media_type=media_type, rules=COMPRESSION_RULES)
+        assert (result is not None) == expected
+
+    @pytest.mark.parametrize(
+        ("content", "media_type", "expected"),
+        [
+            (b"x" * 2048, "text/html", True),
+            (b"x" * 10, "text/html", False),
+            (b"x" * 2048, "image/png", False),
+        ],
+    )
+    def test_compress(self, content: bytes, media_type: str, expected: bool):
+        """Can compress applicable content."""
+        result = compress(content=content, media_type=media_type, rules=COMPRESSION_RULES)
+        if not expected:
+            assert result is None
+            return
+        assert result is not None
+        assert gzip.decompress(result) == content
+        # deterministic output
+        assert compress(content=content, media_type=media_type, rules=COMPRESSION_RULES) == result
+
+    def test_compress_larger(self):
+        """Cannot compress content where compressed content would be larger."""
+        rules = {"text/plain": CompressionRule(min_size=0)}
+        assert compress(content=b"x", media_type="text/plain", rules=rules) is None
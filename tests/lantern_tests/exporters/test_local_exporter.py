@@ -1,9 +1,11 @@
+import gzip
 import logging
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pytest
 
+from lantern.exporters.compression import COMPRESSION_RULES
 from lantern.exporters.local import LocalExporter
 
 if TYPE_CHECKING:
@@ -65,3 +67,23 @@ class TestLocalExporter:
             assert "Additional properties for" in caplog.text
         else:
             assert "Additional properties for" not in caplog.text
+
+    def test_export_compressed(self, fx_local_exporter: LocalExporter, fx_site_content: SiteContent):
+        """Can export compressed variants of applicable content, and remove variants no longer applicable."""
+        fx_local_exporter._compression = COMPRESSION_RULES
+        fx_site_content.content = "x" * 2048
+        fx_site_content.media_type = "text/html"
+        path = fx_local_exporter.base_path / f"{fx_site_content.path}.gz"
+
+        fx_local_exporter.export(content=[fx_site_content])
+        assert gzip.decompress(path.read_bytes()) == b"x" * 2048
+
+        fx_site_content.content = "x"
+        fx_local_exporter.export(content=[fx_site_content])
+        assert not path.exists()
+
+    def test_stream(self, fx_local_exporter: LocalExporter, fx_site_content: SiteContent):
+        """Can export some content as it is generated."""
+        result = fx_local_exporter.stream(content=iter([fx_site_content]))
+        assert result == [fx_site_content.path]
+        assert fx_local_exporter.base_path.joinpath(fx_site_content.path).exists()
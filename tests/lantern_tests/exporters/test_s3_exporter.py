@@ -1,16 +1,20 @@
+import gzip
 from http import HTTPStatus
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 import pytest
 
+from lantern.exporters.compression import COMPRESSION_RULES
 from lantern.exporters.s3 import S3Exporter
+from lantern.models.site import SiteContent
 
 if TYPE_CHECKING:
     import logging
+    from collections.abc import Iterator
 
     from mypy_boto3_s3 import S3Client
-
-    from lantern.models.site import SiteContent
+    from pytest_mock import MockerFixture
 
 
 class TestS3Exporter:
@@ -53,3 +57,116 @@ class TestS3Exporter:
             assert result["CacheControl"] == "no-store"
         else:
             assert "CacheControl" not in result
+
+    @pytest.mark.parametrize(
+        ("skip_unchanged", "known", "changed", "redirect", "expected"),
+        [
+            (True, True, False, False, False),
+            (True, True, True, False, True),
+            (True, False, False, False, True),
+            (True, True, False, True, True),
+            (False, True, False, False, True),
+        ],
+    )
+    def test_export_unchanged(
+        self,
+        mocker: MockerFixture,
+        fx_s3_exporter: S3Exporter,
+        fx_site_content: SiteContent,
+        skip_unchanged: bool,
+        known: bool,
+        changed: bool,
+        redirect: bool,
+        expected: bool,
+    ):
+        """Can skip uploading content known to be unchanged where content matches existing objects."""
+        fx_s3_exporter._skip_unchanged = skip_unchanged
+        fx_site_content.content = "x"
+        if redirect:
+            fx_site_content.redirect = "x"
+        fx_s3_exporter.export(content=[fx_site_content])
+
+        if changed:
+            # e.g. changed in bucket outside of exports
+            fx_s3_exporter._s3.put_object(Bucket=fx_s3_exporter._bucket, Key=str(fx_site_content.path), Body=b"y")
+        unchanged = {str(fx_site_content.path)} if known else set()
+        spy_head = mocker.spy(fx_s3_exporter._s3, "head_object")
+        spy = mocker.spy(fx_s3_exporter, "_upload_object")
+        fx_s3_exporter.export(content=[fx_site_content], unchanged=unchanged)
+
+        assert spy.called == expected
+        spy_head.assert_not_called()
+        result = fx_s3_exporter._s3.get_object(Bucket=fx_s3_exporter._bucket, Key=str(fx_site_content.path))
+        assert result["Body"].read() == b"x"
+
+    def test_get_etags(self, fx_s3_exporter: S3Exporter):
+        """Can get ETags for existing objects within a prefix."""
+        fx_s3_exporter._s3.put_object(Bucket=fx_s3_exporter._bucket, Key="a/x.txt", Body=b"x")
+        fx_s3_exporter._s3.put_object(Bucket=fx_s3_exporter._bucket, Key="b/x.txt", Body=b"x")
+
+        result = fx_s3_exporter._get_etags(prefix="a/")
+        assert result == {"a/x.txt": "9dd4e461268c8034f5c8564e155c67a6"}
+
+    @pytest.mark.parametrize(("media_type", "expected"), [("text/html", True), ("image/png", False)])
+    def test_export_compressed(
+        self, fx_s3_exporter: S3Exporter, fx_site_content: SiteContent, media_type: str, expected: bool
+    ):
+        """Can export compressed content for applicable media types."""
+        fx_s3_exporter._compression = COMPRESSION_RULES
+        fx_site_content.content = "x" * 2048
+        fx_site_content.media_type = media_type
+
+        fx_s3_exporter.export(content=[fx_site_content])
+        result = fx_s3_exporter._s3.get_object(Bucket=fx_s3_exporter._bucket, Key=str(fx_site_content.path))
+        body = result["Body"].read()
+        if expected:
+            assert result["ContentEncoding"] == "gzip"
+            assert gzip.decompress(body) == b"x" * 2048
+        else:
+            assert "ContentEncoding" not in result
+            assert body == b"x" * 2048
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_stream(self, fx_s3_exporter: S3Exporter, workers: int):
+        """Can export some content as it is generated."""
+        fx_s3_exporter._workers = workers
+        content = [SiteContent(content="x", path=Path(f"{i}.txt"), media_type="text/plain") for i in range(50)]
+
+        result = fx_s3_exporter.stream(content=iter(content))
+        assert result == [item.path for item in content]
+        objects = fx_s3_exporter._s3.list_objects_v2(Bucket=fx_s3_exporter._bucket)
+        assert {o["Key"] for o in objects["Contents"]} == {str(item.path) for item in content}
+
+    def test_stream_unchanged(self, mocker: MockerFixture, fx_s3_exporter: S3Exporter):
+        """Can skip uploading unchanged streamed content, listing existing objects per parent prefix."""
+        fx_s3_exporter._skip_unchanged = True
+        content = [
+            SiteContent(content="x", path=Path("x.txt"), media_type="text/plain"),
+            SiteContent(content="x", path=Path("a/x.txt"), media_type="text/plain"),
+            SiteContent(content="x", path=Path("a/y.txt"), media_type="text/plain"),
+            SiteContent(content="x", path=Path("b/x.txt"), media_type="text/plain"),
+        ]
+        fx_s3_exporter.stream(content=iter(content))
+
+        spy_list = mocker.spy(fx_s3_exporter, "_get_etags")
+        spy_upload = mocker.spy(fx_s3_exporter, "_upload_object")
+        result = fx_s3_exporter.stream(content=iter(content), unchanged={"x.txt", "a/x.txt", "a/y.txt"})
+
+        assert sorted(call.kwargs["prefix"] for call in spy_list.call_args_list) == ["a/", "x.txt"]
+        spy_upload.assert_called_once()
+        assert result == [Path("b/x.txt")]
+
+    @pytest.mark.cov()
+    def test_stream_error(self, mocker: MockerFixture, fx_s3_exporter: S3Exporter, fx_site_content: SiteContent):
+        """Can stop generating content and raise upload errors where an upload fails."""
+        mocker.patch.object(fx_s3_exporter, "_upload_object", side_effect=RuntimeError("x"))
+        consumed = []
+
+        def _content() -> Iterator[SiteContent]:
+            for i in range(1000):
+                consumed.append(i)
+                yield fx_site_content
+
+        with pytest.raises(RuntimeError, match="x"):
+            fx_s3_exporter.stream(content=_content())
+        assert len(consumed) < 1000  # noqa: PLR2004
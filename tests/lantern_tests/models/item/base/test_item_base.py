@@ -6,6 +6,7 @@ from unittest.mock import PropertyMock
 
 import pytest
 from bas_metadata_library.standards.magic_administration.v1 import AdministrationMetadata, Permission
+from jwskate import Jwk
 
 from lantern.lib.metadata_library.models.record.elements.common import (
     Constraint,
@@ -43,9 +44,17 @@ from lantern.lib.metadata_library.models.record.enums import (
 )
 from lantern.lib.metadata_library.models.record.presets.projections import EPSG_4326
 from lantern.lib.metadata_library.models.record.utils.admin import AdministrationKeys, set_admin
+from lantern.models.item.base import item as item_module
 from lantern.models.item.base.elements import Contact, Contacts, Extent, Extents
 from lantern.models.item.base.enums import AccessLevel, Licence, ResourceTypeIcon, ResourceTypeLabel
-from lantern.models.item.base.item import ItemBase, ItemCore, ItemSummaryBase
+from lantern.models.item.base.item import (
+    ItemBase,
+    ItemCore,
+    ItemSummaryBase,
+    _same_keys,
+    clear_admin_cache,
+    get_admin_cached,
+)
 
 if TYPE_CHECKING:
     from pytest_mock import MockerFixture
@@ -140,6 +149,74 @@ class TestItemCore:
         assert item.admin_metadata == admin_b
         assert item._admin_metadata == admin_b
 
+    def test_shared_admin_metadata(
+        self,
+        mocker: MockerFixture,
+        fx_revision_model_min: RecordRevision,
+        fx_admin_meta_element: AdministrationMetadata,
+        fx_admin_meta_keys: AdministrationKeys,
+    ):
+        """Can reuse decrypted admin metadata across items for the same record revision and keys."""
+        clear_admin_cache()
+        spy = mocker.spy(item_module, "get_admin")
+        fx_admin_meta_element.id = fx_revision_model_min.file_identifier
+        set_admin(keys=fx_admin_meta_keys, record=fx_revision_model_min, admin_meta=fx_admin_meta_element)
+
+        item_a = ItemCore(record=fx_revision_model_min, admin_keys=fx_admin_meta_keys)
+        item_b = ItemCore(record=deepcopy(fx_revision_model_min), admin_keys=fx_admin_meta_keys)
+        assert item_a.admin_metadata == fx_admin_meta_element
+        assert item_b.admin_metadata is item_a.admin_metadata
+        assert spy.call_count == 1
+
+        # equal keys (e.g. unpickled separately in another batch) are reused
+        item_c = ItemCore(record=fx_revision_model_min, admin_keys=deepcopy(fx_admin_meta_keys))
+        assert item_c.admin_metadata is item_a.admin_metadata
+        assert spy.call_count == 1
+
+        # changed admin metadata is not reused
+        fx_admin_meta_element.gitlab_issues = ["https://gitlab.example.com/x/-/issues/1"]
+        set_admin(keys=fx_admin_meta_keys, record=fx_revision_model_min, admin_meta=fx_admin_meta_element)
+        item_d = ItemCore(record=fx_revision_model_min, admin_keys=fx_admin_meta_keys)
+        assert item_d.admin_metadata == fx_admin_meta_element
+        assert spy.call_count == len([item_a, item_d])
+
+    def test_same_keys(self, fx_admin_meta_keys: AdministrationKeys):
+        """Can compare admin metadata keys by value."""
+        assert _same_keys(fx_admin_meta_keys, fx_admin_meta_keys)
+        assert _same_keys(fx_admin_meta_keys, deepcopy(fx_admin_meta_keys))
+
+        other = AdministrationKeys(
+            encryption_private=Jwk.generate(alg="ECDH-ES+A128KW", crv="P-256"),
+            signing_public=fx_admin_meta_keys.signing_public,
+        )
+        assert not _same_keys(fx_admin_meta_keys, other)
+
+        unsigned = AdministrationKeys(
+            encryption_private=fx_admin_meta_keys.encryption_private,
+            signing_public=fx_admin_meta_keys.signing_public,
+        )
+        assert fx_admin_meta_keys.signing_private is not None
+        assert not _same_keys(fx_admin_meta_keys, unsigned)
+        assert not _same_keys(unsigned, fx_admin_meta_keys)
+
+    @pytest.mark.cov()
+    def test_shared_admin_metadata_evict(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        fx_revision_model_min: RecordRevision,
+        fx_admin_meta_keys: AdministrationKeys,
+    ):
+        """Can evict oldest cached admin metadata when cache is full."""
+        clear_admin_cache()
+        monkeypatch.setattr(item_module, "ADMIN_METADATA_CACHE_SIZE", 1)
+        record_b = deepcopy(fx_revision_model_min)
+        record_b.file_identifier = "y"
+
+        get_admin_cached(keys=fx_admin_meta_keys, record=fx_revision_model_min)
+        get_admin_cached(keys=fx_admin_meta_keys, record=record_b)
+        assert len(item_module._ADMIN_METADATA_CACHE) == 1
+        assert next(iter(item_module._ADMIN_METADATA_CACHE))[0] == "y"
+
     @pytest.mark.parametrize(
         ("has_admin_metadata", "permissions", "expected"),
         [
@@ -1,6 +1,13 @@
 import pytest
 
-from lantern.models.item.base.utils import md_as_html, md_as_html_unwrapped, md_as_plain
+from lantern.models.item.base.utils import (
+    _html_converter,
+    md_as_html,
+    md_as_html_unwrapped,
+    md_as_plain,
+    md_cache_clear,
+    md_cache_info,
+)
 
 
 class TestMdAsHtml:
@@ -40,3 +47,31 @@ class TestMdAsPlain:
     def test_md_as_plain(self, value: str | None, expected: str):
         """Can convert Markdown to plain text."""
         assert md_as_plain(value) == expected
+
+
+class TestMdCache:
+    """Test Markdown conversion caching."""
+
+    def test_converter_reused(self):
+        """Can reuse the same converter for each conversion in a thread."""
+        assert _html_converter() is _html_converter()
+
+    def test_cache_info(self):
+        """Can get cache statistics and clear cached conversions."""
+        md_cache_clear()
+        assert md_as_html("_x_") == md_as_html("_x_")
+        assert md_as_plain("_x_") == "x"
+
+        info = md_cache_info()
+        assert info["md_as_html"].hits == 1
+        assert info["md_as_html"].misses == 1
+        assert info["md_as_plain"].misses == 1
+
+        md_cache_clear()
+        assert md_cache_info()["md_as_html"].currsize == 0
+
+    def test_cache_isolated(self):
+        """Can convert different values after previous conversions, without state carrying over."""
+        md_cache_clear()
+        _ = md_as_html("> [!NOTE]\n> x")
+        assert md_as_html("x\n* x") == "<p>x</p>\n<ul>\n<li>x</li>\n</ul>"
@@ -127,6 +127,27 @@ class TestItemCatalogue:
         assert item.record == record_b  # unchanged
         assert item._admin_metadata == admin_b
 
+    def test_memoised_properties(self, fx_site_meta: SiteMeta, fx_revision_model_min: RecordRevision):
+        """Derived properties are memoised and cleared when record is changed."""
+        record_b = deepcopy(fx_revision_model_min)
+        record_b.file_identifier = "y"
+        item = ItemCatalogue(
+            site_meta=fx_site_meta,
+            record=fx_revision_model_min,
+            admin_meta_keys=None,
+            trusted_context=False,
+            select_record=_select_record,
+        )
+
+        tabs = item.tabs
+        assert item.tabs is tabs
+        assert item._additional_info is tabs[7]
+
+        item.record = record_b
+        assert "tabs" not in item.__dict__
+        assert item.tabs is not tabs
+        assert item._additional_info.item_id == record_b.file_identifier
+
     @pytest.mark.parametrize(
         ("hierarchy_level", "expected"),
         [
@@ -1,3 +1,4 @@
+from dataclasses import replace
 from http import HTTPMethod, HTTPStatus
 from pathlib import Path
 from typing import TYPE_CHECKING, Final
@@ -91,6 +92,25 @@ class TestCheck:
         assert check.http_status == expected_http_status
         assert check.file_identifier is None
 
+    @pytest.mark.parametrize(
+        ("changes", "same"),
+        [
+            ({}, True),
+            ({"file_identifier": "x", "state": CheckState.PASS}, True),
+            ({"url": "https://example.com/other"}, False),
+            ({"http_method": HTTPMethod.GET}, False),
+            ({"http_status": HTTPStatus.NOT_FOUND}, False),
+            ({"content_length": 1}, False),
+            ({"redirect_location": "x"}, False),
+        ],
+    )
+    def test_key(self, fx_check: Check, changes: dict, same: bool):
+        """Can get key from check properties that determine results."""
+        key = fx_check.key
+        for attr, value in changes.items():
+            setattr(fx_check, attr, value)
+        assert (fx_check.key == key) == same
+
     @pytest.mark.cov()
     @pytest.mark.parametrize("has_auth", [False, True])
     def test_unstructure(self, has_auth: bool):
@@ -108,6 +128,7 @@ class TestCheck:
             "result_output": None,
             "state": "pending",
             "duration": 0.0,
+            "cached": False,
         }
         converter = cattrs.Converter()
         converter.register_unstructure_hook(Check, lambda d: d.unstructure())
@@ -120,6 +141,24 @@ class TestCheck:
         result = converter.unstructure(check)
         assert result == expected
 
+    @pytest.mark.cov()
+    def test_structure(self):
+        """Can create a Check instance from plain types, excluding auth."""
+        check = Check(
+            type=CheckType.DOWNLOADS_ARCGIS_LAYER,
+            url="x",
+            http_auth=HTTPBasicAuth(username="x", password="x"),  # noqa: S106
+            file_identifier="x",
+            state=CheckState.PASS,
+            duration=0.1,
+            result_http_status=HTTPStatus.OK,
+            result_output="OK",
+            cached=True,
+        )
+
+        result = Check.structure(check.unstructure())
+        assert result == replace(check, http_auth=None)
+
 
 def _make_dist_opt(href: str, format_href: str | None = None, size: Size | None = None) -> Distribution:
     """Test helper for distribution checks."""
@@ -0,0 +1,136 @@
+import json
+from pathlib import Path
+
+from lantern.models.manifest import SiteManifest
+from lantern.models.site import SiteContent, SiteRedirect
+
+
+class TestSiteManifest:
+    """Test site build manifest."""
+
+    def test_init(self, tmp_path: Path):
+        """Can create an empty manifest where a manifest file does not exist."""
+        path = tmp_path / "manifest.json"
+        manifest = SiteManifest(path=path)
+        assert manifest.path == path
+        assert manifest.records == {}
+        assert len(manifest) == 0
+
+    def test_dump_load(self, tmp_path: Path, fx_site_content: SiteContent):
+        """Can save a manifest to, and load a manifest from, a file."""
+        path = tmp_path / "x" / "manifest.json"
+        manifest = SiteManifest(path=path)
+        manifest.update(content=[("X", fx_site_content)], fingerprints={"x": "y"}, outputs=["X"])
+        manifest.dump()
+        assert path.exists()
+        with path.open() as f:
+            data = json.load(f)
+        assert data["records"] == {"x": {"X": "y"}}
+
+        result = SiteManifest(path=path)
+        assert result.records == manifest.records
+        assert result.content == manifest.content
+
+    def test_content_hash(self, fx_site_content: SiteContent):
+        """Can hash content items including export properties."""
+        value = SiteManifest.content_hash(fx_site_content)
+        assert value == SiteManifest.content_hash(fx_site_content)
+
+        fx_site_content.object_meta = {"x": "x"}
+        assert value != SiteManifest.content_hash(fx_site_content)
+
+    def test_unchanged(self, tmp_path: Path):
+        """Can check whether a record fingerprint has changed for a set of outputs."""
+        manifest = SiteManifest(path=tmp_path / "manifest.json")
+        manifest.records = {"x": {"X": "y"}}
+        assert manifest.unchanged("x", "y", ["X"])
+        assert not manifest.unchanged("x", "z", ["X"])
+        assert not manifest.unchanged("y", "y", ["X"])
+        assert not manifest.unchanged("x", "y", ["X", "Y"])
+
+    def test_full(self, tmp_path: Path, fx_site_content: SiteContent):
+        """Can ignore existing entries to force a full rebuild whilst keeping them until replaced."""
+        path = tmp_path / "manifest.json"
+        manifest = SiteManifest(path=path)
+        manifest.update(content=[("X", fx_site_content)], fingerprints={"x": "y"}, outputs=["X"])
+        manifest.dump()
+
+        result = SiteManifest(path=path, full=True)
+        assert result.records == manifest.records
+        assert not result.unchanged("x", "y", ["X"])
+        assert result.update(content=[("X", fx_site_content)], fingerprints={"x": "y"}, outputs=["X"]) == [
+            fx_site_content
+        ]
+        assert result.unchanged_content == {str(fx_site_content.path)}
+
+    def test_update(self, tmp_path: Path):
+        """Can update manifest and return new or changed content only."""
+        manifest = SiteManifest(path=tmp_path / "manifest.json")
+        global_ = SiteContent(content="x", path=Path("x.txt"), media_type="text/plain")
+        record = SiteContent(content="x", path=Path("x.json"), media_type="x", object_meta={"file_identifier": "x"})
+
+        result = manifest.update(content=[("G", global_), ("X", record)], fingerprints={"x": "1"}, outputs=["X"])
+        assert result == [global_, record]
+
+        record.content = "y"
+        result = manifest.update(content=[("G", global_), ("X", record)], fingerprints={"x": "2"}, outputs=["X"])
+        assert result == [record]
+        assert manifest.records == {"x": {"X": "2"}}
+
+    def test_update_removed(self, tmp_path: Path):
+        """Can remove content no longer generated for a regenerated record."""
+        manifest = SiteManifest(path=tmp_path / "manifest.json")
+        alias = SiteRedirect(
+            path=Path("x/index.html"), target="https://example.com/y", object_meta={"file_identifier": "x"}
+        )
+        manifest.update(content=[("X", alias)], fingerprints={"x": "1"}, outputs=["X"])
+        assert len(manifest.redirects) == 1
+
+        manifest.update(content=[], fingerprints={"x": "2"}, outputs=["X"])
+        assert len(manifest) == 0
+        assert manifest.redirects == []
+
+    def test_update_other_outputs(self, tmp_path: Path):
+        """Can keep content for outputs not included when updating a manifest."""
+        manifest = SiteManifest(path=tmp_path / "manifest.json")
+        meta = {"file_identifier": "x"}
+        x = SiteContent(content="x", path=Path("x.json"), media_type="x", object_meta=meta)
+        y = SiteContent(content="y", path=Path("y.json"), media_type="x", object_meta=meta)
+        manifest.update(content=[("X", x), ("Y", y)], fingerprints={"x": "1"}, outputs=["X", "Y"])
+
+        manifest.update(content=[], fingerprints={"x": "2"}, outputs=["X"])
+        assert list(manifest.content.keys()) == ["y.json"]
+        assert manifest.records == {"x": {"X": "2", "Y": "1"}}
+
+    def test_prune(self, tmp_path: Path):
+        """Can remove records, and their content, no longer in a store."""
+        manifest = SiteManifest(path=tmp_path / "manifest.json")
+        global_ = SiteContent(content="x", path=Path("x.txt"), media_type="text/plain")
+        record = SiteContent(content="x", path=Path("x.json"), media_type="x", object_meta={"file_identifier": "x"})
+        manifest.update(content=[("G", global_), ("X", record)], fingerprints={"x": "1"}, outputs=["X"])
+
+        manifest.prune(set())
+        assert manifest.records == {}
+        assert list(manifest.content.keys()) == ["x.txt"]
+
+    def test_redirects(self, tmp_path: Path):
+        """Can get redirects for all content in manifest."""
+        manifest = SiteManifest(path=tmp_path / "manifest.json")
+        target = "https://example.com/y"
+        manifest.update(content=[("G", SiteRedirect(path=Path("x"), target=target))], fingerprints={}, outputs=[])
+
+        result = manifest.redirects
+        assert len(result) == 1
+        assert result[0].path == Path("x")
+        assert result[0].redirect == target
+
+    def test_iter_update(self, tmp_path: Path):
+        """Can lazily update manifest and yield new or changed content only."""
+        manifest = SiteManifest(path=tmp_path / "manifest.json")
+        content = [SiteContent(content="x", path=Path(f"{i}.txt"), media_type="text/plain") for i in range(2)]
+
+        result = manifest.iter_update(content=(("G", item) for item in content), fingerprints={}, outputs=[])
+        assert next(result) == content[0]
+        assert len(manifest) == 1
+        assert list(result) == [content[1]]
+        assert len(manifest) == len(content)
@@ -4,7 +4,7 @@ from unittest.mock import PropertyMock
 import pytest
 
 from lantern.models.checks import CheckType
-from lantern.outputs.base import OutputBase, OutputRecord, OutputRecords, OutputSite
+from lantern.outputs.base import OutputBase, OutputRecord, OutputRecordContext, OutputRecords, OutputSite
 from tests.resources.outputs.fake_outputs import FakeOutputBase, FakeOutputRecord, FakeOutputRecords, FakeOutputSite
 
 if TYPE_CHECKING:
@@ -62,6 +62,21 @@ class TestSiteOutput:
         assert site._jinja is not None
 
 
+class TestOutputRecordContext:
+    """Test shared record output context."""
+
+    def test_representations(self, fx_revision_model_min: RecordRevision):
+        """Can generate and reuse record representations."""
+        context = OutputRecordContext(record=fx_revision_model_min, strip_admin=True)
+
+        assert context.strip_admin is True
+        assert context.data == fx_revision_model_min.dumps(strip_admin=True)
+        assert context.json == fx_revision_model_min.dumps_json(strip_admin=True)
+        assert context.xml == fx_revision_model_min.dumps_xml(strip_admin=True)
+        assert context.xml_doc.getroot() is not None
+        assert context.xml_doc is context.xml_doc
+
+
 class TestRecordOutput:
     """Test record output via fake output class."""
 
@@ -98,6 +113,29 @@ class TestRecordOutput:
 
         assert record._strip_admin != trusted
 
+    @pytest.mark.parametrize("provided", [False, True])
+    def test_context(
+        self,
+        fx_logger: logging.Logger,
+        fx_export_meta: ExportMeta,
+        fx_revision_model_min: RecordRevision,
+        provided: bool,
+    ):
+        """Can use a provided record context, or create one if needed."""
+        context = OutputRecordContext(record=fx_revision_model_min, strip_admin=not fx_export_meta.trusted)
+        record = FakeOutputRecord(
+            logger=fx_logger,
+            meta=fx_export_meta,
+            name="Fake Base",
+            check_type=CheckType.NONE,
+            record=fx_revision_model_min,
+            context=context if provided else None,
+        )
+
+        assert (record._context is context) == provided
+        record._strip_admin = not record._strip_admin
+        assert record._context.strip_admin == record._strip_admin
+
 
 class TestRecordsOutput:
     """Test records output via fake output class."""
@@ -115,3 +153,22 @@ class TestRecordsOutput:
             select_records=fx_select_records,
         )
         assert isinstance(record, OutputRecords)
+
+    @pytest.mark.parametrize("lazy", [False, True])
+    def test_records(
+        self,
+        fx_logger: logging.Logger,
+        fx_export_meta: ExportMeta,
+        fx_select_records_fixed: SelectRecordsProtocol,
+        lazy: bool,
+    ):
+        """Can get records, lazily if supported."""
+        record = FakeOutputRecords(
+            logger=fx_logger,
+            meta=fx_export_meta,
+            name="Fake Base",
+            check_type=CheckType.NONE,
+            select_records=fx_select_records_fixed,
+            iter_records=(lambda file_identifiers=None: iter(fx_select_records_fixed())) if lazy else None,
+        )
+        assert list(record._records()) == fx_select_records_fixed()
@@ -159,6 +159,7 @@ class TestChecksOutput:
                 duration=0.1,
                 result_http_status=HTTPStatus.OK,
                 result_output="OK",
+                cached=True,
             ),
             Check(
                 type=CheckType.RECORD_PAGES_XML,
@@ -180,12 +181,14 @@ class TestChecksOutput:
         if not build_ref:
             fx_export_meta.build_repo_ref = None
             fx_export_meta.build_repo_url = None
-        output = ChecksOutput(logger=fx_logger, meta=fx_export_meta, checks=checks)
+        output = ChecksOutput(logger=fx_logger, meta=fx_export_meta, checks=checks, revisions={"x": "y"})
 
         results = output._data
         assert isinstance(results, dict)
         assert isinstance(results["time"], str)
         assert results["stats"] == {"passed": 1, "failed": 1, "skipped": 1}
+        assert results["cached"] == 1
+        assert results["revisions"] == {"x": "y"}
         if build_ref:
             assert results["commit"] == {
                 "href": "https://example.com/-/commit/83fake48",
@@ -196,6 +199,7 @@ class TestChecksOutput:
         assert isinstance(results["site_checks"], list)
         assert results["site_checks"][0]["state"] == "passed"
         assert results["site_checks"][0]["http_auth"] == "[**REDACTED**]"
+        assert results["site_checks"][0]["cached"] is True
         assert isinstance(results["resource_checks"], dict)
         assert results["resource_checks"]["x"][0]["state"] == "failed"
         assert results["resource_checks"]["x"][1]["state"] == "skipped"
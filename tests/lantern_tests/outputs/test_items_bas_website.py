@@ -97,6 +97,14 @@ class TestItemsBasWebsiteOutput:
         assert len(results) == 1
         assert results[0].resource_id == "in_scope"
 
+    def test_in_scope_items_superseded_ids(self, fx_records_bas_website_output: ItemsBasWebsiteOutput):
+        """Can select items in-scope for inclusion in website search using a superseded records callable."""
+        fx_records_bas_website_output._select_records = self._get_records_in_scope
+        fx_records_bas_website_output._superseded_ids = lambda: {"out_scope_superseded", "in_scope"}
+
+        results = fx_records_bas_website_output._in_scope_items
+        assert len(results) == 0
+
     def test_content(self, fx_records_bas_website_output: ItemsBasWebsiteOutput):
         """Can generate site content items."""
         build_ref = "x"
@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING
 
 import pytest
 
+from lantern.lib.metadata_library.models.record.enums import AggregationAssociationCode
 from lantern.models.record.record import Record
 from lantern.stores.base import RecordNotFoundError, RecordsNotFoundError, StoreFrozenUnsupportedError
 from tests.resources.stores.fake_records_store import FakeRecordsStore
@@ -72,6 +73,10 @@ class TestBaseStore:
         with pytest.raises(RecordsNotFoundError):
             fx_fake_store.select(file_identifiers={"invalid"})
 
+    def test_iter_records(self, fx_fake_store: FakeRecordsStore):
+        """Can lazily get all records from store."""
+        assert list(fx_fake_store.iter_records()) == fx_fake_store.select()
+
     def test_select_one(self, fx_fake_store: FakeRecordsStore):
         """Can get a specific record from store."""
         expected = fx_fake_store._records[0]
@@ -83,6 +88,28 @@ class TestBaseStore:
         with pytest.raises(RecordNotFoundError):
             fx_fake_store.select_one("invalid")
 
+    def test_revisions(self, fx_fake_store: FakeRecordsStore):
+        """Can get file revisions of records."""
+        record = fx_fake_store._records[0]
+        assert fx_fake_store.revisions({record.file_identifier}) == {record.file_identifier: record.file_revision}
+        assert len(fx_fake_store.revisions()) == len(fx_fake_store)
+
+    @pytest.mark.parametrize(
+        ("file_identifier", "expected"),
+        [
+            ("7e3611a6-8dbf-4813-aaf9-dadf9decff5b", ["30825673-6276-4e5a-8a97-f97f2094cd25"]),
+            ("invalid", []),
+        ],
+    )
+    def test_select_related(self, fx_fake_store: FakeRecordsStore, file_identifier: str, expected: list[str]):
+        """Can get records with aggregations to a record."""
+        results = fx_fake_store.select_related(file_identifier, AggregationAssociationCode.REVISION_OF)
+        assert [record.file_identifier for record in results] == expected
+
+    def test_superseded_ids(self, fx_fake_store: FakeRecordsStore):
+        """Can get identifiers of superseded records."""
+        assert "7e3611a6-8dbf-4813-aaf9-dadf9decff5b" in fx_fake_store.superseded_ids()
+
     def test_frozen_unsupported(self, fx_fake_store: FakeRecordsStore):
         """Cannot freeze a store that does not support freezing."""
         with pytest.raises(StoreFrozenUnsupportedError):
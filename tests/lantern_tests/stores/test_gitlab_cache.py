@@ -1,6 +1,8 @@
+import io
 import json
 import pickle
 import re
+import tarfile
 from pathlib import Path
 from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, PropertyMock
@@ -9,6 +11,8 @@ import pytest
 from gitlab import Gitlab
 from requests.exceptions import ConnectionError as RequestsConnectionError
 
+from lantern.lib.metadata_library.models.record.enums import AggregationAssociationCode
+from lantern.models.record.const import CATALOGUE_NAMESPACE
 from lantern.models.record.revision import RecordRevision
 from lantern.stores.base import RecordNotFoundError, RecordsNotFoundError, StoreFrozenError
 from lantern.stores.gitlab import CommitResults, GitLabSource, GitLabStore
@@ -23,6 +27,7 @@ from lantern.stores.gitlab_cache import (
     RawRecord,
     RemoteStoreUnavailableError,
     _fetch_record_commit,
+    _read_archive_records,
 )
 from tests.conftest import _gitlab_cache_create
 
@@ -51,6 +56,26 @@ class TestCachedProcessedRecord:
         assert unpickled == result.record
         assert result.record.file_identifier == fx_record_config_min["file_identifier"]
         assert result.record.file_revision == config_expected["file_revision"]
+        assert result.sha1 == result.record.sha1
+
+
+def _make_archive(files: dict[str, str]) -> bytes:
+    """Create a tar.gz archive in the same structure as a GitLab repository archive."""
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        for name, content in files.items():
+            data = content.encode("utf-8")
+            info = tarfile.TarInfo(name=f"x-main-abc123/{name}")
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+def test_read_archive_records():
+    """Can read record configurations from a repository archive, excluding other files."""
+    archive = _make_archive({"records/a1/b2/a1b2c3.json": "{}", "records/README.md": "x", "other.json": "{}"})
+    result = _read_archive_records(io.BytesIO(archive))
+    assert result == {"records/a1/b2/a1b2c3.json": "{}"}
 
 
 class TestGitLabLocalCache:
@@ -316,6 +341,18 @@ class TestGitLabLocalCache:
 
         assert len(fx_gitlab_cache_pop._flash) == 0
 
+    def test_create_refresh_head_commit(self, mocker: MockerFixture, fx_gitlab_cache_pop: GitLabLocalCache):
+        """Can use a known head commit (e.g. an archive was fetched at) rather than fetching the current head commit."""
+        mocker.patch.object(fx_gitlab_cache_pop, "_build_cache", return_value=None)
+        mock_project = MagicMock()
+        mocker.patch.object(type(fx_gitlab_cache_pop), "_project", new_callable=PropertyMock, return_value=mock_project)
+
+        fx_gitlab_cache_pop._create_refresh(records=[], head_commit_id="x")
+
+        # noinspection PyUnresolvedReferences
+        assert fx_gitlab_cache_pop._build_cache.call_args.kwargs["head_commit_id"] == "x"
+        mock_project.commits.get.assert_not_called()
+
     @pytest.mark.vcr
     @pytest.mark.block_network
     def test_fetch_record_commit(self, fx_gitlab_cache: GitLabLocalCache, fx_record_config_min: dict):
@@ -344,6 +381,58 @@ class TestGitLabLocalCache:
         assert all(isinstance(item, RawRecord) for item in results)
         assert results == expected
 
+    def test_fetch_record_last_commits(self, mocker: MockerFixture, fx_gitlab_cache: GitLabLocalCache):
+        """Can fetch latest commits for a set of files in batches from the remote repository."""
+        paths = [f"records/{i}.json" for i in range(60)]
+        mock_project = MagicMock()
+        mock_project.path_with_namespace = "x/y"
+        mocker.patch.object(type(fx_gitlab_cache), "_project", new_callable=PropertyMock, return_value=mock_project)
+
+        def _graphql(path: str, post_data: dict) -> dict:
+            aliases = re.findall(r"(p\d+): tree", post_data["query"])
+            return {"data": {"project": {"repository": {a: {"lastCommit": {"sha": "abc123"}} for a in aliases}}}}
+
+        mock_post = mocker.patch.object(fx_gitlab_cache._client, "http_post", side_effect=_graphql)
+
+        results = fx_gitlab_cache._fetch_record_last_commits(paths=paths, ref="x")
+        assert results == dict.fromkeys(paths, "abc123")
+        assert mock_post.call_count == 2  # noqa: PLR2004
+
+    @pytest.mark.parametrize(
+        "response",
+        [
+            {"errors": [{"message": "x"}]},
+            {"data": {"project": {"repository": {"p0": {"lastCommit": None}}}}},
+        ],
+    )
+    def test_fetch_record_last_commits_error(
+        self, mocker: MockerFixture, fx_gitlab_cache: GitLabLocalCache, response: dict
+    ):
+        """Cannot fetch latest commits where the remote repository cannot resolve them."""
+        mocker.patch.object(type(fx_gitlab_cache), "_project", new_callable=PropertyMock, return_value=MagicMock())
+        mocker.patch.object(fx_gitlab_cache._client, "http_post", return_value=response)
+
+        with pytest.raises(RemoteStoreUnavailableError):
+            fx_gitlab_cache._fetch_record_last_commits(paths=["records/x.json"], ref="x")
+
+    def test_fetch_record_archive(
+        self, mocker: MockerFixture, fx_gitlab_cache: GitLabLocalCache, fx_record_config_min: dict
+    ):
+        """Can fetch all record configurations and their latest commits from a repository archive."""
+        commit = "abc123"
+        path = "records/a1/b2/a1b2c3.json"
+        config_str = json.dumps(fx_record_config_min, ensure_ascii=False)
+        archive = _make_archive({path: config_str})
+
+        mock_project = MagicMock()
+        mock_project.repository_archive.side_effect = lambda **kwargs: kwargs["action"](archive)
+        mocker.patch.object(type(fx_gitlab_cache), "_project", new_callable=PropertyMock, return_value=mock_project)
+        mocker.patch.object(fx_gitlab_cache, "_fetch_record_last_commits", return_value={path: commit})
+
+        results = fx_gitlab_cache._fetch_record_archive(head_commit=commit)
+        assert results == [RawRecord(config_str=config_str, commit_id=commit)]
+        assert mock_project.repository_archive.call_args.kwargs["sha"] == commit
+
     @pytest.mark.vcr
     @pytest.mark.block_network
     @pytest.mark.parametrize("mode", [None, "renamed", "deleted"])
@@ -423,26 +512,36 @@ class TestGitLabLocalCache:
         with pytest.raises(CacheTooOutdatedError):
             _ = fx_gitlab_cache_pop._fetch_latest_records()
 
-    def test_create(self, mocker: MockerFixture, fx_gitlab_cache: GitLabLocalCache, fx_record_config_min: dict):
+    @pytest.mark.parametrize("archive", [False, True])
+    def test_create(
+        self, mocker: MockerFixture, fx_gitlab_cache: GitLabLocalCache, fx_record_config_min: dict, archive: bool
+    ):
         """
-        Can fetch and populate cache with records from remote repository.
+        Can fetch and populate cache with records from remote repository, optionally using a repository archive.
 
         This mocks fetching data as `_create()` is a high-level method and fetch methods are tested elsewhere.
         """
         commit = "abc123"
+        fx_gitlab_cache._archive = archive
 
         records = [RawRecord(config_str=json.dumps(fx_record_config_min, ensure_ascii=False), commit_id=commit)]
-        mocker.patch.object(fx_gitlab_cache, "_fetch_record_commits", return_value=records)
+        mock_fetch = mocker.patch.object(fx_gitlab_cache, "_fetch_record_commits", return_value=records)
+        mock_fetch_archive = mocker.patch.object(fx_gitlab_cache, "_fetch_record_archive", return_value=records)
 
         head_commit = {"id": commit}
         mock_project = MagicMock()
         mock_project.commits.get.return_value.attributes = head_commit
         mock_project.http_url_to_repo = "https://gitlab.example.com/x.git"
         mocker.patch.object(type(fx_gitlab_cache), "_project", new_callable=PropertyMock, return_value=mock_project)
+        mocker.patch.object(type(fx_gitlab_cache), "_head_commit", new_callable=PropertyMock, return_value=commit)
 
         fx_gitlab_cache._create()
 
         assert fx_gitlab_cache.exists
+        assert mock_fetch_archive.called == archive
+        if archive:
+            mock_fetch_archive.assert_called_once_with(head_commit=commit)
+        assert mock_fetch.called != archive
 
     def test_refresh(self, mocker: MockerFixture, fx_gitlab_cache_pop: GitLabLocalCache, fx_record_config_min: dict):
         """
@@ -760,6 +859,34 @@ class TestGitLabLocalCache:
         results = fx_gitlab_cache.get(file_identifiers=selected)
         assert len(results) == expected_len
 
+    @pytest.mark.parametrize("selected", [None, {"x"}, {"x", "y"}, {"invalid"}, {"x", "invalid"}])
+    def test_iter_records(
+        self,
+        mocker: MockerFixture,
+        fx_config: Config,
+        fx_gitlab_cache: GitLabLocalCache,
+        fx_record_config_min: dict,
+        selected: set[str] | None,
+    ):
+        """Can lazily get selected or all records from cache in chunks, without using flash cache."""
+        commit = "x"
+        fids = ["x", "y", "z"]
+        records = [
+            RawRecord(
+                config_str=json.dumps({**fx_record_config_min, "file_identifier": fid}, ensure_ascii=False),
+                commit_id=commit,
+            )
+            for fid in fids
+        ]
+        fx_gitlab_cache._build_cache(records=records, head_commit_id=commit)
+        mocker.patch.object(fx_gitlab_cache, "_ensure_exists", return_value=None)
+        expected = sorted(set(fids) & selected) if selected else fids
+
+        results = list(fx_gitlab_cache.iter_records(file_identifiers=selected, chunk_size=2))
+        assert [record.file_identifier for record in results] == expected
+        assert all(isinstance(item, RecordRevision) for item in results)
+        assert len(fx_gitlab_cache._flash) == 0
+
     @pytest.mark.parametrize("selected", [{"x"}, {"x", "y"}, {"invalid"}])
     def test_get_hashes(
         self,
@@ -797,6 +924,95 @@ class TestGitLabLocalCache:
         results = fx_gitlab_cache.get_hashes(selected)
         assert results == expected
 
+    @pytest.mark.parametrize(("selected", "expected"), [(None, {"x", "y"}), ({"x"}, {"x"}), ({"invalid"}, set())])
+    def test_get_revisions(
+        self,
+        mocker: MockerFixture,
+        fx_gitlab_cache: GitLabLocalCache,
+        fx_record_config_min: dict,
+        selected: set[str] | None,
+        expected: set[str],
+    ):
+        """Can get file revisions of selected or all records without loading records."""
+        commit = "x"
+        records = [
+            RawRecord(
+                config_str=json.dumps({**fx_record_config_min, "file_identifier": fid}, ensure_ascii=False),
+                commit_id=commit,
+            )
+            for fid in ["x", "y"]
+        ]
+        fx_gitlab_cache._build_cache(records=records, head_commit_id=commit)
+        mocker.patch.object(fx_gitlab_cache, "_ensure_exists", return_value=None)
+        spy = mocker.spy(pickle, "loads")
+
+        results = fx_gitlab_cache.get_revisions(selected)
+        assert results == dict.fromkeys(expected, commit)
+        spy.assert_not_called()
+
+    def test_ensure_aggregations(self, mocker: MockerFixture, fx_gitlab_cache_pop: GitLabLocalCache):
+        """Can index aggregations for an existing cache created before aggregations were indexed."""
+        mocker.patch.object(fx_gitlab_cache_pop, "_ensure_exists", return_value=None)
+        table_sql = "SELECT name FROM sqlite_master WHERE type='table' AND name='aggregation';"
+        with fx_gitlab_cache_pop._engine as tx:
+            assert tx.fetchone(table_sql) is None
+
+        fx_gitlab_cache_pop._ensure_aggregations()
+
+        with fx_gitlab_cache_pop._engine as tx:
+            assert tx.fetchone(table_sql) is not None
+        assert fx_gitlab_cache_pop.get_superseded_ids() == set()
+
+    @pytest.mark.parametrize(
+        ("file_identifier", "association", "expected"),
+        [
+            ("y", AggregationAssociationCode.REVISION_OF, ["x"]),
+            ("y", AggregationAssociationCode.CROSS_REFERENCE, []),
+            ("x", AggregationAssociationCode.REVISION_OF, []),
+        ],
+    )
+    def test_get_related(
+        self,
+        mocker: MockerFixture,
+        fx_gitlab_cache: GitLabLocalCache,
+        fx_record_config_min: dict,
+        file_identifier: str,
+        association: AggregationAssociationCode,
+        expected: list[str],
+    ):
+        """Can get records with aggregations to a record, and superseded records, using aggregations index."""
+        commit = "x"
+        aggregation = {
+            "identifier": {
+                "identifier": "y",
+                "href": f"https://{CATALOGUE_NAMESPACE}/items/y",
+                "namespace": CATALOGUE_NAMESPACE,
+            },
+            "association_type": AggregationAssociationCode.REVISION_OF.value,
+        }
+        config_x = json.loads(json.dumps(fx_record_config_min))
+        config_x["file_identifier"] = "x"
+        config_x["identification"]["aggregations"] = [aggregation]
+        records = [
+            RawRecord(config_str=json.dumps(config_x, ensure_ascii=False), commit_id=commit),
+            RawRecord(
+                config_str=json.dumps({**fx_record_config_min, "file_identifier": "y"}, ensure_ascii=False),
+                commit_id=commit,
+            ),
+        ]
+        fx_gitlab_cache._build_cache(records=records, head_commit_id=commit)
+        mocker.patch.object(fx_gitlab_cache, "_ensure_exists", return_value=None)
+
+        results = fx_gitlab_cache.get_related(file_identifier=file_identifier, association=association)
+        assert [record.file_identifier for record in results] == expected
+        assert fx_gitlab_cache.get_superseded_ids() == {"y"}
+
+        # aggregations are replaced when a record is updated
+        config_x["identification"]["aggregations"] = []
+        records = [RawRecord(config_str=json.dumps(config_x, ensure_ascii=False), commit_id=commit)]
+        fx_gitlab_cache._build_cache(records=records, head_commit_id=commit)
+        assert fx_gitlab_cache.get_superseded_ids() == set()
+
     def test_get_count(self, mocker: MockerFixture, fx_gitlab_cache_pop: GitLabLocalCache):
         """Can get cached record count."""
         mocker.patch.object(fx_gitlab_cache_pop, "_ensure_exists", return_value=None)
@@ -906,6 +1122,22 @@ class TestGitLabCachedStore:
         assert len(result) == len(values)
         assert all(isinstance(item, RecordRevision) for item in result)
 
+    @pytest.mark.parametrize("all_exists", [True, False])
+    def test_iter_records(self, fx_gitlab_cached_store_pop: GitLabCachedStore, all_exists: bool):
+        """Can lazily get selected records, raising an error after yielding records if any do not exist."""
+        values = {"a1b2c3"} if all_exists else {"a1b2c3", "invalid"}
+        results = []
+
+        if not all_exists:
+            with pytest.raises(RecordsNotFoundError):
+                results.extend(fx_gitlab_cached_store_pop.iter_records(file_identifiers=values))
+            assert len(results) == 1
+            return
+
+        results.extend(fx_gitlab_cached_store_pop.iter_records(file_identifiers=values))
+        assert len(results) == len(values)
+        assert all(isinstance(item, RecordRevision) for item in results)
+
     @pytest.mark.parametrize("exists", [True, False])
     def test_select_one(self, fx_gitlab_cached_store_pop: GitLabCachedStore, exists: bool):
         """Can get a record if in the cache."""
@@ -920,6 +1152,25 @@ class TestGitLabCachedStore:
         assert isinstance(result, RecordRevision)
         assert result.file_identifier == value
 
+    def test_revisions(self, fx_gitlab_cached_store_pop: GitLabCachedStore):
+        """Can get file revisions of cached records."""
+        record = fx_gitlab_cached_store_pop.select_one("a1b2c3")
+        assert fx_gitlab_cached_store_pop.revisions({"a1b2c3"}) == {"a1b2c3": record.file_revision}
+
+    def test_select_related(self, mocker: MockerFixture, fx_gitlab_cached_store_pop: GitLabCachedStore):
+        """Can get related records via cache."""
+        mock_get_related = mocker.patch.object(fx_gitlab_cached_store_pop._cache, "get_related", return_value=[])
+
+        result = fx_gitlab_cached_store_pop.select_related("x", AggregationAssociationCode.REVISION_OF)
+        assert result == []
+        mock_get_related.assert_called_once_with(
+            file_identifier="x", association=AggregationAssociationCode.REVISION_OF
+        )
+
+    def test_superseded_ids(self, fx_gitlab_cached_store_pop: GitLabCachedStore):
+        """Can get superseded record identifiers via cache."""
+        assert fx_gitlab_cached_store_pop.superseded_ids() == set()
+
     @pytest.mark.parametrize("changes", [True, False])
     def test_push_refresh(self, mocker: MockerFixture, fx_gitlab_cached_store: GitLabCachedStore, changes: bool):
         """Can refresh cache after modifying the remote repository."""
@@ -0,0 +1,100 @@
+import pickle
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+import pytest
+
+from lantern.lib.metadata_library.models.record.enums import AggregationAssociationCode
+from lantern.models.record.revision import RecordRevision
+from lantern.stores.base import RecordNotFoundError, RecordsNotFoundError
+from lantern.stores.snapshot import SnapshotStore
+
+if TYPE_CHECKING:
+    import logging
+    from pathlib import Path
+
+    from tests.resources.stores.fake_records_store import FakeRecordsStore
+
+
+class TestSnapshotStore:
+    """Test snapshot store."""
+
+    def test_create(self, fx_snapshot_store: SnapshotStore, fx_fake_store: FakeRecordsStore):
+        """Can create a snapshot from another store."""
+        assert fx_snapshot_store._data_path.exists()
+        assert fx_snapshot_store._index_path.exists()
+        assert fx_snapshot_store._aggregations_path.exists()
+        assert len(fx_snapshot_store) == len(fx_fake_store)
+        assert fx_snapshot_store.frozen is True
+
+    def test_create_empty(self, tmp_path: Path, fx_logger: logging.Logger):
+        """Can create and use a snapshot with no records."""
+        store = MagicMock()
+        store.iter_records.return_value = iter([])
+        snapshot = SnapshotStore.create(logger=fx_logger, store=store, path=tmp_path)
+        assert snapshot.select() == []
+
+    def test_pickle(self, fx_snapshot_store: SnapshotStore):
+        """Can pickle a snapshot store without its memory map or index."""
+        _ = fx_snapshot_store.select()
+        assert fx_snapshot_store._mmap is not None
+
+        result: SnapshotStore = pickle.loads(pickle.dumps(fx_snapshot_store))  # noqa: S301
+        assert result._mmap is None
+        assert "_index" not in result.__dict__
+        assert "_aggregations" not in result.__dict__
+        assert len(result.select()) == len(fx_snapshot_store)
+
+    def test_select(self, fx_snapshot_store: SnapshotStore, fx_fake_store: FakeRecordsStore):
+        """Can get all records from snapshot."""
+        results = fx_snapshot_store.select()
+        assert all(isinstance(record, RecordRevision) for record in results)
+        assert {record.file_identifier for record in results} == {
+            record.file_identifier for record in fx_fake_store.select()
+        }
+
+    def test_select_filter(self, fx_snapshot_store: SnapshotStore, fx_fake_store: FakeRecordsStore):
+        """Can get selected records from snapshot."""
+        expected = fx_fake_store.select()[0]
+        results = fx_snapshot_store.select(file_identifiers={expected.file_identifier})
+        assert results == [expected]
+
+    def test_select_unknown(self, fx_snapshot_store: SnapshotStore):
+        """Cannot get one or more unknown records from snapshot."""
+        with pytest.raises(RecordsNotFoundError):
+            fx_snapshot_store.select(file_identifiers={"invalid"})
+
+    def test_select_one(self, fx_snapshot_store: SnapshotStore, fx_fake_store: FakeRecordsStore):
+        """Can get a specific record from snapshot."""
+        expected = fx_fake_store.select()[0]
+        assert fx_snapshot_store.select_one(expected.file_identifier) == expected
+
+    def test_select_one_unknown(self, fx_snapshot_store: SnapshotStore):
+        """Cannot get an unknown record from snapshot."""
+        with pytest.raises(RecordNotFoundError):
+            fx_snapshot_store.select_one("invalid")
+
+    @pytest.mark.parametrize(
+        "association", [AggregationAssociationCode.REVISION_OF, AggregationAssociationCode.IS_COMPOSED_OF]
+    )
+    def test_select_related(
+        self,
+        fx_snapshot_store: SnapshotStore,
+        fx_fake_store: FakeRecordsStore,
+        association: AggregationAssociationCode,
+    ):
+        """Can get related records from snapshot using index, consistent with checking all records."""
+        for file_identifier in fx_fake_store.superseded_ids() | {"x"}:
+            expected = fx_fake_store.select_related(file_identifier, association)
+            results = fx_snapshot_store.select_related(file_identifier, association)
+            assert sorted(r.file_identifier for r in results) == sorted(r.file_identifier for r in expected)
+
+    def test_superseded_ids(self, fx_snapshot_store: SnapshotStore, fx_fake_store: FakeRecordsStore):
+        """Can get superseded record identifiers from snapshot using index."""
+        assert fx_snapshot_store.superseded_ids() == fx_fake_store.superseded_ids()
+
+    @pytest.mark.cov()
+    def test_freeze(self, fx_snapshot_store: SnapshotStore):
+        """Can freeze a snapshot (no-op)."""
+        fx_snapshot_store.freeze()
+        assert fx_snapshot_store.frozen is True
@@ -1,25 +1,319 @@
+import json
+import threading
 import time
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
 from http import HTTPMethod, HTTPStatus
 from typing import TYPE_CHECKING
 from uuid import uuid4
 
 import pytest
 import requests
+from requests import Response
 from requests.auth import AuthBase, HTTPBasicAuth
 
-from lantern.checks import Checker, CheckRunner, run_check
+from lantern.checks import (
+    RETRY_ATTEMPTS,
+    CheckCache,
+    Checker,
+    CheckHistory,
+    CheckHostLimit,
+    CheckHttpPool,
+    CheckRunner,
+    arcgis_item_id,
+    retry_delay,
+    run_arcgis_item_checks,
+    run_check,
+    run_check_threaded,
+    run_magic_product_checks,
+)
 from lantern.lib.requests.auth import HTTPBearerTokenAuth
 from lantern.models.checks import Check, CheckState, CheckType
 from lantern.models.site import ExportMeta, SiteContent
+from lantern.outputs.checks import ChecksOutput
 
 if TYPE_CHECKING:
     import logging
+    from pathlib import Path
 
+    from pytest_httpserver import HTTPServer
     from pytest_mock import MockerFixture
 
     from lantern.config import Config
 
 
+class TestCheckCache:
+    """Test check results cache."""
+
+    def test_init(self, tmp_path: Path):
+        """Can create an empty cache if file does not exist."""
+        cache = CheckCache(path=tmp_path / "checks.json")
+        assert len(cache) == 0
+        assert cache.path == tmp_path / "checks.json"
+
+    def test_init_existing(self, tmp_path: Path):
+        """Can load an existing cache from file."""
+        path = tmp_path / "checks.json"
+        entry = {"type": "x", "checked_at": "x", "result_http_status": 200, "result_output": "OK"}
+        path.write_text(json.dumps({"x": entry}))
+
+        cache = CheckCache(path=path)
+        assert cache.entries == {"x": entry}
+
+    @pytest.mark.parametrize(
+        ("age", "state", "expected"),
+        [
+            (timedelta(hours=1), CheckState.PENDING, True),
+            (timedelta(days=30), CheckState.PENDING, False),
+            (timedelta(hours=1), CheckState.SKIPPED, False),
+        ],
+    )
+    def test_apply(self, tmp_path: Path, fx_check: Check, age: timedelta, state: CheckState, expected: bool):
+        """Can set check results from fresh cache entries."""
+        fx_check.type = CheckType.DOWNLOADS_OPEN
+        fx_check.state = state
+        cache = CheckCache(path=tmp_path / "checks.json")
+        key = fx_check.key
+        cache.entries[key] = {
+            "type": fx_check.type.value,
+            "checked_at": (datetime.now(tz=UTC) - age).isoformat(),
+            "result_http_status": 200,
+            "result_output": "OK",
+        }
+
+        result = cache.apply(key, fx_check)
+        assert result == expected
+        assert fx_check.cached == expected
+        if expected:
+            assert fx_check.state == CheckState.PASS
+            assert fx_check.result_http_status == HTTPStatus.OK
+            assert fx_check.result_output == "OK"
+
+    def test_apply_missing(self, tmp_path: Path, fx_check: Check):
+        """Cannot set check results without a cache entry."""
+        cache = CheckCache(path=tmp_path / "checks.json")
+        assert cache.apply(fx_check.key, fx_check) is False
+        assert fx_check.state == CheckState.PENDING
+
+    @pytest.mark.parametrize(
+        ("check_type", "state", "expected"),
+        [
+            (CheckType.DOWNLOADS_OPEN, CheckState.PASS, True),
+            (CheckType.DOWNLOADS_OPEN, CheckState.FAILED, False),
+            (CheckType.DOWNLOADS_OPEN, CheckState.SKIPPED, True),
+            (CheckType.SITE_PAGES, CheckState.PASS, False),
+        ],
+    )
+    def test_update(self, tmp_path: Path, fx_check: Check, check_type: CheckType, state: CheckState, expected: bool):
+        """
+        Can add or remove cache entries based on check results and type.
+
+        Cache is seeded with an entry to check failed checks remove entries and skipped checks are ignored.
+        """
+        fx_check.type = check_type
+        fx_check.state = state
+        fx_check.result_http_status = HTTPStatus.OK
+        fx_check.result_output = "OK"
+        cache = CheckCache(path=tmp_path / "checks.json")
+        key = fx_check.key
+        if check_type == CheckType.DOWNLOADS_OPEN:
+            cache.entries[key] = {
+                "type": check_type.value,
+                "checked_at": datetime.now(tz=UTC).isoformat(),
+                "result_http_status": 200,
+                "result_output": "OK",
+            }
+
+        cache.update(key, fx_check)
+        assert (key in cache.entries) == expected
+
+    def test_dump(self, tmp_path: Path):
+        """Can save cache to file, excluding expired entries."""
+        path = tmp_path / "x" / "checks.json"
+        cache = CheckCache(path=path)
+        cache.entries = {
+            "fresh": {
+                "type": CheckType.DOWNLOADS_NORA.value,
+                "checked_at": datetime.now(tz=UTC).isoformat(),
+                "result_http_status": 206,
+                "result_output": "OK",
+            },
+            "expired": {
+                "type": CheckType.DOWNLOADS_NORA.value,
+                "checked_at": (datetime.now(tz=UTC) - timedelta(days=30)).isoformat(),
+                "result_http_status": 206,
+                "result_output": "OK",
+            },
+        }
+
+        cache.dump()
+        assert list(CheckCache(path=path).entries) == ["fresh"]
+
+
+class TestCheckHistory:
+    """Test checks history."""
+
+    def test_init(self, tmp_path: Path):
+        """Can create empty history if file does not exist."""
+        history = CheckHistory(path=tmp_path / "history.json")
+        assert history.revisions == {}
+        assert history.checks == []
+        assert history.path == tmp_path / "history.json"
+
+    def test_init_existing(self, tmp_path: Path, fx_check: Check):
+        """Can load existing history from a checks data file."""
+        fx_check.file_identifier = "x"
+        fx_check.state = CheckState.PASS
+        path = tmp_path / "history.json"
+        data = {"revisions": {"x": "y"}, "site_checks": [], "resource_checks": {"x": [fx_check.unstructure()]}}
+        path.write_text(json.dumps(data))
+
+        history = CheckHistory(path=path)
+        assert history.revisions == {"x": "y"}
+        assert history.checks == [fx_check]
+
+    @pytest.mark.parametrize("value", ["", "x", "[]", '{"revisions": {}}'])
+    def test_init_invalid(self, tmp_path: Path, value: str):
+        """Can create empty history if file is empty or invalid."""
+        path = tmp_path / "history.json"
+        path.write_text(value)
+
+        history = CheckHistory(path=path)
+        assert history.revisions == {}
+        assert history.checks == []
+
+    def test_changed(self, tmp_path: Path, fx_check: Check):
+        """Can get records that are new, have changed, or failed checks (ignoring skipped checks) since the last run."""
+        history = CheckHistory(path=tmp_path / "history.json")
+        history.revisions = {"a": "1", "b": "1", "c": "1", "e": "1", "f": "1"}
+        history.checks = [
+            replace(fx_check, file_identifier="a", state=CheckState.PASS),
+            replace(fx_check, file_identifier="e", state=CheckState.FAILED),
+            replace(fx_check, file_identifier="f", state=CheckState.SKIPPED),
+        ]
+
+        result = history.changed({"a": "1", "b": "2", "d": "1", "e": "1", "f": "1"})
+        assert result == {"b", "d", "e"}
+
+    def test_select(self, tmp_path: Path, fx_check: Check):
+        """Can get checks from the last run for selected records, marked as cached."""
+        history = CheckHistory(path=tmp_path / "history.json")
+        history.checks = [replace(fx_check, file_identifier="a"), replace(fx_check, file_identifier="b")]
+
+        result = history.select({"a"})
+        assert [check.file_identifier for check in result] == ["a"]
+        assert all(check.cached for check in result)
+        assert not any(check.cached for check in history.checks)
+
+    def test_dump(self, fx_logger: logging.Logger, fx_export_meta: ExportMeta, tmp_path: Path):
+        """Can save checks data from checks output content to file."""
+        path = tmp_path / "x" / "history.json"
+        content = ChecksOutput(logger=fx_logger, meta=fx_export_meta, checks=[], revisions={"x": "y"}).content
+        history = CheckHistory(path=path)
+
+        history.dump(content)
+        assert path.read_text() == next(item.content for item in content if item.media_type == "application/json")
+        assert CheckHistory(path=path).revisions == {"x": "y"}
+        assert list(path.parent.iterdir()) == [path]
+
+    def test_dump_no_data(self, fx_site_content: SiteContent, tmp_path: Path):
+        """Does not save checks data where content does not include a checks data file."""
+        path = tmp_path / "history.json"
+        history = CheckHistory(path=path)
+
+        history.dump([fx_site_content])
+        assert not path.exists()
+
+
+class TestCheckHostLimit:
+    """Test adaptive concurrency limit for a host."""
+
+    def test_acquire_release(self):
+        """Can hold and release request slots, blocking when limit is reached."""
+        host = CheckHostLimit(max_limit=1)
+        host.acquire()
+        blocked = threading.Thread(target=host.acquire)
+        blocked.start()
+        blocked.join(timeout=0.1)
+        assert blocked.is_alive()
+
+        host.release(latency=0.1)
+        blocked.join(timeout=1)
+        assert not blocked.is_alive()
+
+    @pytest.mark.parametrize(
+        ("limit", "latencies", "expected"),
+        [(4, [10], 3), (1, [10], 1), (1, [0.1], 2), (3, [0.1, 0.1], 3), (4, [0.1], 4)],
+    )
+    def test_release_adapt(self, limit: int, latencies: list[float], expected: int):
+        """Can reduce limit for slow requests and increase for fast requests, up to the max limit."""
+        host = CheckHostLimit(max_limit=4)
+        host.limit = limit
+        for latency in latencies:
+            host.acquire()
+            host.release(latency=latency)
+        assert host.limit == expected
+
+    def test_backoff(self, mocker: MockerFixture):
+        """Can halve limit and pause requests after requests are throttled."""
+        mock_sleep = mocker.patch("lantern.checks.time.sleep")
+        host = CheckHostLimit(max_limit=4)
+        host.backoff(delay=10)
+        assert host.limit == 2  # noqa: PLR2004
+
+        host.acquire()
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args.args[0] == pytest.approx(10, abs=1)
+
+
+class TestCheckHttpPool:
+    """Test shared HTTP resources for running checks in threads."""
+
+    def test_session(self):
+        """Can get a session per thread."""
+        pool = CheckHttpPool(per_host=1)
+        session = pool.session()
+        assert isinstance(session, requests.Session)
+        assert pool.session() is session
+
+        sessions = []
+        thread = threading.Thread(target=lambda: sessions.append(pool.session()))
+        thread.start()
+        thread.join()
+        assert sessions[0] is not session
+
+        pool.close()
+        assert pool._sessions == []
+
+    def test_session_cookies(self, httpserver: HTTPServer):
+        """Can ignore cookies set by responses, so they are not reused across checks."""
+        httpserver.expect_request("/x").respond_with_data("x", headers={"Set-Cookie": "x=x; Path=/"})
+        pool = CheckHttpPool(per_host=1)
+        session = pool.session()
+
+        session.get(httpserver.url_for("/x"), timeout=10)
+        assert len(session.cookies) == 0
+
+    def test_limit_host(self):
+        """Can limit concurrent requests per host."""
+        pool = CheckHttpPool(per_host=1)
+        with pool.limit("https://example.com/x") as host:
+            assert pool.host_limit("https://EXAMPLE.com/y") is host
+            assert pool.host_limit("https://example.org/x") is not host
+            assert host._active == 1
+        assert host._active == 0
+
+    @pytest.mark.parametrize(("rate", "expected"), [(None, 0), (2, 1)])
+    def test_limit_rate(self, mocker: MockerFixture, rate: float | None, expected: int):
+        """Can limit overall request rate."""
+        mock_sleep = mocker.patch("lantern.checks.time.sleep")
+        pool = CheckHttpPool(per_host=2, rate=rate)
+        for _ in range(2):
+            with pool.limit("https://example.com"):
+                pass
+        assert mock_sleep.call_count == expected
+
+
 class TestCheckRunner:
     """Test check runner."""
 
@@ -38,6 +332,18 @@ class TestCheckRunner:
         assert fx_check.result_http_status == fx_check.http_status
         assert fx_check.state == CheckState.PASS
 
+    @pytest.mark.vcr
+    @pytest.mark.block_network
+    def test_check_url_pool(self, fx_logger: logging.Logger, fx_check: Check):
+        """Can check a URL using a shared HTTP pool."""
+        pool = CheckHttpPool(per_host=1)
+        runner = CheckRunner(logger=fx_logger, check=fx_check, pool=pool)
+
+        runner._check_url()
+        assert fx_check.state == CheckState.PASS
+        assert len(pool._sessions) == 1
+        pool.close()
+
     @pytest.mark.vcr
     @pytest.mark.block_network
     def test_check_url_redirect(self, fx_logger: logging.Logger, fx_check: Check):
@@ -77,6 +383,56 @@ class TestCheckRunner:
         runner._check_url()
         assert fx_check.state == CheckState.PASS
 
+    @pytest.mark.parametrize(
+        ("status", "retry_after", "attempt", "expected"),
+        [
+            (HTTPStatus.OK, None, 0, None),
+            (HTTPStatus.TOO_MANY_REQUESTS, None, 0, 1.0),
+            (HTTPStatus.TOO_MANY_REQUESTS, None, 2, 4.0),
+            (HTTPStatus.SERVICE_UNAVAILABLE, "5", 0, 5.0),
+            (HTTPStatus.TOO_MANY_REQUESTS, "3600", 0, 60.0),
+            (HTTPStatus.TOO_MANY_REQUESTS, "Wed, 21 Oct 2015 07:28:00 GMT", 0, 0.0),
+            (HTTPStatus.TOO_MANY_REQUESTS, "invalid", 1, 2.0),
+        ],
+    )
+    def test_retry_delay(self, status: HTTPStatus, retry_after: str | None, attempt: int, expected: float | None):
+        """Can get delay before retrying throttled requests."""
+        assert retry_delay(status=status, retry_after=retry_after, attempt=attempt) == expected
+
+    @pytest.mark.parametrize("pool", [False, True])
+    def test_fetch_url_retry(self, mocker: MockerFixture, fx_logger: logging.Logger, fx_check: Check, pool: bool):
+        """Can retry throttled requests, pausing requests to host if using a pool."""
+        mock_sleep = mocker.patch("lantern.checks.time.sleep")
+        throttled = Response()
+        throttled.status_code = HTTPStatus.TOO_MANY_REQUESTS
+        throttled.headers["Retry-After"] = "1"
+        ok = Response()
+        ok.status_code = HTTPStatus.OK
+        mock_request = mocker.patch.object(requests.Session, "request", side_effect=[throttled, ok])
+        http_pool = CheckHttpPool(per_host=2) if pool else None
+        runner = CheckRunner(logger=fx_logger, check=fx_check, pool=http_pool)
+
+        result = runner._fetch_url(method=HTTPMethod.HEAD, url=fx_check.url)
+        assert result == ok
+        assert mock_request.call_count == 2  # noqa: PLR2004
+        assert fx_check.result_http_status == HTTPStatus.OK
+        mock_sleep.assert_called_once()
+        if http_pool:
+            assert http_pool.host_limit(fx_check.url).limit == 1
+
+    def test_fetch_url_retry_exhausted(self, mocker: MockerFixture, fx_logger: logging.Logger, fx_check: Check):
+        """Can stop retrying throttled requests after a number of attempts."""
+        mocker.patch("lantern.checks.time.sleep")
+        throttled = Response()
+        throttled.status_code = HTTPStatus.TOO_MANY_REQUESTS
+        mock_request = mocker.patch.object(requests.Session, "request", return_value=throttled)
+        runner = CheckRunner(logger=fx_logger, check=fx_check)
+
+        runner._check_url()
+        assert mock_request.call_count == RETRY_ATTEMPTS + 1
+        assert fx_check.state == CheckState.FAILED
+        assert fx_check.result_http_status == HTTPStatus.TOO_MANY_REQUESTS
+
     def test_check_url_timeout(self, mocker: MockerFixture, fx_logger: logging.Logger, fx_check: Check):
         """Can check a URL that times out."""
         mocker.patch.object(requests.Session, "request", side_effect=requests.Timeout)
@@ -336,6 +692,201 @@ class TestRunCheck:
         result = run_check(fx_logger.level, fx_check)
         assert result == fx_check
 
+    def test_run_check_threaded(self, mocker: MockerFixture, fx_logger: logging.Logger, fx_check: Check) -> None:
+        """Can run a check using a shared HTTP pool."""
+        mocker.patch.object(CheckRunner, "run", return_value=None)
+        result = run_check_threaded(fx_logger, CheckHttpPool(per_host=1), fx_check)
+        assert result == fx_check
+
+
+class TestRunArcGisItemChecks:
+    """Test running ArcGIS item checks in batches."""
+
+    @staticmethod
+    def _response(data: dict, status: HTTPStatus = HTTPStatus.OK) -> Response:
+        """Search API response."""
+        r = Response()
+        r.status_code = status
+        r._content = json.dumps(data).encode()
+        return r
+
+    @staticmethod
+    def _checks(item_ids: list[str]) -> list[Check]:
+        """ArcGIS item checks."""
+        return [
+            Check(type=CheckType.DOWNLOADS_ARCGIS_LAYER, url=f"https://www.arcgis.com/home/item.html?id={item_id}")
+            for item_id in item_ids
+        ]
+
+    def test_arcgis_item_id(self):
+        """Can get item ID from an item page URL."""
+        assert arcgis_item_id("https://www.arcgis.com/home/item.html?id=123abc") == "123abc"
+
+    def test_run(self, mocker: MockerFixture, fx_logger: logging.Logger):
+        """Can pass checks for items in search results and leave others pending."""
+        mock_get = mocker.patch.object(
+            requests.Session, "request", return_value=self._response({"results": [{"id": "a"}, {"id": "b"}]})
+        )
+        checks = self._checks(["a", "B", "c"])
+
+        run_arcgis_item_checks(fx_logger, checks)
+        assert mock_get.call_count == 1
+        assert mock_get.call_args.kwargs["params"]["q"] == "id:a OR id:b OR id:c"
+        assert [check.state for check in checks] == [CheckState.PASS, CheckState.PASS, CheckState.PENDING]
+        assert checks[0].result_http_status == HTTPStatus.OK
+        assert checks[0].http_method == HTTPMethod.GET
+
+    def test_run_batches(self, mocker: MockerFixture, fx_logger: logging.Logger):
+        """Can search for items in batches."""
+        mock_get = mocker.patch.object(requests.Session, "request", return_value=self._response({"results": []}))
+        run_arcgis_item_checks(fx_logger, self._checks(["a", "b", "c"]), batch_size=2)
+        assert mock_get.call_count == 2  # noqa: PLR2004
+
+    @pytest.mark.parametrize(
+        ("error", "status", "data"),
+        [
+            (requests.Timeout(), HTTPStatus.OK, {}),
+            (None, HTTPStatus.INTERNAL_SERVER_ERROR, {}),
+            (None, HTTPStatus.OK, {"error": {"code": 400, "message": "x"}}),
+        ],
+    )
+    def test_run_error(
+        self,
+        mocker: MockerFixture,
+        fx_logger: logging.Logger,
+        error: Exception | None,
+        status: HTTPStatus,
+        data: dict,
+    ):
+        """Can leave checks pending where a search fails."""
+        mocker.patch.object(requests.Session, "request", side_effect=error, return_value=self._response(data, status))
+        checks = self._checks(["a"])
+
+        run_arcgis_item_checks(fx_logger, checks)
+        assert checks[0].state == CheckState.PENDING
+
+    def test_run_throttled(self, mocker: MockerFixture, fx_logger: logging.Logger):
+        """Can retry throttled searches using a shared HTTP pool, pausing further requests to the host."""
+        mock_sleep = mocker.patch("lantern.checks.time.sleep")
+        throttled = self._response({}, HTTPStatus.TOO_MANY_REQUESTS)
+        throttled.headers["Retry-After"] = "1"
+        mock_request = mocker.patch.object(
+            requests.Session, "request", side_effect=[throttled, self._response({"results": [{"id": "a"}]})]
+        )
+        pool = CheckHttpPool(per_host=2)
+        checks = self._checks(["a"])
+
+        run_arcgis_item_checks(fx_logger, checks, pool=pool)
+        assert mock_request.call_count == 2  # noqa: PLR2004
+        assert checks[0].state == CheckState.PASS
+        mock_sleep.assert_called_once()
+        assert pool.host_limit(checks[0].url).limit == 1
+
+
+class TestRunMagicProductChecks:
+    """Test running MAGIC Products Distribution Service checks in batches."""
+
+    @staticmethod
+    def _response(responses: list[dict], status: HTTPStatus = HTTPStatus.OK) -> Response:
+        """Graph batch response."""
+        r = Response()
+        r.status_code = status
+        r._content = json.dumps({"responses": responses}).encode()
+        return r
+
+    @staticmethod
+    def _checks(count: int) -> list[Check]:
+        """MAGIC Products checks."""
+        return [
+            Check(
+                type=CheckType.DOWNLOADS_SHAREPOINT_MAGIC_PRODUCTS,
+                url=f"https://nercacuk.sharepoint.com/:b:/r/sites/MAGICProductsDistribution/{i}",
+                http_method=HTTPMethod.GET,
+                content_length=1,
+                http_auth=HTTPBearerTokenAuth(token="x"),  # noqa: S106
+            )
+            for i in range(count)
+        ]
+
+    def test_run(self, mocker: MockerFixture, fx_logger: logging.Logger):
+        """Can set check results from each response in a batch."""
+        mock_post = mocker.patch.object(
+            requests.Session,
+            "post",
+            return_value=self._response(
+                [
+                    {"id": "1", "status": 200, "body": {"id": "x", "name": "x", "size": 2, "file": {}}},
+                    {"id": "0", "status": 200, "body": {"id": "x", "name": "x", "size": 1, "file": {}}},
+                    {"id": "2", "status": 404, "body": {"error": {"code": "itemNotFound"}}},
+                ]
+            ),
+        )
+        checks = self._checks(3)
+
+        run_magic_product_checks(fx_logger, checks)
+        assert mock_post.call_count == 1
+        assert len(mock_post.call_args.kwargs["json"]["requests"]) == 3  # noqa: PLR2004
+        assert [check.state for check in checks] == [CheckState.PASS, CheckState.FAILED, CheckState.FAILED]
+        assert checks[1].result_output == "Bad drive item size: 2 (expected 1)"
+        assert checks[2].result_http_status == HTTPStatus.NOT_FOUND
+
+    def test_run_batches(self, mocker: MockerFixture, fx_logger: logging.Logger):
+        """Can request drive items in concurrent batches."""
+        mock_post = mocker.patch.object(requests.Session, "post", return_value=self._response([]))
+        run_magic_product_checks(fx_logger, self._checks(5), batch_size=2, parallel_jobs=2)
+        assert mock_post.call_count == 3  # noqa: PLR2004
+
+    def test_run_throttled(self, mocker: MockerFixture, fx_logger: logging.Logger):
+        """Can leave throttled checks within a batch pending without waiting to retry them."""
+        mock_sleep = mocker.patch("lantern.checks.time.sleep")
+        ok = {"id": "x", "name": "x", "size": 1, "file": {}}
+        mock_post = mocker.patch.object(
+            requests.Session,
+            "post",
+            return_value=self._response(
+                [
+                    {"id": "0", "status": 200, "body": ok},
+                    {"id": "1", "status": 429, "headers": {"Retry-After": "5"}, "body": {}},
+                ]
+            ),
+        )
+        checks = self._checks(2)
+
+        run_magic_product_checks(fx_logger, checks)
+        assert mock_post.call_count == 1
+        assert mocker.call(5.0) not in mock_sleep.call_args_list
+        assert [check.state for check in checks] == [CheckState.PASS, CheckState.PENDING]
+
+    def test_run_invalid(self, mocker: MockerFixture, fx_logger: logging.Logger):
+        """Can leave checks pending where individual responses in a batch are invalid."""
+        ok = {"id": "x", "name": "x", "size": 1, "file": {}}
+        mocker.patch.object(
+            requests.Session,
+            "post",
+            return_value=self._response(
+                [
+                    {"id": "0", "status": 200, "body": ok},
+                    {"status": 200, "body": ok},
+                    {"id": "x", "status": 200, "body": ok},
+                    {"id": "9", "status": 200, "body": ok},
+                    {"id": "1", "status": 999, "body": ok},
+                    {"id": "2"},
+                ]
+            ),
+        )
+        checks = self._checks(3)
+
+        run_magic_product_checks(fx_logger, checks)
+        assert [check.state for check in checks] == [CheckState.PASS, CheckState.PENDING, CheckState.PENDING]
+
+    def test_run_error(self, mocker: MockerFixture, fx_logger: logging.Logger):
+        """Can leave checks pending where a batch request fails."""
+        mocker.patch.object(requests.Session, "post", side_effect=requests.Timeout)
+        checks = self._checks(1)
+
+        run_magic_product_checks(fx_logger, checks)
+        assert checks[0].state == CheckState.PENDING
+
 
 class TestChecker:
     """Test checks runner."""
@@ -393,15 +944,105 @@ class TestChecker:
         fx_checker._prepare_auth(checks=checks)
         assert checks[0].http_auth._token == checks[1].http_auth._token
 
-    def test_execute(self, fx_checker: Checker, fx_check: Check) -> None:
+    @pytest.mark.parametrize("engine", ["processes", "threads"])
+    def test_execute(self, fx_checker: Checker, fx_check: Check, engine: str) -> None:
         """
-        Can run checks.
+        Can run checks using each engine.
 
         Check methods are disabled to avoid making real requests.
         """
+        fx_checker._engine = engine
         checks = fx_checker.execute([fx_check])
         assert checks == [fx_check]  # checks will remain as initial as not actually run
 
+    def test_execute_arcgis_items(self, mocker: MockerFixture, fx_checker: Checker) -> None:
+        """Can check ArcGIS items in batches before other checks, returning results in order."""
+
+        def _search(_logger: logging.Logger, checks: list[Check], pool: CheckHttpPool | None) -> None:
+            assert (pool is not None) == (fx_checker._engine == "threads")
+            checks[0].state = CheckState.PASS
+
+        mocker.patch("lantern.checks.run_arcgis_item_checks", side_effect=_search)
+        mock_engine = mocker.patch.object(fx_checker, "_execute_engine", side_effect=lambda checks, pool: checks)
+        checks = [
+            Check(type=CheckType.DOWNLOADS_OPEN, url="https://example.com/a"),
+            Check(type=CheckType.DOWNLOADS_ARCGIS_LAYER, url="https://www.arcgis.com/home/item.html?id=a"),
+            Check(type=CheckType.INFO_ARCGIS_WEBMAP, url="https://www.arcgis.com/home/item.html?id=b"),
+        ]
+
+        results = fx_checker._execute(checks)
+        assert results == checks
+        assert mock_engine.call_args.args[0] == [checks[0], checks[2]]
+
+    def test_interleave_hosts(self, fx_checker: Checker) -> None:
+        """Can order checks to alternate between hosts, including for checks using an API on another host."""
+        checks = [
+            Check(type=CheckType.DOWNLOADS_OPEN, url="https://example.com/a"),
+            Check(type=CheckType.DOWNLOADS_OPEN, url="https://example.com/b"),
+            Check(type=CheckType.DOWNLOADS_OPEN, url="https://example.com/c"),
+            Check(type=CheckType.DOWNLOADS_OPEN, url="https://example.org/a"),
+            Check(type=CheckType.DOWNLOADS_ARCGIS_LAYER, url="https://example.com/item?id=x"),
+        ]
+        assert fx_checker._interleave_hosts(checks) == [0, 3, 4, 1, 2]
+
+    def test_execute_threads_order(self, mocker: MockerFixture, fx_checker: Checker) -> None:
+        """Can run checks in threads and return results in the same order as given."""
+        mocker.patch("lantern.checks.run_check_threaded", side_effect=lambda _logger, _pool, check: check)
+        checks = [
+            Check(type=CheckType.DOWNLOADS_OPEN, url="https://example.com/a"),
+            Check(type=CheckType.DOWNLOADS_OPEN, url="https://example.com/b"),
+            Check(type=CheckType.DOWNLOADS_OPEN, url="https://example.org/a"),
+        ]
+        assert fx_checker._execute_threads(checks, pool=CheckHttpPool(per_host=1)) == checks
+
+    def test_execute_duplicates(self, mocker: MockerFixture, fx_checker: Checker) -> None:
+        """Can run duplicate checks once, copying results to each duplicate."""
+        mock_execute = mocker.patch.object(fx_checker, "_execute", side_effect=self._pass_checks)
+        checks = [
+            Check(type=CheckType.DOWNLOADS_ARCGIS_SERVICE, url="https://example.com/x", file_identifier="a"),
+            Check(type=CheckType.DOWNLOADS_ARCGIS_SERVICE, url="https://example.com/y", file_identifier="a"),
+            Check(type=CheckType.DOWNLOADS_ARCGIS_SERVICE, url="https://example.com/x", file_identifier="b"),
+        ]
+
+        results = fx_checker.execute(checks)
+        assert len(mock_execute.call_args.args[0]) == 2  # noqa: PLR2004
+        assert [check.file_identifier for check in results] == ["a", "a", "b"]
+        assert [check.url for check in results] == [check.url for check in checks]
+        assert all(check.state == CheckState.PASS for check in results)
+        assert results[2].duration == 0
+
+    @pytest.mark.parametrize(("force", "expected_runs"), [(False, 1), (True, 2)])
+    def test_execute_cached(
+        self, mocker: MockerFixture, tmp_path: Path, fx_checker: Checker, force: bool, expected_runs: int
+    ) -> None:
+        """
+        Can reuse cached results for external resources unless forced.
+
+        Runs checks twice with a cache, where the external resource check should be cached after the first run.
+        """
+        mock_execute = mocker.patch.object(fx_checker, "_execute", side_effect=self._pass_checks)
+        fx_checker._cache = CheckCache(path=tmp_path / "checks.json")
+
+        for _ in range(2):
+            checks = [
+                Check(type=CheckType.SITE_PAGES, url="https://example.com/index.html"),
+                Check(type=CheckType.DOWNLOADS_OPEN, url="https://example.com/x.zip", file_identifier="x"),
+            ]
+            results = fx_checker.execute(checks, force=force)
+            assert [check.state for check in results] == [CheckState.PASS, CheckState.PASS]
+
+        assert results[1].cached is not force
+        assert sum(len(c.args[0]) for c in mock_execute.call_args_list) == 2 + expected_runs
+        assert (tmp_path / "checks.json").exists()
+
+    @staticmethod
+    def _pass_checks(checks: list[Check]) -> list[Check]:
+        """Mark checks as passed without running."""
+        for check in checks:
+            check.state = CheckState.PASS
+            check.duration = 0.1
+        return checks
+
     def test_checks(self, fx_checker: Checker, fx_export_meta: ExportMeta, fx_check: Check) -> None:
         """
         Can run checks and get output.
@@ -410,3 +1051,27 @@ class TestChecker:
         """
         outputs = fx_checker.check(meta=fx_export_meta, checks=[fx_check])
         assert all(isinstance(o, SiteContent) for o in outputs)
+
+    def test_checks_previous(self, mocker: MockerFixture, fx_checker: Checker, fx_export_meta: ExportMeta) -> None:
+        """Can include revisions and previous checks not run again in output."""
+        mocker.patch.object(fx_checker, "_execute", side_effect=self._pass_checks)
+        checks = [Check(type=CheckType.ITEM_PAGES, url="https://example.com/items/a/index.html", file_identifier="a")]
+        previous = [
+            Check(
+                type=CheckType.ITEM_PAGES,
+                url=f"https://example.com/items/{fid}/index.html",
+                file_identifier=fid,
+                state=CheckState.FAILED,
+            )
+            for fid in ["a", "b"]
+        ]
+
+        outputs = fx_checker.check(
+            meta=fx_export_meta, checks=checks, revisions={"a": "2", "b": "1"}, previous=previous
+        )
+        data = json.loads(next(o for o in outputs if o.path.name == "data.json").content)
+        assert data["revisions"] == {"a": "2", "b": "1"}
+        assert {fid: [c["state"] for c in checks] for fid, checks in data["resource_checks"].items()} == {
+            "a": ["passed"],
+            "b": ["failed"],
+        }
@@ -90,6 +90,7 @@ class TestConfig:
             "STORE_GITLAB_PROJECT_ID": "1234",
             "STORE_GITLAB_DEFAULT_BRANCH": "main",
             "STORE_GITLAB_CACHE_PATH": str(fx_config.STORE_GITLAB_CACHE_PATH),
+            "ENABLE_FEATURE_GITLAB_CACHE_ARCHIVE": False,  # would be True by default but disabled for HTTP recordings
             "TEMPLATES_CACHE_BUST_VALUE": fx_config.TEMPLATES_CACHE_BUST_VALUE,
             "TEMPLATES_PLAUSIBLE_ID": "x",
             "TEMPLATES_ALGOLIA_APP_ID": "x",
@@ -108,6 +109,8 @@ class TestConfig:
             "SITE_TRUSTED_RSYNC_HOST": "x",
             "SITE_TRUSTED_RSYNC_BASE_PATH_TESTING": str(fx_config.SITE_TRUSTED_RSYNC_BASE_PATH_TESTING),
             "SITE_TRUSTED_RSYNC_BASE_PATH_LIVE": str(fx_config.SITE_TRUSTED_RSYNC_BASE_PATH_LIVE),
+            "ENABLE_FEATURE_EXPORT_COMPRESSION": False,
+            "ENABLE_FEATURE_EXPORT_SKIP_UNCHANGED": False,
             "BASE_URL_TESTING": "https://example.com",
             "BASE_URL_LIVE": "https://example.com",
             "CHECKS_TRUSTED_USERNAME": "x",
@@ -117,6 +120,7 @@ class TestConfig:
             "CHECKS_MAGIC_PRODUCTS_CLIENT_SECRET": redacted_value,
             "CHECKS_MAGIC_PRODUCTS_CLIENT_SECRET_ID": "x",
             "CHECKS_MAGIC_PRODUCTS_CLIENT_SECRET_EXP": date(2014, 6, 30),
+            "CHECKS_ENGINE": "threads",
         }
 
         output = fx_config.dumps_safe()
@@ -457,6 +461,7 @@ class TestConfig:
             ("STORE_GITLAB_PROJECT_ID", "x", False),
             ("STORE_GITLAB_DEFAULT_BRANCH", "x", False),
             ("STORE_GITLAB_CACHE_PATH", Path("x").resolve(), False),
+            ("ENABLE_FEATURE_GITLAB_CACHE_ARCHIVE", True, False),
             ("TEMPLATES_PLAUSIBLE_ID", "x", False),
             ("TEMPLATES_ALGOLIA_APP_ID", "x", False),
             ("TEMPLATES_ALGOLIA_SEARCH_API_KEY", "x", False),
@@ -471,6 +476,8 @@ class TestConfig:
             ("SITE_TRUSTED_RSYNC_HOST", "x", False),
             ("SITE_TRUSTED_RSYNC_BASE_PATH_TESTING", Path("x"), False),
             ("SITE_TRUSTED_RSYNC_BASE_PATH_LIVE", Path("x"), False),
+            ("ENABLE_FEATURE_EXPORT_COMPRESSION", True, False),
+            ("ENABLE_FEATURE_EXPORT_SKIP_UNCHANGED", True, False),
             ("BASE_URL_TESTING", "https://example.com", False),
             ("BASE_URL_LIVE", "https://example.com", False),
             ("CHECKS_TRUSTED_USERNAME", "x", False),
@@ -480,6 +487,7 @@ class TestConfig:
             ("CHECKS_MAGIC_PRODUCTS_CLIENT_SECRET", "x", True),
             ("CHECKS_MAGIC_PRODUCTS_CLIENT_SECRET_ID", "x", False),
             ("CHECKS_MAGIC_PRODUCTS_CLIENT_SECRET_EXP", date(2014, 6, 30), False),
+            ("CHECKS_ENGINE", "processes", False),
         ],
     )
     def test_configurable_property(self, property_name: str, expected: Any, sensitive: bool):
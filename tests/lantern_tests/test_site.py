@@ -1,5 +1,6 @@
 import json
 import logging
+from dataclasses import replace
 from datetime import date
 from typing import TYPE_CHECKING
 
@@ -8,8 +9,10 @@ from lxml import etree
 
 from lantern.lib.metadata_library.models.record.elements.common import Identifier
 from lantern.models.checks import Check
+from lantern.models.manifest import SiteManifest
 from lantern.models.record.const import ALIAS_NAMESPACE, CATALOGUE_NAMESPACE
 from lantern.models.site import ExportMeta, SiteContent
+from lantern.outputs.base import OutputRecordContext
 from lantern.outputs.item_html import ItemAliasesOutput, ItemCatalogueOutput
 from lantern.outputs.items_bas_website import ItemsBasWebsiteOutput
 from lantern.outputs.record_iso import RecordIsoHtmlOutput, RecordIsoJsonOutput, RecordIsoXmlOutput
@@ -19,16 +22,27 @@ from lantern.outputs.site_health import SiteHealthOutput
 from lantern.outputs.site_index import SiteIndexOutput
 from lantern.outputs.site_pages import SitePagesOutput
 from lantern.outputs.site_resources import SiteResourcesOutput
-from lantern.site import Site, SiteAction, SiteJob, _job_worker_iso_html_transform, _job_worker_store, _run_job
+from lantern.site import (
+    Site,
+    SiteAction,
+    SiteJob,
+    _job_worker_iso_html_transform,
+    _job_worker_store,
+    _run_jobs,
+)
 from lantern.stores.base import StoreBase
-from lantern.stores.gitlab_cache import GitLabCachedStore
+from lantern.stores.snapshot import SnapshotStore
 from tests.resources.records.item_cat_product_min import record as product_min_required
 
 if TYPE_CHECKING:
     from collections.abc import Callable
+    from pathlib import Path
+
+    from pytest_mock import MockerFixture
 
     from lantern.models.record.revision import RecordRevision
     from lantern.outputs.base import OutputBase
+    from lantern.stores.gitlab_cache import GitLabCachedStore
 
 
 @pytest.mark.usefixtures("fx_reset_site_singletons")
@@ -42,12 +56,22 @@ class TestSiteJob:
         assert isinstance(result, StoreBase)
 
     @pytest.mark.cov()
-    def test_job_worker_store_gitlab_cache(self, fx_gitlab_cached_store_pop: GitLabCachedStore):
-        """Can create and re-warm GitLabCachedStore instance."""
-        fx_gitlab_cached_store_pop._cache._flash.clear()
-        result = _job_worker_store(store=fx_gitlab_cached_store_pop)
-        assert isinstance(result, GitLabCachedStore)
-        assert len(result._cache._flash) > 0
+    def test_job_worker_store_snapshot(
+        self, tmp_path: Path, fx_logger: logging.Logger, fx_snapshot_store: SnapshotStore
+    ):
+        """Can create snapshot store instance, replacing any instance for a different snapshot."""
+        result = _job_worker_store(store=fx_snapshot_store)
+        assert result == fx_snapshot_store
+        assert _job_worker_store(store=fx_snapshot_store) == fx_snapshot_store
+
+        snapshot = SnapshotStore(logger=fx_logger, path=tmp_path / "other")
+        result = _job_worker_store(store=snapshot)
+        assert result == snapshot
+
+    def test_job_worker_store_replaced(self, fx_fake_store: StoreBase, fx_snapshot_store: SnapshotStore):
+        """Can replace a store instance with a different store, including a snapshot with a non-snapshot store."""
+        assert _job_worker_store(store=fx_snapshot_store) == fx_snapshot_store
+        assert _job_worker_store(store=fx_fake_store) == fx_fake_store
 
     @pytest.mark.cov()
     def test_job_worker_iso_transform(self):
@@ -111,18 +135,18 @@ class TestSiteJob:
             if output_cls == SiteHealthOutput
             else None,
         )
-        content = _run_job(log_level=logging.DEBUG, meta=fx_export_meta, store=fx_fake_store, job=job)
+        content = _run_jobs(log_level=logging.DEBUG, meta=fx_export_meta, store=fx_fake_store, jobs=[job])[0]
 
         results = [str(output.path) for output in content]
         for exp in expected:
             assert exp in results
 
-        checks = _run_job(
+        checks = _run_jobs(
             log_level=logging.DEBUG,
             meta=fx_export_meta,
             store=fx_fake_store,
-            job=SiteJob(action="checks", output=output_cls, record=fx_revision_model_min),
-        )
+            jobs=[SiteJob(action="checks", output=output_cls, record=fx_revision_model_min)],
+        )[0]
         assert len(checks) > 0
 
         # check content for outputs that use extras
@@ -133,6 +157,25 @@ class TestSiteJob:
             assert health_data["checks"]["search:records"]["observedValue"] == expected_count
             assert isinstance(health_data["checks"]["entra:expiry"]["observedValue"], int)
 
+    def test_jobs(
+        self,
+        mocker: MockerFixture,
+        fx_fake_store: StoreBase,
+        fx_export_meta: ExportMeta,
+        fx_revision_model_min: RecordRevision,
+    ):
+        """Can output site content for a batch of jobs, sharing a context for jobs for the same record."""
+        jobs = [
+            SiteJob(action="content", output=RecordIsoJsonOutput, record=fx_revision_model_min),
+            SiteJob(action="checks", output=RecordIsoJsonOutput, record=fx_revision_model_min),
+        ]
+        spy = mocker.spy(OutputRecordContext, "__init__")
+        results = _run_jobs(log_level=logging.DEBUG, meta=fx_export_meta, store=fx_fake_store, jobs=jobs)
+        assert len(results) == len(jobs)
+        assert spy.call_count == 1
+        assert all(isinstance(result, SiteContent) for result in results[0])
+        assert all(isinstance(result, Check) for result in results[1])
+
 
 class TestSite:
     """Test site generator."""
@@ -145,14 +188,35 @@ class TestSite:
         assert site._workers == 1
 
     @pytest.mark.cov()
-    def test_prep_store_gitlab_cache(self, fx_site: Site, fx_gitlab_cached_store_pop: GitLabCachedStore):
-        """Can clear the flash cache of a GitLabCachedStore prior to parallel processing."""
+    def test_prep_store(self, fx_site: Site):
+        """Can use stores other than GitLabCachedStore as-is for parallel processing."""
+        fx_site._workers = 2
+        with fx_site._prep_store() as result:
+            assert result == fx_site._store
+
+    @pytest.mark.cov()
+    def test_prep_store_single(self, fx_site: Site, fx_gitlab_cached_store_pop: GitLabCachedStore):
+        """Can use a GitLabCachedStore as-is where jobs are not run in parallel."""
+        fx_site._store = fx_gitlab_cached_store_pop
+        with fx_site._prep_store() as result:
+            assert result == fx_gitlab_cached_store_pop
+
+    @pytest.mark.cov()
+    @pytest.mark.parametrize("frozen", [False, True])
+    def test_prep_store_gitlab_cache(self, fx_site: Site, fx_gitlab_cached_store_pop: GitLabCachedStore, frozen: bool):
+        """Can create a snapshot of a GitLabCachedStore prior to parallel processing, reused where frozen."""
+        fx_site._workers = 2
         fx_site._store = fx_gitlab_cached_store_pop
-        _ = fx_gitlab_cached_store_pop.select()
-        assert len(fx_gitlab_cached_store_pop._cache._flash) > 0
-        result: GitLabCachedStore = fx_site._prep_store()
-        assert len(result._cache._flash) == 0
-        assert len(fx_gitlab_cached_store_pop._cache._flash) > 0
+        if frozen:
+            fx_gitlab_cached_store_pop.freeze()
+        with fx_site._prep_store() as result:
+            assert isinstance(result, SnapshotStore)
+            assert len(result) == len(fx_gitlab_cached_store_pop)
+            path = result.path
+        assert path.exists() == frozen
+
+        with fx_site._prep_store() as result:
+            assert (result.path == path) == frozen
 
     @pytest.mark.cov()
     @pytest.mark.parametrize(
@@ -232,13 +296,36 @@ class TestSite:
         if extras:
             fx_site._extras = extras
 
-        result = fx_site._generate_jobs(actions, global_, individual, identifiers)
+        result = list(fx_site._generate_jobs(actions, global_, individual, identifiers))
         if individual and not identifiers:
             # where > 0 individual output classes and no selected identifiers, jobs are generated for all records
             assert len(result) > 0
         else:
             assert result == expected
 
+    @pytest.mark.parametrize(("batch_size", "expected"), [(1, 5), (2, 4), (10, 3)])
+    def test_batch_jobs(self, fx_site: Site, batch_size: int, expected: int):
+        """Can batch jobs individually for global outputs and grouped by record for individual outputs."""
+        fx_site._batch_size = batch_size
+        records = fx_site._store.select()[:3]
+        jobs = list(
+            fx_site._generate_jobs(
+                actions=["content", "checks"],
+                global_outputs=[SiteResourcesOutput],
+                individual_outputs=[ItemCatalogueOutput, RecordIsoXmlOutput],
+                identifiers={record.file_identifier for record in records},
+            )
+        )
+
+        result = list(fx_site._batch_jobs(jobs))
+        assert len(result) == expected
+        assert [job for batch in result for job in batch if job.record is None] == jobs[:2]
+        assert len([job for batch in result for job in batch]) == len(jobs)
+        for batch in result[2:]:
+            fids = [job.record.file_identifier for job in batch]
+            assert len(set(fids)) <= batch_size
+            assert all(fids.count(fid) == 4 for fid in fids)  # noqa: PLR2004
+
     @pytest.mark.cov()
     def test_execute(self, fx_site: Site):
         """Can generate expected site content, checks and/or invalidation keys for directly created processing jobs."""
@@ -251,6 +338,19 @@ class TestSite:
         )
         assert len(results) > 0
 
+    def test_execute_pre_dispatch(self, fx_site: Site):
+        """Can generate site content with a custom number of pre-dispatched batches."""
+        fx_site._pre_dispatch = 1
+        results = fx_site.execute(jobs=[SiteJob(action="content", output=SiteIndexOutput)])
+        assert len(results) > 0
+
+    def test_iter_execute(self, fx_site: Site):
+        """Can lazily generate expected site content for directly created processing jobs."""
+        jobs = [SiteJob(action="content", output=SiteIndexOutput)]
+        result = fx_site.iter_execute(jobs=jobs)
+        assert not isinstance(result, list)
+        assert list(result) == fx_site.execute(jobs=jobs)
+
     def test_generate_content(self, fx_site: Site):
         """Can generate expected site content for selected outputs."""
         results = fx_site.generate_content(global_outputs=[SiteIndexOutput], individual_outputs=[])
@@ -267,3 +367,57 @@ class TestSite:
         """Can generate expected invalidation keys for selected outputs."""
         results = fx_site.generate_invalidation_keys(global_outputs=[SiteIndexOutput], individual_outputs=[])
         assert sorted(results) == sorted(["/-/index/index.html", "/-/index/"])
+
+    def test_record_fingerprint(self, fx_site: Site, fx_revision_model_min: RecordRevision):
+        """Can generate a fingerprint for the inputs used to generate content for a record."""
+        result = fx_site._record_fingerprint(fx_revision_model_min)
+        assert result == fx_site._record_fingerprint(fx_revision_model_min)
+
+        fx_revision_model_min.file_revision = "changed"
+        assert result != fx_site._record_fingerprint(fx_revision_model_min)
+
+    @pytest.mark.parametrize(("field", "value", "expected"), [("base_url", "x", True), ("build_repo_ref", "x", False)])
+    def test_record_fingerprint_meta(
+        self, fx_site: Site, fx_revision_model_min: RecordRevision, field: str, value: str, expected: bool
+    ):
+        """Can include site metadata, other than per-build values, in record fingerprints."""
+        result = fx_site._record_fingerprint(fx_revision_model_min)
+
+        site = Site(logger=fx_site._logger, meta=replace(fx_site._meta, **{field: value}), store=fx_site._store)
+        assert (site._record_fingerprint(fx_revision_model_min) != result) == expected
+
+    def test_generate_content_manifest(self, tmp_path: Path, fx_site: Site):
+        """Can generate content for changed records only using a build manifest."""
+        manifest = SiteManifest(path=tmp_path / "manifest.json")
+        params = {"global_outputs": [], "individual_outputs": [RecordIsoJsonOutput], "manifest": manifest}
+
+        results = fx_site.generate_content(**params)
+        assert len(results) > 0
+        assert len(manifest.records) == len(fx_site._store.select())
+
+        results = fx_site.generate_content(**params)
+        assert results == []
+
+    def test_iter_content_manifest(self, tmp_path: Path, fx_site: Site):
+        """Can lazily generate content for changed records only using a build manifest."""
+        manifest = SiteManifest(path=tmp_path / "manifest.json")
+        params = {"global_outputs": [], "individual_outputs": [RecordIsoJsonOutput], "manifest": manifest}
+
+        results = list(fx_site.iter_content(**params))
+        assert len(results) > 0
+        assert all(isinstance(result, SiteContent) for result in results)
+        assert len(manifest.records) == len(fx_site._store.select())
+
+        results = list(fx_site.iter_content(**params))
+        assert results == []
+
+    def test_iter_content_manifest_other_outputs(self, tmp_path: Path, fx_site: Site):
+        """Can keep manifest content for outputs not included in a build limited to some outputs."""
+        manifest = SiteManifest(path=tmp_path / "manifest.json")
+        params = {"global_outputs": [], "manifest": manifest}
+        list(fx_site.iter_content(**params, individual_outputs=[RecordIsoJsonOutput, RecordIsoXmlOutput]))
+        expected = len(manifest)
+
+        results = list(fx_site.iter_content(**params, individual_outputs=[RecordIsoXmlOutput]))
+        assert results == []
+        assert len(manifest) == expected
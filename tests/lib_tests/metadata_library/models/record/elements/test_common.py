@@ -187,6 +187,10 @@ class TestCitation:
 
         assert result == expected
 
+    def test_converter(self):
+        """Can reuse the same converter for each conversion."""
+        assert Citation._converter() is Citation._converter()
+
 
 class TestContactIdentity:
     """Test ContactIdentity element."""
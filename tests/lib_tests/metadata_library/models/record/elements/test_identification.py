@@ -5,6 +5,7 @@ import pytest
 from pytest_unordered import unordered
 
 from lantern.lib.metadata_library.models.record.elements.common import (
+    Citation,
     Constraint,
     Constraints,
     Date,
@@ -1023,6 +1024,12 @@ class TestIdentification:
 
         assert result == expected
 
+    def test_converter(self):
+        """Can reuse the same converter for each conversion, separate to the shared Citation converter."""
+        converter = Identification._converter()
+        assert converter is Identification._converter()
+        assert converter is not Citation._converter()
+
     def test_unstructure_cattrs(self):
         """Can use Cattrs to convert an Identification instance into plain types."""
         expected_date = date(2014, 6, 30)
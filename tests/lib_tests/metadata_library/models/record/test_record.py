@@ -52,7 +52,12 @@ from lantern.lib.metadata_library.models.record.presets.conformance import (
     MAGIC_DISCOVERY_V1,
     MAGIC_DISCOVERY_V2,
 )
-from lantern.lib.metadata_library.models.record.record import Record, RecordInvalidError, RecordSchema
+from lantern.lib.metadata_library.models.record.record import (
+    Record,
+    RecordInvalidError,
+    RecordSchema,
+    _copy_date_containers,
+)
 from lantern.lib.metadata_library.models.record.utils.admin import AdministrationKeys, get_admin, set_admin
 from lantern.lib.metadata_library.models.record.utils.kv import set_kv
 
@@ -96,6 +101,12 @@ class TestRecordSchema:
         assert isinstance(result, dict)
         assert result["$id"] == schema_id
 
+    def test_get_validator(self):
+        """Can get a validator for a supported schema, reused for later calls."""
+        result = RecordSchema.get_validator(RecordSchema.ISO_2_V4)
+        assert result.schema == RecordSchema.get_schema_contents(RecordSchema.ISO_2_V4)
+        assert RecordSchema.get_validator(RecordSchema.ISO_2_V4) is result
+
 
 class TestRecord:
     """Test root Record element."""
@@ -314,6 +325,11 @@ class TestRecord:
         """Can calculate a SHA1 hash of the record config."""
         assert fx_lib_record_model_min_iso.sha1 == "bb3903b2398d32766a7244c059f5a56627b6b25d"
 
+    def test_hash_config(self, fx_lib_record_model_min_iso: Record):
+        """Can calculate a SHA1 hash from an existing record config, matching the record hash."""
+        config = fx_lib_record_model_min_iso.dumps(strip_admin=False)
+        assert Record.hash_config(config) == fx_lib_record_model_min_iso.sha1
+
     @pytest.mark.parametrize("value", [{}, {"invalid": "x"}, {"hierarchy_level": HierarchyLevelCode.DIMENSION_GROUP}])
     def test_config_supported(self, fx_lib_record_config_min_iso: dict, value: dict):
         """Can determine if a record config is supported or not."""
@@ -335,6 +351,32 @@ class TestRecord:
 
         assert "Diff: Item root['invalid'] (\"x\") added to dictionary." in caplog.text
 
+    @pytest.mark.cov()
+    def test_config_supported_log_no_debug(
+        self, mocker: MockerFixture, caplog: pytest.LogCaptureFixture, fx_lib_record_config_min_iso: dict
+    ):
+        """Does not compute a diff of unsupported record config contents unless debug logging is enabled."""
+        mock_diff = mocker.patch("lantern.lib.metadata_library.models.record.record.DeepDiff")
+        fx_lib_record_config_min_iso["invalid"] = "x"
+        logger = logging.getLogger("test")
+        logger.setLevel(logging.INFO)
+
+        result = Record._config_supported(config=fx_lib_record_config_min_iso, logger=logger)
+
+        assert result is False
+        assert "contains unsupported content" in caplog.text
+        mock_diff.assert_not_called()
+
+    def test_loads_check_supported(self, mocker: MockerFixture, fx_lib_record_config_min_iso: dict):
+        """Can check if a record config is supported when loading, structuring it once without modifying it."""
+        expected = deepcopy(fx_lib_record_config_min_iso)
+        spy = mocker.spy(Record, "structure")
+
+        Record.loads(fx_lib_record_config_min_iso, check_supported=True)
+
+        assert spy.call_count == 1
+        assert fx_lib_record_config_min_iso == expected
+
     @pytest.mark.parametrize("check_supported", [False, True])
     def test_loads(self, check_supported: bool):
         """
@@ -433,10 +475,11 @@ class TestRecord:
         sinfo: str | None,
         expected: str,
     ):
-        """Can strip admin metadata from a record if present."""
+        """Can strip admin metadata from a dumped record if present, without modifying the record."""
         fx_lib_record_model_min_iso.identification.supplemental_information = sinfo
-        Record._strip_admin(fx_lib_record_model_min_iso)
-        assert fx_lib_record_model_min_iso.identification.supplemental_information == expected
+        result = fx_lib_record_model_min_iso.dumps(strip_admin=True)
+        assert result["identification"].get("supplemental_information") == expected
+        assert fx_lib_record_model_min_iso.identification.supplemental_information == sinfo
 
     fake_admin_version = DomainConsistency(
         specification=Citation(
@@ -503,10 +546,13 @@ class TestRecord:
         dq: DataQuality,
         expected: DataQuality,
     ):
-        """Can strip admin metadata conformance from a record if present."""
-        fx_lib_record_model_min_iso.data_quality = dq
-        Record._strip_admin(fx_lib_record_model_min_iso)
-        assert fx_lib_record_model_min_iso.data_quality == expected
+        """Can strip admin metadata conformance from a dumped record if present, without modifying the record."""
+        fx_lib_record_model_min_iso.data_quality = deepcopy(dq)
+        result = fx_lib_record_model_min_iso.dumps(strip_admin=True)
+        assert fx_lib_record_model_min_iso.data_quality == dq
+
+        fx_lib_record_model_min_iso.data_quality = expected
+        assert result == fx_lib_record_model_min_iso.dumps(strip_admin=False)
 
     @pytest.mark.parametrize("strip_admin", [False, True])
     def test_dumps(
@@ -612,6 +658,32 @@ class TestRecord:
         assert "<gmi:MI_Metadata" in result
         assert config == expected
 
+    def test_dumps_xml_data(self, fx_lib_record_model_min_iso: Record):
+        """Can encode record as ISO 19139 XML string from an existing dump without modifying it."""
+        data = fx_lib_record_model_min_iso.dumps()
+        expected = deepcopy(data)
+
+        result = fx_lib_record_model_min_iso.dumps_xml(data=data)
+        assert result == fx_lib_record_model_min_iso.dumps_xml()
+        assert data == expected
+
+    def test_copy_date_containers(self):
+        """Can copy only parts of a record config containing date properties."""
+        config = {
+            "metadata": {"date_stamp": "2014-06-30", "contacts": [{"x": "x"}]},
+            "identification": {"title": "x", "dates": {"creation": "2014-06-30"}, "constraints": [{"x": "x"}]},
+            "distribution": [{"x": "x"}],
+        }
+
+        result = _copy_date_containers(config)
+        assert result == config
+        assert result is not config
+        assert result["metadata"] is not config["metadata"]
+        assert result["identification"]["dates"] is not config["identification"]["dates"]
+        assert result["metadata"]["contacts"] is config["metadata"]["contacts"]
+        assert result["identification"]["constraints"] is config["identification"]["constraints"]
+        assert result["distribution"] is config["distribution"]
+
     def test_validate_min_iso(self):
         """A minimally valid ISO record can be validated."""
         record = Record(
@@ -689,6 +761,17 @@ class TestRecord:
         )
         fx_lib_record_model_min_iso.validate(use_profiles=False)
 
+    @pytest.mark.parametrize("parallel_jobs", [1, 2])
+    def test_validate_many(self, fx_lib_record_model_min_iso: Record, parallel_jobs: int):
+        """Can validate multiple records, returning errors for invalid records."""
+        invalid = deepcopy(fx_lib_record_model_min_iso)
+        invalid.data_quality = DataQuality(domain_consistency=DomainConsistencies([MAGIC_DISCOVERY_V2]))
+
+        results = Record.validate_many([fx_lib_record_model_min_iso, invalid], parallel_jobs=parallel_jobs)
+        assert results[0] is None
+        assert isinstance(results[1], RecordInvalidError)
+        assert Record.validate_many([invalid], use_profiles=False, parallel_jobs=parallel_jobs) == [None]
+
     @pytest.mark.parametrize(
         ("run", "values"),
         [